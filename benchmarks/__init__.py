@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+"""
+Performance benchmarks for the white-box code examples.
+"""
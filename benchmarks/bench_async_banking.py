@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of AsyncBankingSystem requests per second against the
+synchronous BankingSystem, with 1k, 10k and 100k concurrent clients each
+sending one transfer.
+
+Run with ``python -m benchmarks.bench_async_banking``.
+"""
+import asyncio
+import io
+import time
+from contextlib import redirect_stdout
+
+from src.async_banking import AsyncBankingSystem
+from src.white_box import BankingSystem
+
+
+def _clients(count):
+    """
+    Client names, all logged in on the banking systems built for them.
+    """
+    return [f"client{i}" for i in range(count)]
+
+
+def run_sync(clients):
+    """
+    Sends one transfer per client to BankingSystem and returns the time taken.
+    """
+    bs = BankingSystem()
+    bs.logged_in_users.update(clients)
+    start = time.perf_counter()
+    for client in clients:
+        bs.transfer_money(client, "merchant", 10, "regular")
+    return time.perf_counter() - start
+
+
+async def run_async(clients):
+    """
+    Sends one concurrent transfer per client to AsyncBankingSystem and
+    returns the time taken.
+    """
+    async with AsyncBankingSystem() as bank:
+        bank.banking.logged_in_users.update(clients)
+
+        async def client_request(client):
+            return await bank.transfer_money(client, "merchant", 10, "regular")
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*map(client_request, clients))
+        elapsed = time.perf_counter() - start
+    if not all(results):
+        raise AssertionError("Some transfers failed")
+    return elapsed
+
+
+def main(sizes=(1000, 10000, 100000)):
+    """
+    Prints the requests per second of both versions for each client count.
+    """
+    print(f"{'clients':>8} {'sync req/s':>14} {'async req/s':>14}")
+    for size in sizes:
+        clients = _clients(size)
+        with redirect_stdout(io.StringIO()):
+            sync_elapsed = run_sync(clients)
+            async_elapsed = asyncio.run(run_async(clients))
+        print(f"{size:>8} {size / sync_elapsed:>14,.0f} {size / async_elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stress benchmark of concurrent BankingSystem transfers.
+
+N threads each run M random transfers between a pool of users, then the
+benchmark checks that account balances plus collected fees still add up to
+the money the accounts were opened with.
+
+Run with ``python -m benchmarks.bench_banking [threads] [transfers]``.
+"""
+import io
+import math
+import random
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+
+from src.white_box import BankingSystem
+
+TRANSACTION_TYPES = ("regular", "express", "scheduled")
+
+
+def stress(threads, transfers, users=1000, seed=0):
+    """
+    Runs the transfers and returns the banking system and the elapsed time.
+    """
+    bs = BankingSystem()
+    names = [f"user{i}" for i in range(users)]
+    bs.logged_in_users.update(names)
+
+    def worker(worker_seed):
+        rng = random.Random(worker_seed)
+        for _ in range(transfers):
+            sender, receiver = rng.sample(names, 2)
+            bs.transfer_money(
+                sender, receiver, rng.randint(1, 50), rng.choice(TRANSACTION_TYPES)
+            )
+
+    pool = [threading.Thread(target=worker, args=(seed + i,)) for i in range(threads)]
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+    return bs, time.perf_counter() - start
+
+
+def main(threads=8, transfers=20000):
+    """
+    Runs the stress test and prints the transfer throughput.
+    """
+    bs, elapsed = stress(threads, transfers)
+    opened = len(bs.accounts) * bs.initial_balance
+    held = sum(account.balance for account in bs.accounts.values())
+    if not math.isclose(held + bs.fees_collected, opened):
+        raise AssertionError(f"Balances not conserved: {held} + fees != {opened}")
+    print(f"{threads} threads x {transfers} transfers: balances conserved")
+    print(f"{threads * transfers / elapsed:,.0f} transfers/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+Scaling benchmark of the bulk validator over worker counts.
+
+Run with ``python -m benchmarks.bench_bulk_validate [rows]``.
+"""
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+from src.bulk_validate import bulk_validate, parse_check
+
+CHECKS = [
+    parse_check("email:email"),
+    parse_check("credit_card:card"),
+    parse_check("url:url"),
+    parse_check("date:year,month,day"),
+    parse_check("login:user,password"),
+]
+
+
+def write_dump(path, rows, seed=0):
+    """
+    Writes a CSV customer dump with rows random records.
+    """
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("email,card,url,year,month,day,user,password\n")
+        for _ in range(rows):
+            name = "".join(rng.choices(letters, k=rng.randint(3, 12)))
+            file.write(
+                f"{name}@example.com,{rng.randrange(10**15, 10**16)},"
+                f"https://{name}.org,{rng.randint(1890, 2110)},"
+                f"{rng.randint(1, 12)},{rng.randint(1, 31)},{name},{name}pass\n"
+            )
+
+
+def main(rows=500000):
+    """
+    Prints the rows per second for 1, 2, 4 and all available workers.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dump.csv")
+        write_dump(path, rows)
+        workers = sorted({1, 2, 4, os.cpu_count() or 1})
+        for count in workers:
+            with open(path, encoding="utf-8", newline="") as source, open(
+                os.devnull, "w", encoding="utf-8"
+            ) as target:
+                start = time.perf_counter()
+                bulk_validate(source, target, "csv", CHECKS, workers=count)
+                elapsed = time.perf_counter() - start
+            print(f"{count:>3} workers {rows / elapsed:>14,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the cached white-box variants against the plain functions on
+workloads with repeated arguments.
+
+Run with ``python -m benchmarks.bench_cache``.
+"""
+import random
+import timeit
+
+from src import cache
+from src.white_box import (
+    calculate_shipping_cost,
+    categorize_product,
+    check_loan_eligibility,
+    get_weather_advisory,
+)
+
+CASES = [
+    (
+        check_loan_eligibility,
+        cache.cached_check_loan_eligibility,
+        lambda rng: (rng.randrange(20000, 100000, 5000), rng.randrange(500, 850, 25)),
+    ),
+    (
+        get_weather_advisory,
+        cache.cached_get_weather_advisory,
+        lambda rng: (rng.randint(-10, 40), rng.randrange(0, 101, 5)),
+    ),
+    (
+        categorize_product,
+        cache.cached_categorize_product,
+        lambda rng: (rng.choice([9.99, 19.99, 49.99, 99.99, 149.99, 249.99]),),
+    ),
+    (
+        calculate_shipping_cost,
+        cache.cached_calculate_shipping_cost,
+        lambda rng: rng.choice([(1, 10, 10, 10), (3, 20, 20, 20), (8, 40, 30, 30)]),
+    ),
+]
+
+
+def main(calls=200000):
+    """
+    Prints the calls per second with and without caching and the hit rate.
+    """
+    rng = random.Random(0)
+    for plain, cached, make_args in CASES:
+        arguments = [make_args(rng) for _ in range(calls)]
+        cached.cache_clear()
+        rates = [
+            calls
+            / min(
+                timeit.repeat(
+                    lambda f=func, batch=arguments: [f(*a) for a in batch], number=1
+                )
+            )
+            for func in (plain, cached)
+        ]
+        info = cached.cache_info()
+        hit_rate = info.hits / (info.hits + info.misses)
+        print(
+            f"{plain.__name__:<26} plain {rates[0]:>12,.0f}/s"
+            f"  cached {rates[1]:>12,.0f}/s  hit rate {hit_rate:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
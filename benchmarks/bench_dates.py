@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of validate_dates, loose and strict, against validate_date called
+in a Python loop and against copying the three columns, which bounds what
+memory bandwidth allows.
+
+Run with ``python -m benchmarks.bench_dates``.
+"""
+import functools
+import timeit
+
+import numpy as np
+
+from src.vectorized import validate_dates
+from src.white_box import validate_date
+
+
+def copy_columns(*columns):
+    """
+    Copies every column.
+    """
+    return tuple(column.copy() for column in columns)
+
+
+def main(size=20000000, loop_size=1000000):
+    """
+    Prints the rows per second of every mode for int32 and int64 columns.
+    """
+    rng = np.random.default_rng(0)
+    columns = (
+        rng.integers(1890, 2110, size),
+        rng.integers(0, 14, size),
+        rng.integers(0, 33, size),
+    )
+    rows = list(zip(*(column[:loop_size].tolist() for column in columns)))
+    best = min(
+        timeit.repeat(lambda: [validate_date(*row) for row in rows], number=1, repeat=3)
+    )
+    print(f"{'validate_date loop':<28} {loop_size / best:>16,.0f} rows/s")
+
+    for dtype in (np.int32, np.int64):
+        typed = tuple(column.astype(dtype) for column in columns)
+        cases = {
+            "copy": functools.partial(copy_columns, *typed),
+            "validate_dates": functools.partial(validate_dates, *typed),
+            "validate_dates strict": functools.partial(
+                validate_dates, *typed, strict=True
+            ),
+        }
+        for name, func in cases.items():
+            best = min(timeit.repeat(func, number=1, repeat=3))
+            label = f"{name} {np.dtype(dtype).name}"
+            print(f"{label:<28} {size / best:>16,.0f} rows/s")
+
+        head = (column[:loop_size] for column in typed)
+        strict = validate_dates(*head, strict=True)
+        expected = [validate_date(*row, strict=True) == "Valid Date" for row in rows]
+        if strict.tolist() != expected:
+            raise AssertionError("validate_dates differs from validate_date")
+
+
+if __name__ == "__main__":
+    main()
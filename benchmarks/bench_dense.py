@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the dense lookup tables against the white-box functions, on
+arguments drawn from realistic distributions, for single calls and arrays.
+
+Run with ``python -m benchmarks.bench_dense``.
+"""
+import functools
+import timeit
+
+import numpy as np
+
+from src import dense, white_box
+
+
+def workloads(rng, size):
+    """
+    Argument columns of every function: exam scores around 75, quiz answer
+    counts out of 10 questions, adult-heavy ages and mostly small order
+    quantities with a long tail.
+    """
+    scores = np.clip(rng.normal(75, 12, size).round(), 0, 100).astype(np.int64)
+    correct = rng.binomial(10, 0.7, size)
+    ages = np.clip(rng.gamma(6, 7, size).round(), 0, 110).astype(np.int64)
+    return [
+        ("get_grade", [scores]),
+        ("grade_quiz", [correct, 10 - correct]),
+        ("verify_age", [ages]),
+        ("calculate_quantity_discount", [rng.geometric(0.15, size)]),
+        ("check_flight_eligibility", [ages, rng.random(size) < 0.2]),
+    ]
+
+
+def call_rows(func, rows):
+    """
+    Calls func with every row of arguments.
+    """
+    return [func(*row) for row in rows]
+
+
+def main(size=200000):
+    """
+    Prints the calls per second of every function and its dense table, one
+    call at a time and on whole arrays.
+    """
+    rng = np.random.default_rng(0)
+    for name, columns in workloads(rng, size):
+        func = getattr(white_box, name)
+        table = getattr(dense, f"dense_{name}")
+        table.build()
+        rows = list(zip(*(column.tolist() for column in columns)))
+        cases = {
+            "function": functools.partial(call_rows, func, rows),
+            "dense": functools.partial(call_rows, table, rows),
+            "dense.lookup_array": functools.partial(table.lookup_array, *columns),
+        }
+        rates = {
+            case: size / min(timeit.repeat(run, number=1, repeat=3))
+            for case, run in cases.items()
+        }
+        print(
+            f"{name:<28}"
+            + "".join(f" {case} {rate:>12,.0f}/s" for case, rate in rates.items())
+        )
+        if table.lookup_array(*columns).tolist() != call_rows(func, rows):
+            raise AssertionError(f"Dense table differs from {name}")
+
+
+if __name__ == "__main__":
+    main()
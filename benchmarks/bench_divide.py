@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of divide_arrays against divide called in a Python loop.
+
+Run with ``python -m benchmarks.bench_divide``.
+"""
+import timeit
+
+import numpy as np
+
+from src.vectorized import divide_arrays
+from src.white_box import divide
+
+
+def main(size=1000000):
+    """
+    Prints the quotients per second of the loop, of divide_arrays, and of
+    divide_arrays reusing its output buffer.
+    """
+    rng = np.random.default_rng(0)
+    a = rng.normal(0, 100, size)
+    b = rng.integers(-3, 4, size).astype(np.float64)
+    a_list, b_list = a.tolist(), b.tolist()
+    out = np.empty(size)
+
+    cases = {
+        "divide loop": lambda: [divide(x, y) for x, y in zip(a_list, b_list)],
+        "divide_arrays": lambda: divide_arrays(a, b),
+        "divide_arrays(out=)": lambda: divide_arrays(a, b, out),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:<20} {size / best:>16,.0f} quotients/s")
+
+
+if __name__ == "__main__":
+    main()
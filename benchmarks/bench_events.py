@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of BankingSystem.transfer_money with each event sink.
+
+Run with ``python -m benchmarks.bench_events > /dev/null`` to time the
+stdout sinks against a real file descriptor; results go to stderr.
+"""
+import os
+import sys
+import time
+
+from src import events
+from src.white_box import BankingSystem
+
+
+def run(sink, transfers):
+    """
+    Runs the transfers reporting to sink and returns transfers per second.
+    """
+    bs = BankingSystem(sink=sink)
+    bs.logged_in_users.add("user123")
+    bs.initial_balance = float("inf")
+    start = time.perf_counter()
+    for _ in range(transfers):
+        bs.transfer_money("user123", "receiver", 1, "regular")
+    if isinstance(sink, events.BatchingSink):
+        sink.close()
+    return transfers / (time.perf_counter() - start)
+
+
+def main(transfers=200000):
+    """
+    Prints the transfer throughput of every sink.
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        sinks = {
+            "StdoutSink": events.StdoutSink(),
+            "BatchingSink": events.BatchingSink(),
+            "BatchingSink (devnull)": events.BatchingSink(devnull),
+            "RingBufferSink": events.RingBufferSink(),
+            "NullSink": events.NullSink(),
+        }
+        for name, sink in sinks.items():
+            rate = run(sink, transfers)
+            print(f"{name:<24} {rate:>12,.0f} transfers/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
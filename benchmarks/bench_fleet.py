@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of MachineFleet steps against looping over machine objects.
+
+Run with ``python -m benchmarks.bench_fleet``.
+"""
+import time
+
+import numpy as np
+
+from src.fleet import MachineFleet
+from src.white_box import ElevatorSystem, TrafficLight
+
+
+def _report(name, machines, func, repeat=3):
+    """
+    Prints the best machine transitions per second of func over repeat runs.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<24} {machines / best:>16,.0f} transitions/s")
+
+
+def main(size=10000000, objects=1000000):
+    """
+    Prints the throughput of fleets and of loops over machine objects.
+    """
+    fleet = MachineFleet(TrafficLight, size)
+    lights = [TrafficLight() for _ in range(objects)]
+    _report("TrafficLight objects", objects, lambda: [l.change_state() for l in lights])
+    _report("TrafficLight fleet", size, lambda: fleet.fire("change_state"))
+
+    rng = np.random.default_rng(0)
+    fleet = MachineFleet(ElevatorSystem, size)
+    commands = rng.integers(-1, len(fleet.events), size).astype(np.int8)
+    elevators = [ElevatorSystem() for _ in range(objects)]
+    methods = [
+        getattr(elevator, fleet.events[command])
+        for elevator, command in zip(elevators, commands[:objects].tolist())
+        if command >= 0
+    ]
+    _report("ElevatorSystem objects", len(methods), lambda: [m() for m in methods])
+    _report("ElevatorSystem fleet", size, lambda: fleet.step(commands))
+
+
+if __name__ == "__main__":
+    main()
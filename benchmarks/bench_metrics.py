@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the call instrumentation: time per call of white-box functions
+and state machine methods before enabling it, while enabled, and after
+disabling it again.
+
+Run with ``python -m benchmarks.bench_metrics``.
+"""
+import timeit
+
+from src import metrics
+from src import white_box as wb
+
+
+def _per_call(make_workload, calls):
+    """
+    Best time per call of the workload, in nanoseconds.
+    """
+    workload = make_workload()
+    return min(timeit.repeat(workload, number=1, repeat=7)) / calls * 1e9
+
+
+def main(calls=200000):
+    """
+    Prints the time per call in the three modes and checks that disabling
+    the instrumentation restores the original functions, so that it costs
+    nothing.
+    """
+    scores = [i % 101 for i in range(calls)]
+    cases = [
+        (
+            "get_grade",
+            lambda: lambda f=wb.get_grade: [f(score) for score in scores],
+        ),
+        (
+            "TrafficLight.change_state",
+            lambda: lambda f=wb.TrafficLight().change_state: [
+                f() for _ in range(calls)
+            ],
+        ),
+    ]
+    originals = [wb.get_grade, wb.TrafficLight.change_state]
+    for name, make_workload in cases:
+        before = _per_call(make_workload, calls)
+        with metrics.instrumented():
+            enabled = _per_call(make_workload, calls)
+        after = _per_call(make_workload, calls)
+        print(
+            f"{name:<26} before {before:>7.1f} ns  enabled {enabled:>7.1f} ns"
+            f"  disabled {after:>7.1f} ns"
+        )
+    if [wb.get_grade, wb.TrafficLight.change_state] != originals:
+        raise AssertionError("disable() did not restore the original functions")
+
+    stats = metrics.snapshot()
+    if stats["get_grade"].calls != 7 * calls:
+        raise AssertionError("get_grade calls were not all recorded")
+    print(f"get_grade p50 {stats['get_grade'].percentile(50) * 1e9:.0f} ns")
+    for line in metrics.to_prometheus().splitlines():
+        if line.startswith("white_box_call_duration_seconds_count"):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
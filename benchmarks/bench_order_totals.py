@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of calculate_order_totals against calculate_order_total called
+once per order.
+
+Run with ``python -m benchmarks.bench_order_totals``.
+"""
+import time
+
+import numpy as np
+
+from src.vectorized import calculate_order_totals
+from src.white_box import calculate_order_total
+
+
+def random_orders(lines, mean_lines_per_order=8, seed=0):
+    """
+    Generates order line columns and the offsets splitting them into orders.
+    """
+    rng = np.random.default_rng(seed)
+    quantities = rng.integers(1, 20, lines)
+    prices = rng.uniform(0.5, 500, lines).round(2)
+    sizes = rng.poisson(mean_lines_per_order, lines // mean_lines_per_order)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    offsets = offsets[offsets < lines]
+    return quantities, prices, np.append(offsets, lines)
+
+
+def main(lines=1000000):
+    """
+    Prints the line throughput of the scalar and columnar versions.
+    """
+    quantities, prices, offsets = random_orders(lines)
+
+    start = time.perf_counter()
+    totals = calculate_order_totals(quantities, prices, offsets)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [
+        calculate_order_total(
+            [
+                {"quantity": q, "price": p}
+                for q, p in zip(
+                    quantities[begin:end].tolist(), prices[begin:end].tolist()
+                )
+            ]
+        )
+        for begin, end in zip(offsets[:-1], offsets[1:])
+    ]
+    scalar = time.perf_counter() - start
+
+    np.testing.assert_allclose(totals, expected)
+    print(f"{lines} lines in {len(totals)} orders")
+    print(f"calculate_order_total  {lines / scalar:>14,.0f} lines/s")
+    print(f"calculate_order_totals {lines / vectorized:>14,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+Serial versus batch_map crossover benchmark.
+
+For each function, times a plain loop and batch_map over growing numbers of
+calls and reports the smallest count where the process pool wins.
+
+Run with ``python -m benchmarks.bench_parallel [workers]``.
+"""
+import os
+import random
+import sys
+import time
+
+from src.parallel import batch_map
+from src.white_box import (
+    calculate_items_shipping_cost,
+    celsius_to_fahrenheit,
+    check_flight_eligibility,
+    check_loan_eligibility,
+    get_weather_advisory,
+    grade_quiz,
+    is_triangle,
+    validate_password,
+)
+
+SIZES = (100, 1000, 10000, 100000, 1000000)
+
+FUNCTIONS = {
+    is_triangle: lambda rng: tuple(rng.uniform(0, 10) for _ in range(3)),
+    grade_quiz: lambda rng: (rng.randint(0, 10), rng.randint(0, 10)),
+    get_weather_advisory: lambda rng: (rng.uniform(-20, 45), rng.uniform(0, 100)),
+    check_flight_eligibility: lambda rng: (rng.randint(0, 90), rng.random() < 0.2),
+    celsius_to_fahrenheit: lambda rng: (rng.uniform(-150, 150),),
+    check_loan_eligibility: lambda rng: (
+        rng.randint(10000, 100000),
+        rng.randint(300, 850),
+    ),
+    validate_password: lambda rng: ("".join(rng.choices("aB3!xyz", k=12)),),
+    calculate_items_shipping_cost: lambda rng: (
+        [{"weight": rng.uniform(0, 4)} for _ in range(rng.randint(1, 10))],
+        rng.choice(["standard", "express"]),
+    ),
+}
+
+
+def _time(func, *args):
+    """
+    Seconds taken by one call of func with args.
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _serial(func, args):
+    """
+    Calls func with every tuple of args in a plain loop.
+    """
+    return [func(*a) for a in args]
+
+
+def _parallel(func, args, workers):
+    """
+    Calls func with every tuple of args through batch_map.
+    """
+    return list(batch_map(func, args, workers))
+
+
+def main(workers=None):
+    """
+    Prints serial and parallel times and the crossover point per function.
+    """
+    workers = int(workers) if workers else os.cpu_count() or 1
+    rng = random.Random(0)
+    print(f"batch_map with {workers} workers")
+    for func, make_args in FUNCTIONS.items():
+        crossover = None
+        for size in SIZES:
+            args = [make_args(rng) for _ in range(size)]
+            serial = _time(_serial, func, args)
+            parallel = _time(_parallel, func, args, workers)
+            if crossover is None and parallel < serial:
+                crossover = size
+            print(
+                f"{func.__name__:<30} {size:>8} serial {serial * 1e3:>9.1f} ms"
+                f"  parallel {parallel * 1e3:>9.1f} ms"
+            )
+        print(f"{func.__name__:<30} crossover: {crossover or 'none'}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
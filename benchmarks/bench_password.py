@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the single-scan password validator against the original
+regex-based implementation.
+
+Run with ``python -m benchmarks.bench_password``.
+"""
+import random
+import re
+import string
+import timeit
+
+from src.white_box import validate_password, validate_passwords
+
+ALPHABET = string.ascii_letters + string.digits + "!@#$%&*-_ ٣é"
+
+
+def regex_validate_password(password):
+    """
+    Original implementation, kept as the reference for results and timings.
+    """
+    if len(password) < 8:
+        return False
+
+    if (
+        not re.search(r"[A-Z]", password)
+        or not re.search(r"[a-z]", password)
+        or not re.search(r"\d", password)
+        or not re.search(r"[!@#$%&]", password)
+    ):
+        return False
+
+    return True
+
+
+def fuzzed_passwords(count, seed=0):
+    """
+    Generates a reproducible corpus of random passwords of 0 to 24 characters.
+    """
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 24)))
+        for _ in range(count)
+    ]
+
+
+def main(count=200000, repeat=5):
+    """
+    Checks both implementations agree and prints their throughput.
+    """
+    corpus = fuzzed_passwords(count)
+    expected = [regex_validate_password(password) for password in corpus]
+    if list(validate_passwords(corpus)) != expected:
+        raise AssertionError("validate_passwords differs from the regex version")
+
+    candidates = {
+        "regex validate_password": lambda: [
+            regex_validate_password(password) for password in corpus
+        ],
+        "validate_password": lambda: [validate_password(p) for p in corpus],
+        "validate_passwords": lambda: list(validate_passwords(corpus)),
+    }
+    print(f"{count} passwords, {sum(expected)} valid")
+    for name, func in candidates.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:<25} {count / best:>12,.0f} passwords/s")
+
+
+if __name__ == "__main__":
+    main()
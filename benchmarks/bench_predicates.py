@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the numeric predicate kernels against the scalar predicates
+called in a Python loop.
+
+Run with ``python -m benchmarks.bench_predicates``.
+"""
+import time
+
+import numpy as np
+
+from src import vectorized
+from src.white_box import check_file_size, check_number_status, is_even, verify_age
+
+CASES = [
+    (is_even, vectorized.are_even, lambda rng, n: rng.integers(-1000, 1000, n)),
+    (
+        check_number_status,
+        vectorized.check_number_statuses,
+        lambda rng, n: rng.normal(0, 10, n),
+    ),
+    (verify_age, vectorized.verify_ages, lambda rng, n: rng.integers(0, 100, n)),
+    (
+        check_file_size,
+        vectorized.check_file_sizes,
+        lambda rng, n: rng.integers(-10, 2**21, n),
+    ),
+]
+
+
+def main(size=1000000):
+    """
+    Prints the values per second of both versions for each predicate.
+    """
+    rng = np.random.default_rng(0)
+    for scalar, kernel, make_values in CASES:
+        values = make_values(rng, size)
+        python_values = values.tolist()
+        start = time.perf_counter()
+        for value in python_values:
+            scalar(value)
+        loop = time.perf_counter() - start
+        start = time.perf_counter()
+        kernel(values)
+        vector = time.perf_counter() - start
+        print(
+            f"{scalar.__name__:<20} loop {size / loop:>14,.0f}/s"
+            f"  kernel {size / vector:>16,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the rule tables of grade_quiz, get_weather_advisory and
+check_loan_eligibility against the scalar functions called in a loop.
+
+Run with ``python -m benchmarks.bench_rules``.
+"""
+import functools
+import timeit
+
+import numpy as np
+
+from src import vectorized, white_box
+
+# Function name, rule table and the ranges of its two inputs.
+CASES = [
+    ("grade_quiz", vectorized.QUIZ_GRADE_RULES, (0, 11), (0, 6)),
+    ("get_weather_advisory", vectorized.WEATHER_ADVISORY_RULES, (-20, 45), (0, 100)),
+    (
+        "check_loan_eligibility",
+        vectorized.LOAN_ELIGIBILITY_RULES,
+        (0, 90000),
+        (500, 850),
+    ),
+]
+
+
+def call_rows(func, rows):
+    """
+    Calls func with every row of arguments.
+    """
+    return [func(*row) for row in rows]
+
+
+def main(size=1000000):
+    """
+    Prints the rows per second of the scalar function, of RuleTable.lookup
+    and of RuleTable.codes and lookup_array on float columns.
+    """
+    rng = np.random.default_rng(0)
+    for name, table, x_range, y_range in CASES:
+        xs, ys = rng.uniform(*x_range, size), rng.uniform(*y_range, size)
+        rows = list(zip(xs.tolist(), ys.tolist()))
+        func = getattr(white_box, name)
+        cases = {
+            name: functools.partial(call_rows, func, rows),
+            "RuleTable.lookup": functools.partial(call_rows, table.lookup, rows),
+            "RuleTable.codes": functools.partial(table.codes, xs, ys),
+            "RuleTable.lookup_array": functools.partial(table.lookup_array, xs, ys),
+        }
+        for case, run in cases.items():
+            best = min(timeit.repeat(run, number=1, repeat=3))
+            print(f"{case:<24} {size / best:>16,.0f} rows/s")
+        if table.lookup_array(xs, ys).tolist() != call_rows(func, rows):
+            raise AssertionError(f"Rule table differs from {name}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
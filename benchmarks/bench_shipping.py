@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the batch shipping-cost calculators against their scalar
+versions called once per package.
+
+Run with ``python -m benchmarks.bench_shipping``.
+"""
+import time
+
+import numpy as np
+
+from src.vectorized import calculate_items_shipping_costs, calculate_shipping_costs
+from src.white_box import calculate_items_shipping_cost, calculate_shipping_cost
+
+
+def random_packages(count, seed=0):
+    """
+    Generates package weight, dimension and shipping-method columns.
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.uniform(0, 15, count).round(1)
+    dimensions = rng.integers(1, 40, (3, count))
+    methods = rng.choice(["standard", "express"], count)
+    return weights, dimensions, methods
+
+
+def _rate(count, func):
+    """
+    Runs func once and returns its result and the packages per second.
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, count / (time.perf_counter() - start)
+
+
+def main(count=1000000):
+    """
+    Checks both versions agree and prints their throughput.
+    """
+    weights, (lengths, widths, heights), methods = random_packages(count)
+    rows = list(
+        zip(
+            weights.tolist(),
+            lengths.tolist(),
+            widths.tolist(),
+            heights.tolist(),
+            methods.tolist(),
+        )
+    )
+
+    expected, scalar = _rate(
+        count,
+        lambda: [
+            calculate_items_shipping_cost([{"weight": w}], m) for w, *_, m in rows
+        ],
+    )
+    (costs, _), batch = _rate(
+        count, lambda: calculate_items_shipping_costs(weights, methods)
+    )
+    if costs.tolist() != expected:
+        raise AssertionError("calculate_items_shipping_costs differs")
+    print(f"calculate_items_shipping_cost  {scalar:>14,.0f} packages/s")
+    print(f"calculate_items_shipping_costs {batch:>14,.0f} packages/s")
+
+    expected, scalar = _rate(
+        count, lambda: [calculate_shipping_cost(*row[:4]) for row in rows]
+    )
+    costs, batch = _rate(
+        count, lambda: calculate_shipping_costs(weights, lengths, widths, heights)
+    )
+    if costs.tolist() != expected:
+        raise AssertionError("calculate_shipping_costs differs")
+    print(f"calculate_shipping_cost        {scalar:>14,.0f} packages/s")
+    print(f"calculate_shipping_costs       {batch:>14,.0f} packages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Startup benchmark: import time of src.white_box, measured with
+``python -X importtime`` in fresh interpreters, against a fixed budget.
+
+Run with ``python -m benchmarks.bench_startup``. The run fails when the
+import takes longer than IMPORT_BUDGET_MS.
+"""
+import compileall
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_BUDGET_MS = 15.0
+
+
+def import_time(module, runs=7):
+    """
+    Smallest cumulative import time of module over runs fresh interpreters,
+    in milliseconds.
+    """
+    times = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            check=True,
+            cwd=ROOT,
+            text=True,
+        )
+        # Lines read "import time: self [us] | cumulative | imported package".
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                times.append(int(fields[1]) / 1000)
+    return min(times)
+
+
+def main():
+    """
+    Prints the import time of src.white_box and of the modules it loads
+    lazily, and checks src.white_box against the budget.
+    """
+    # Deployed code has its bytecode compiled; do not measure compilation.
+    compileall.compile_dir(os.path.join(ROOT, "src"), quiet=1)
+    for module in (
+        "src.white_box",
+        "src.vectorized",
+        "src.parallel",
+        "src.async_banking",
+    ):
+        print(f"{module:<20} {import_time(module):>8.1f} ms")
+
+    elapsed = import_time("src.white_box")
+    if elapsed > IMPORT_BUDGET_MS:
+        raise AssertionError(
+            f"import src.white_box took {elapsed:.1f} ms, "
+            f"over the {IMPORT_BUDGET_MS} ms budget"
+        )
+
+
+if __name__ == "__main__":
+    main()
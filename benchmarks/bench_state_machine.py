@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the table-driven state machines against the original
+string-comparing classes: memory per instance and transitions per second.
+
+Run with ``python -m benchmarks.bench_state_machine``.
+"""
+import timeit
+import tracemalloc
+
+from src.white_box import (
+    DocumentEditingSystem,
+    ElevatorSystem,
+    TrafficLight,
+    UserAuthentication,
+    VendingMachine,
+)
+
+
+class LegacyTrafficLight:  # pylint: disable=too-few-public-methods
+    """
+    Original traffic light, storing its state name in the instance dict.
+    """
+
+    def __init__(self):
+        self.state = "Red"
+
+    def change_state(self):
+        """
+        Function that changes the traffic light state.
+        """
+        if self.state == "Red":
+            self.state = "Green"
+        elif self.state == "Green":
+            self.state = "Yellow"
+        elif self.state == "Yellow":
+            self.state = "Red"
+
+
+class LegacyElevatorSystem:
+    """
+    Original elevator system, storing its state name in the instance dict.
+    """
+
+    def __init__(self):
+        self.state = "Idle"
+
+    def move_up(self):
+        """
+        Function to move up the elevator.
+        """
+        if self.state == "Idle":
+            self.state = "Moving Up"
+            return "Elevator moving up"
+
+        return "Invalid operation in current state"
+
+    def stop(self):
+        """
+        Function to stop the elevator.
+        """
+        if self.state in ["Moving Up", "Moving Down"]:
+            self.state = "Idle"
+            return "Elevator stopped"
+
+        return "Invalid operation in current state"
+
+
+def bytes_per_instance(cls, count=100000):
+    """
+    Average memory allocated per instance when creating count instances.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [cls() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del instances
+    # Exclude the list holding the instances.
+    return (allocated - count * 8) / count
+
+
+def transitions_per_second(machine, methods, number=200000):
+    """
+    Calls the methods in turn on machine and returns the calls per second.
+    """
+    calls = [getattr(machine, name) for name in methods]
+
+    def cycle():
+        for call in calls:
+            call()
+
+    best = min(timeit.repeat(cycle, number=number, repeat=5))
+    return number * len(calls) / best
+
+
+def main():
+    """
+    Prints memory and throughput of the legacy and table-driven machines.
+    """
+    cases = [
+        (LegacyTrafficLight, ["change_state"]),
+        (TrafficLight, ["change_state"]),
+        (LegacyElevatorSystem, ["move_up", "stop"]),
+        (ElevatorSystem, ["move_up", "stop"]),
+        (VendingMachine, ["insert_coin", "select_drink"]),
+        (UserAuthentication, ["login", "logout"]),
+        (DocumentEditingSystem, ["save_document", "edit_document"]),
+    ]
+    print(f"{'class':<24} {'bytes/instance':>15} {'transitions/s':>15}")
+    for cls, methods in cases:
+        size = bytes_per_instance(cls)
+        rate = transitions_per_second(cls(), methods)
+        print(f"{cls.__name__:<24} {size:>15,.0f} {rate:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of validate_credit_cards and validate_emails against the scalar
+validators called in a Python loop, and of the Luhn checksum kernel.
+
+Run with ``python -m benchmarks.bench_string_validators``.
+"""
+import timeit
+
+import numpy as np
+
+from src.vectorized import luhn_checks, validate_credit_cards, validate_emails
+from src.white_box import validate_credit_card, validate_email
+
+
+def main(size=1000000):
+    """
+    Prints the strings per second of each validator, looped and batched,
+    over str and StringDType arrays.
+    """
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(11, 18, size)
+    cards = [
+        "".join(map(str, rng.integers(0, 10, length)))
+        for length in lengths[:1000].tolist()
+    ] * (size // 1000)
+    emails = [f"user{i}@example.com" if i % 3 else f"user{i}" for i in range(size)]
+    arrays = {
+        "str": (np.array(cards), np.array(emails)),
+        "StringDType": (
+            np.array(cards, dtype=np.dtype("T")),
+            np.array(emails, dtype=np.dtype("T")),
+        ),
+    }
+
+    cases = {
+        "validate_credit_card loop": lambda: [validate_credit_card(c) for c in cards],
+        "validate_email loop": lambda: [validate_email(e) for e in emails],
+    }
+    for kind, (card_array, email_array) in arrays.items():
+        cases[f"validate_credit_cards {kind}"] = lambda a=card_array: (
+            validate_credit_cards(a)
+        )
+        cases[f"validate_credit_cards luhn {kind}"] = lambda a=card_array: (
+            validate_credit_cards(a, luhn=True)
+        )
+        cases[f"validate_emails {kind}"] = lambda a=email_array: validate_emails(a)
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:<40} {size / best:>14,.0f} strings/s")
+
+    luhn = [all(map(str.isdigit, c)) and luhn_checks([c])[0] for c in cards[:1000]]
+    if luhn_checks(cards[:1000]).tolist() != luhn:
+        raise AssertionError("Chunked Luhn checks differ from single checks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of celsius_to_fahrenheits against celsius_to_fahrenheit called in
+a Python loop, and of the chunked .npy file conversion.
+
+Run with ``python -m benchmarks.bench_temperature``.
+"""
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from src.vectorized import celsius_to_fahrenheits, convert_celsius_file
+from src.white_box import celsius_to_fahrenheit
+
+
+def main(size=1000000):
+    """
+    Prints the readings per second of the loop, of celsius_to_fahrenheits,
+    with and without a reused output buffer, and of convert_celsius_file.
+    """
+    celsius = np.random.default_rng(0).uniform(-120, 120, size)
+    celsius_list = celsius.tolist()
+    out = np.empty(size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source, target, mask_target = (
+            os.path.join(directory, f"{name}.npy") for name in "cfm"
+        )
+        np.save(source, celsius)
+        cases = {
+            "scalar loop": lambda: [celsius_to_fahrenheit(c) for c in celsius_list],
+            "celsius_to_fahrenheits": lambda: celsius_to_fahrenheits(celsius),
+            "celsius_to_fahrenheits(out=)": lambda: celsius_to_fahrenheits(
+                celsius, out
+            ),
+            "convert_celsius_file": lambda: convert_celsius_file(
+                source, target, mask_target, chunk_size=1 << 16
+            ),
+        }
+        for name, func in cases.items():
+            best = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{name:<30} {size / best:>16,.0f} readings/s")
+
+        expected, _ = celsius_to_fahrenheits(celsius)
+        if not np.array_equal(np.load(target), expected, equal_nan=True):
+            raise AssertionError("File conversion differs from in-memory result")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the tier-table functions of src.white_box against the if
+ladders they replaced and against plain TierTable.lookup calls.
+
+Run with ``python -m benchmarks.bench_tiers``.
+"""
+import random
+import timeit
+
+from src import white_box as wb
+
+
+def ladder_get_grade(score):
+    """
+    get_grade as an if ladder.
+    """
+    if score >= 90:
+        grade = "A"
+    elif score >= 80:
+        grade = "B"
+    elif score >= 70:
+        grade = "C"
+    else:
+        grade = "F"
+    return grade
+
+
+def ladder_calculate_total_discount(total_amount):
+    """
+    calculate_total_discount as an if ladder.
+    """
+    if total_amount < 100:
+        return 0
+
+    if 100 <= total_amount <= 500:
+        return 0.1 * total_amount
+
+    return 0.2 * total_amount
+
+
+def ladder_categorize_product(price):
+    """
+    categorize_product as an if ladder.
+    """
+    if 10 <= price <= 50:
+        return "Category A"
+
+    if 51 <= price <= 100:
+        return "Category B"
+
+    if 101 <= price <= 200:
+        return "Category C"
+
+    return "Category D"
+
+
+def ladder_calculate_quantity_discount(quantity):
+    """
+    calculate_quantity_discount as an if ladder.
+    """
+    if 1 <= quantity <= 5:
+        return "No Discount"
+
+    if 6 <= quantity <= 10:
+        return "5% Discount"
+
+    return "10% Discount"
+
+
+def ladder_check_loan_eligibility(income, credit_score):
+    """
+    check_loan_eligibility as an if ladder.
+    """
+    if income < 30000:
+        return "Not Eligible"
+
+    if 30000 <= income <= 60000:
+        if credit_score > 700:
+            return "Standard Loan"
+
+        return "Secured Loan"
+
+    if credit_score > 750:
+        return "Premium Loan"
+
+    return "Standard Loan"
+
+
+def lookup_calculate_total_discount(total_amount):
+    """
+    calculate_total_discount with TierTable.lookup.
+    """
+    rate = wb.TOTAL_DISCOUNT_TIERS.lookup(total_amount)
+    if not rate:
+        return 0
+
+    return rate * total_amount
+
+
+CASES = [
+    (
+        wb.get_grade,
+        ladder_get_grade,
+        wb.GRADE_TIERS.lookup,
+        lambda rng: (rng.randint(0, 100),),
+    ),
+    (
+        wb.calculate_total_discount,
+        ladder_calculate_total_discount,
+        lookup_calculate_total_discount,
+        lambda rng: (rng.uniform(0, 1000),),
+    ),
+    (
+        wb.categorize_product,
+        ladder_categorize_product,
+        wb.PRODUCT_CATEGORY_TIERS.lookup,
+        lambda rng: (rng.randint(0, 250),),
+    ),
+    (
+        wb.calculate_quantity_discount,
+        ladder_calculate_quantity_discount,
+        wb.QUANTITY_DISCOUNT_TIERS.lookup,
+        lambda rng: (rng.randint(1, 20),),
+    ),
+    (
+        wb.check_loan_eligibility,
+        ladder_check_loan_eligibility,
+        wb.LOAN_ELIGIBILITY_TIERS.lookup,
+        lambda rng: (rng.randrange(10000, 100000, 500), rng.randint(500, 850)),
+    ),
+]
+
+
+def main(calls=200000):
+    """
+    Prints the calls per second of the if ladder, of TierTable.lookup and
+    of the white-box function, and checks they agree.
+    """
+    rng = random.Random(0)
+    for function, ladder, lookup, make_args in CASES:
+        arguments = [make_args(rng) for _ in range(calls)]
+        results = [[func(*args) for args in arguments] for func in (function, ladder)]
+        if results[0] != results[1]:
+            raise AssertionError(f"{function.__name__} differs from its if ladder")
+        rates = [
+            calls
+            / min(
+                timeit.repeat(
+                    lambda f=func, a=arguments: [f(*args) for args in a],
+                    number=1,
+                    repeat=5,
+                )
+            )
+            for func in (ladder, lookup, function)
+        ]
+        print(
+            f"{function.__name__:<28} if ladder {rates[0]:>11,.0f}/s"
+            f"  lookup {rates[1]:>11,.0f}/s  function {rates[2]:>11,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
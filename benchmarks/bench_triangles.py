@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of are_triangles against is_triangle called in a Python loop and
+against the plain NumPy expression, which allocates full-size temporaries.
+
+Run with ``python -m benchmarks.bench_triangles``.
+"""
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from src.vectorized import are_triangles
+from src.white_box import is_triangle
+
+
+def expression(sides):
+    """
+    The triangle inequalities written as one NumPy expression.
+    """
+    a, b, c = sides.T
+    return (a + b > c) & (a + c > b) & (b + c > a)
+
+
+def peak_memory(func):
+    """
+    Peak memory allocated by func, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(size=10000000, loop_size=1000000):
+    """
+    Prints the triples per second and the peak allocation of every method.
+    """
+    sides = np.random.default_rng(0).integers(1, 10, (size, 3)).astype(np.float64)
+    rows = sides[:loop_size].tolist()
+    best = min(
+        timeit.repeat(lambda: [is_triangle(*row) for row in rows], number=1, repeat=3)
+    )
+    print(f"{'is_triangle loop':<24} {loop_size / best:>14,.0f} triples/s")
+
+    out = np.empty(size, np.bool_)
+    cases = {
+        "expression": lambda: expression(sides),
+        "are_triangles": lambda: are_triangles(sides),
+        "are_triangles(out=)": lambda: are_triangles(sides, out),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        peak = peak_memory(func)
+        print(f"{name:<24} {size / best:>14,.0f} triples/s {peak:>14,} B peak")
+
+    if not np.array_equal(out, expression(sides)):
+        raise AssertionError("are_triangles differs from the expression")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of validate_url, in compatible and strict mode, against
+validate_urls and classify_url_schemes on a corpus of 10M URLs.
+
+The corpus is generated and validated a chunk at a time, so it never needs
+to be held in memory at once. Run with
+``python -m benchmarks.bench_urls``.
+"""
+import time
+
+import numpy as np
+
+from src.vectorized import classify_url_schemes, validate_urls
+from src.white_box import validate_url
+
+SCHEMES = ["http://", "https://", "ftp://", ""]
+
+
+def corpus_chunk(rng, size):
+    """
+    Generates size URLs with mixed schemes, about 1% of them over 255
+    characters long.
+    """
+    schemes = rng.choice(SCHEMES, size, p=[0.3, 0.6, 0.05, 0.05])
+    lengths = np.where(rng.random(size) < 0.01, 300, rng.integers(10, 80, size))
+    return [
+        f"{scheme}example.com/{'p' * length}"
+        for scheme, length in zip(schemes.tolist(), lengths.tolist())
+    ]
+
+
+def main(size=10000000, chunk_size=250000):
+    """
+    Prints the URLs per second of every mode, for Python lists, fixed-width
+    str arrays and StringDType arrays.
+    """
+    rng = np.random.default_rng(0)
+    cases = {
+        "validate_url loop": lambda urls, _: [validate_url(url) for url in urls],
+        "validate_url strict loop": lambda urls, _: [
+            validate_url(url, strict=True) for url in urls
+        ],
+        "validate_urls list": lambda urls, _: validate_urls(urls),
+        "validate_urls strict list": lambda urls, _: validate_urls(urls, True),
+        "classify_url_schemes list": lambda urls, _: classify_url_schemes(urls),
+    }
+    for kind in ("str", "StringDType"):
+        cases[f"validate_urls {kind}"] = lambda _, arrays, k=kind: validate_urls(
+            arrays[k]
+        )
+        cases[f"validate_urls strict {kind}"] = lambda _, arrays, k=kind: (
+            validate_urls(arrays[k], True)
+        )
+        cases[f"classify_url_schemes {kind}"] = lambda _, arrays, k=kind: (
+            classify_url_schemes(arrays[k])
+        )
+    elapsed = dict.fromkeys(cases, 0.0)
+    for start in range(0, size, chunk_size):
+        urls = corpus_chunk(rng, min(chunk_size, size - start))
+        arrays = {
+            "str": np.array(urls),
+            "StringDType": np.array(urls, dtype=np.dtype("T")),
+        }
+        for name, func in cases.items():
+            begin = time.perf_counter()
+            func(urls, arrays)
+            elapsed[name] += time.perf_counter() - begin
+
+        expected = [validate_url(url, strict=True) == "Valid URL" for url in urls]
+        if validate_urls(arrays["str"], strict=True).tolist() != expected:
+            raise AssertionError("validate_urls differs from validate_url")
+
+    for name, seconds in elapsed.items():
+        print(f"{name:<34} {size / seconds:>14,.0f} URLs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,477 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark suite covering every public function and class of src.white_box.
+
+Each case generates realistic inputs at several sizes and reports the best
+time per operation. Results are written as JSON, and the compare command
+fails when a case got slower than a stored baseline by more than a threshold:
+
+    python -m benchmarks.suite run --output baseline.json
+    python -m benchmarks.suite run --output current.json
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.2
+
+run also accepts --baseline to compare right after measuring.
+"""
+import argparse
+import json
+import platform
+import random
+import re
+import string
+import sys
+import timeit
+
+from src import events
+from src import white_box as wb
+
+SIZES = (100, 1000, 10000)
+
+
+class Case:  # pylint: disable=too-few-public-methods
+    """
+    A benchmark: builds a workload for a size and tells how many operations
+    one run of it performs.
+    """
+
+    def __init__(self, name, build, sizes=SIZES):
+        """
+        build(size, rng) returns (workload, operations), where workload is a
+        callable taking no arguments.
+        """
+        self.name = name
+        self.build = build
+        self.sizes = sizes
+
+
+def _calls(func, make_args):
+    """
+    Builder calling func once per generated argument tuple.
+    """
+
+    def build(size, rng):
+        arguments = [make_args(rng) for _ in range(size)]
+
+        def workload():
+            for args in arguments:
+                func(*args)
+
+        return workload, size
+
+    return build
+
+
+def _text(rng, low, high, alphabet=string.ascii_letters + string.digits):
+    """
+    Random text with a length between low and high.
+    """
+    return "".join(rng.choices(alphabet, k=rng.randint(low, high)))
+
+
+def _email(rng):
+    """
+    Email-like arguments, some of them missing the "@".
+    """
+    return (_text(rng, 1, 20) + rng.choice(["@", ""]) + _text(rng, 1, 12),)
+
+
+def _url(rng):
+    """
+    URL arguments with valid and invalid schemes.
+    """
+    scheme = rng.choice(["http://", "https://", "ftp://", ""])
+    return (scheme + _text(rng, 3, 30) + rng.choice([".com", ".org/path"]),)
+
+
+def _sized(func, make_input):
+    """
+    Builder calling func once on an input of the given size.
+    """
+
+    def build(size, rng):
+        value = make_input(rng, size)
+        return (lambda: func(value)), size
+
+    return build
+
+
+def _order_items(rng, size):
+    """
+    Order lines across every quantity discount tier.
+    """
+    return [
+        {"quantity": rng.randint(1, 20), "price": rng.uniform(1, 300)}
+        for _ in range(size)
+    ]
+
+
+def _items_shipping(size, rng):
+    """
+    Shipping cost of an order of size items.
+    """
+    items = [{"weight": rng.uniform(0.1, 3)} for _ in range(size)]
+    method = rng.choice(["standard", "express"])
+    return (lambda: wb.calculate_items_shipping_cost(items, method)), size
+
+
+def _passwords(rng, size):
+    """
+    Random passwords of 4 to 16 printable characters.
+    """
+    return [_text(rng, 4, 16, string.printable[:94]) for _ in range(size)]
+
+
+def _validate_passwords(size, rng):
+    """
+    Batch validation of size passwords.
+    """
+    passwords = _passwords(rng, size)
+    return (lambda: list(wb.validate_passwords(passwords))), size
+
+
+def _machine(cls, methods):
+    """
+    Builder calling the machine methods in turn, size times.
+    """
+
+    def build(size, _rng):
+        machine = cls()
+        calls = [getattr(machine, name) for name in methods] * size
+
+        def workload():
+            for call in calls:
+                call()
+
+        return workload, len(calls)
+
+    return build
+
+
+def _products(rng, size):
+    """
+    Distinct products with random prices.
+    """
+    return [wb.Product(f"SKU-{i}", round(rng.uniform(1, 500), 2)) for i in range(size)]
+
+
+def _cart_add(size, rng):
+    """
+    Filling a cart with size products, then adding each one again.
+    """
+    products = _products(rng, size)
+
+    def workload():
+        cart = wb.ShoppingCart()
+        for product in products:
+            cart.add_product(product, 2)
+        for product in products:
+            cart.add_product(product)
+
+    return workload, 2 * size
+
+
+def _cart_remove(size, rng):
+    """
+    Filling a cart, then removing each product in two steps.
+    """
+    products = _products(rng, size)
+
+    def workload():
+        cart = wb.ShoppingCart()
+        for product in products:
+            cart.add_product(product, 2)
+        for product in products:
+            cart.remove_product(product)
+        for product in products:
+            cart.remove_product(product, 5)
+
+    return workload, 3 * size
+
+
+def _cart_view(size, rng):
+    """
+    Viewing and checking out a cart of size products.
+    """
+    cart = wb.ShoppingCart()
+    for product in _products(rng, size):
+        cart.add_product(product, rng.randint(1, 5))
+
+    def workload():
+        cart.view_cart()
+        cart.checkout()
+
+    return workload, size
+
+
+def _banking(size, rng):
+    """
+    Logging in 100 users and running size transfers between them.
+    """
+    names = [f"user{i}" for i in range(100)]
+
+    def workload():
+        bs = wb.BankingSystem()
+        bs.users.update((name, "secret") for name in names)
+        for name in names:
+            bs.authenticate(name, "secret")
+        for _ in range(size):
+            sender, receiver = rng.sample(names, 2)
+            bs.transfer_money(sender, receiver, 5, "regular")
+
+    return workload, size
+
+
+def _view(cls, make_args):
+    """
+    Builder calling the view method of size objects of cls.
+    """
+
+    def build(size, rng):
+        objects = [cls(*make_args(rng, i)) for i in range(size)]
+        view = "view_account" if cls is wb.BankAccount else "view_product"
+
+        def workload():
+            for obj in objects:
+                getattr(obj, view)()
+
+        return workload, size
+
+    return build
+
+
+def _number(low, high):
+    """
+    Argument maker drawing one number between low and high.
+    """
+    return lambda rng: (rng.uniform(low, high),)
+
+
+CASES = [
+    Case("is_even", _calls(wb.is_even, lambda rng: (rng.randint(-1000, 1000),))),
+    Case("divide", _calls(wb.divide, lambda rng: (rng.random(), rng.randint(0, 3)))),
+    Case("get_grade", _calls(wb.get_grade, lambda rng: (rng.randint(0, 100),))),
+    Case(
+        "is_triangle",
+        _calls(wb.is_triangle, lambda rng: tuple(rng.uniform(0, 10) for _ in "abc")),
+    ),
+    Case("check_number_status", _calls(wb.check_number_status, _number(-10, 10))),
+    Case(
+        "validate_password",
+        _calls(wb.validate_password, lambda rng: tuple(_passwords(rng, 1))),
+    ),
+    Case("validate_passwords", _validate_passwords),
+    Case(
+        "calculate_total_discount",
+        _calls(wb.calculate_total_discount, _number(0, 1000)),
+    ),
+    Case("calculate_order_total", _sized(wb.calculate_order_total, _order_items)),
+    Case("calculate_items_shipping_cost", _items_shipping),
+    Case(
+        "validate_login",
+        _calls(wb.validate_login, lambda rng: (_text(rng, 1, 25), _text(rng, 1, 20))),
+    ),
+    Case("verify_age", _calls(wb.verify_age, lambda rng: (rng.randint(0, 100),))),
+    Case("categorize_product", _calls(wb.categorize_product, _number(0, 300))),
+    Case("validate_email", _calls(wb.validate_email, _email)),
+    Case("celsius_to_fahrenheit", _calls(wb.celsius_to_fahrenheit, _number(-150, 150))),
+    Case(
+        "validate_credit_card",
+        _calls(
+            wb.validate_credit_card,
+            lambda rng: (_text(rng, 10, 18, string.digits + " "),),
+        ),
+    ),
+    Case(
+        "validate_date",
+        _calls(
+            wb.validate_date,
+            lambda rng: (
+                rng.randint(1850, 2150),
+                rng.randint(0, 13),
+                rng.randint(0, 32),
+            ),
+        ),
+    ),
+    Case(
+        "check_flight_eligibility",
+        _calls(
+            wb.check_flight_eligibility,
+            lambda rng: (rng.randint(0, 100), rng.random() < 0.2),
+        ),
+    ),
+    Case("validate_url", _calls(wb.validate_url, _url)),
+    Case(
+        "calculate_quantity_discount",
+        _calls(wb.calculate_quantity_discount, lambda rng: (rng.randint(1, 20),)),
+    ),
+    Case(
+        "check_file_size",
+        _calls(wb.check_file_size, lambda rng: (rng.randint(-10, 2**21),)),
+    ),
+    Case(
+        "check_loan_eligibility",
+        _calls(
+            wb.check_loan_eligibility,
+            lambda rng: (rng.randint(10000, 100000), rng.randint(300, 850)),
+        ),
+    ),
+    Case(
+        "calculate_shipping_cost",
+        _calls(
+            wb.calculate_shipping_cost,
+            lambda rng: (rng.uniform(0, 8), *(rng.randint(1, 40) for _ in "lwh")),
+        ),
+    ),
+    Case(
+        "grade_quiz",
+        _calls(wb.grade_quiz, lambda rng: (rng.randint(0, 10), rng.randint(0, 10))),
+    ),
+    Case(
+        "authenticate_user",
+        _calls(
+            wb.authenticate_user,
+            lambda rng: rng.choice(
+                [("admin", "admin123"), (_text(rng, 1, 10), _text(rng, 1, 12))]
+            ),
+        ),
+    ),
+    Case(
+        "get_weather_advisory",
+        _calls(
+            wb.get_weather_advisory,
+            lambda rng: (rng.uniform(-20, 45), rng.uniform(0, 100)),
+        ),
+    ),
+    Case(
+        "VendingMachine",
+        _machine(wb.VendingMachine, ["insert_coin", "select_drink"]),
+    ),
+    Case(
+        "TrafficLight",
+        _machine(wb.TrafficLight, ["change_state", "get_current_state"]),
+    ),
+    Case("UserAuthentication", _machine(wb.UserAuthentication, ["login", "logout"])),
+    Case(
+        "DocumentEditingSystem",
+        _machine(wb.DocumentEditingSystem, ["save_document", "edit_document"]),
+    ),
+    Case("ElevatorSystem", _machine(wb.ElevatorSystem, ["move_up", "stop", "stop"])),
+    Case(
+        "BankAccount",
+        _view(wb.BankAccount, lambda rng, i: (f"ACC-{i}", rng.randint(0, 10**6))),
+    ),
+    Case("BankingSystem", _banking),
+    Case("Product", _view(wb.Product, lambda rng, i: (f"SKU-{i}", rng.random()))),
+    Case("ShoppingCart.add_product", _cart_add),
+    Case("ShoppingCart.remove_product", _cart_remove),
+    Case("ShoppingCart.view_cart+checkout", _cart_view),
+]
+
+
+def measure(case, size, repeat=5, min_time=0.02, seed=0):
+    """
+    Returns the best and mean time per operation of a case, in nanoseconds.
+    Each of the repeat timings loops the workload for at least min_time
+    seconds.
+    """
+    workload, operations = case.build(size, random.Random(seed))
+    timer = timeit.Timer(workload)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    times = [t / number / operations * 1e9 for t in timer.repeat(repeat, number)]
+    return {"best_ns": min(times), "mean_ns": sum(times) / len(times)}
+
+
+def run(pattern=None, repeat=5, min_time=0.02):
+    """
+    Measures the cases whose name matches pattern, all by default.
+    """
+    results = {}
+    previous = events.set_default_sink(events.NullSink())
+    try:
+        for case in CASES:
+            if pattern and not re.search(pattern, case.name):
+                continue
+            for size in case.sizes:
+                key = f"{case.name}[{size}]"
+                results[key] = measure(case, size, repeat, min_time)
+                print(f"{key:<45} {results[key]['best_ns']:>12,.1f} ns/op")
+    finally:
+        events.set_default_sink(previous)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """
+    Returns the (name, baseline ns, current ns) of the benchmarks that got
+    slower than the baseline by more than threshold, a fraction.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before and result["best_ns"] > before["best_ns"] * (1 + threshold):
+            regressions.append((name, before["best_ns"], result["best_ns"]))
+    return regressions
+
+
+def _report_regressions(regressions, threshold):
+    """
+    Prints the regressions and returns the process exit code.
+    """
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: {before:,.1f} -> {after:,.1f} ns/op")
+    if regressions:
+        print(f"{len(regressions)} benchmarks slower by more than {threshold:.0%}")
+        return 1
+    print(f"No benchmark slower by more than {threshold:.0%}")
+    return 0
+
+
+def _load(path):
+    """
+    Reads a JSON results file.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", help="JSON file to write the results to")
+    run_parser.add_argument("--filter", help="regex selecting the cases to run")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.02)
+    run_parser.add_argument("--baseline", help="JSON results to compare against")
+    run_parser.add_argument("--threshold", type=float, default=0.2)
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        current = _load(args.current)
+    else:
+        current = run(args.filter, args.repeat, args.min_time)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(current, file, indent=2, sort_keys=True)
+        if not args.baseline:
+            return 0
+
+    regressions = compare(_load(args.baseline), current, args.threshold)
+    return _report_regressions(regressions, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio front-end for the banking system.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from .white_box import BankingSystem
+
+
+class AsyncBankingSystem:
+    """
+    Asynchronous banking system.
+
+    The blocking BankingSystem calls run on a single worker thread so they
+    never stall the event loop. Transfers are queued and applied in
+    micro-batches, one executor hop per batch instead of one per transfer,
+    in the order they were submitted.
+    """
+
+    def __init__(self, banking=None, max_batch=512):
+        """
+        Wraps banking, a new BankingSystem by default.
+        """
+        self.banking = BankingSystem() if banking is None else banking
+        self.max_batch = max_batch
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._queue = None
+        self._worker = None
+        self._closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def authenticate(self, username, password):
+        """
+        User authentication function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.banking.authenticate, username, password
+        )
+
+    def submit_transfer(self, sender, receiver, amount, transaction_type):
+        """
+        Queues a money transfer and returns a future with its result. Raises
+        RuntimeError once the system is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit transfers after close()")
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((future, (sender, receiver, amount, transaction_type)))
+        return future
+
+    async def transfer_money(self, sender, receiver, amount, transaction_type):
+        """
+        Function to perform a money transfer.
+        """
+        return await self.submit_transfer(sender, receiver, amount, transaction_type)
+
+    async def close(self):
+        """
+        Waits for the queued transfers and stops the worker.
+        """
+        self._closed = True
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            self._worker = None
+        self._executor.shutdown(wait=True)
+
+    async def _run(self):
+        """
+        Takes the queued transfers in batches and applies them.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                outcomes = await loop.run_in_executor(
+                    self._executor, self._apply, [args for _, args in batch]
+                )
+            except asyncio.CancelledError:
+                self._fail(batch, None)
+                raise
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self._fail(batch, error)
+                continue
+            for (future, _), (result, error) in zip(batch, outcomes):
+                if not future.done():
+                    if error is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(error)
+                self._queue.task_done()
+
+    def _fail(self, batch, error):
+        """
+        Fails the futures of batch and of every queued transfer with error,
+        or cancels them when error is None, so none is left waiting.
+        """
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        for future, _ in batch:
+            if not future.done():
+                if error is None:
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+            self._queue.task_done()
+
+    def _apply(self, transfers):
+        """
+        Runs a batch of transfers, returning a (result, exception) pair for
+        each one.
+        """
+        outcomes = []
+        for args in transfers:
+            try:
+                outcomes.append((self.banking.transfer_money(*args), None))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                outcomes.append((None, error))
+        return outcomes
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk validation of CSV or JSONL files with the white-box validators.
+
+Records are read, validated and written one chunk at a time, so memory stays
+bounded however large the input is. With --workers the chunks are validated
+by a process pool, at most a few chunks ahead of the writer, and written in
+input order.
+
+    python -m src.bulk_validate customers.csv --output results.csv \\
+        --check email:email --check card=credit_card:card_number \\
+        --check date:year,month,day --workers 4
+
+Each --check is [NAME=]VALIDATOR:COLUMN[,COLUMN...]. The validator result
+is added to every record under NAME, which defaults to VALIDATOR_COLUMN.
+
+JSONL lines that are not JSON objects do not stop the run: each is written
+as an object with the line under INVALID_FIELD and the reason under
+ERROR_FIELD, and their number is reported at the end.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import sys
+
+from .parallel import chunked, ordered_map
+from .white_box import (
+    validate_credit_card,
+    validate_date,
+    validate_email,
+    validate_login,
+    validate_url,
+)
+
+# Validator name: (function, argument type, result for unusable values).
+VALIDATORS = {
+    "email": (validate_email, str, "Invalid Email"),
+    "credit_card": (validate_credit_card, str, "Invalid Card"),
+    "url": (validate_url, str, "Invalid URL"),
+    "date": (validate_date, int, "Invalid Date"),
+    "login": (validate_login, str, "Login Failed"),
+}
+
+# Fields of the records written for invalid JSONL lines.
+INVALID_FIELD = "invalid_record"
+ERROR_FIELD = "error"
+
+
+def parse_check(spec):
+    """
+    Parses a [NAME=]VALIDATOR:COLUMN[,COLUMN...] check into
+    (name, validator, columns).
+    """
+    head, _, columns = spec.partition(":")
+    name, _, validator = head.rpartition("=")
+    if validator not in VALIDATORS or not columns:
+        raise ValueError(f"Invalid check: {spec!r}")
+    columns = tuple(columns.split(","))
+    return name or f"{validator}_{'_'.join(columns)}", validator, columns
+
+
+def validate_values(validator, values):
+    """
+    Applies a validator to raw field values. Missing values or values of the
+    wrong type give the validator failure result.
+    """
+    func, convert, invalid = VALIDATORS[validator]
+    if None in values:
+        return invalid
+    try:
+        return func(*(convert(value) for value in values))
+    except (TypeError, ValueError):
+        return invalid
+
+
+def process_csv_chunk(header, checks, rows):
+    """
+    Validates CSV rows and returns them as CSV text with the results added.
+    """
+    indexes = [
+        (validator, [header.index(column) for column in columns])
+        for _, validator, columns in checks
+    ]
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    for row in rows:
+        results = [
+            validate_values(
+                validator, [row[i] if i < len(row) else None for i in columns]
+            )
+            for validator, columns in indexes
+        ]
+        writer.writerow(row + results)
+    return output.getvalue()
+
+
+def process_jsonl_chunk(checks, lines):
+    """
+    Validates JSONL lines and returns them as JSONL text with the results
+    added, and the number of lines that are not JSON objects.
+    """
+    output = []
+    invalid = 0
+    for line in lines:
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"Expected an object, got {type(record).__name__}")
+        except ValueError as error:  # json.JSONDecodeError included.
+            invalid += 1
+            record = {INVALID_FIELD: line.rstrip("\r\n"), ERROR_FIELD: str(error)}
+            output.append(json.dumps(record) + "\n")
+            continue
+        for name, validator, columns in checks:
+            record[name] = validate_values(
+                validator, [record.get(column) for column in columns]
+            )
+        output.append(json.dumps(record) + "\n")
+    return "".join(output), invalid
+
+
+class _Task:  # pylint: disable=too-few-public-methods
+    """
+    Picklable chunk processor bound to the file header and checks.
+    """
+
+    def __init__(self, file_format, header, checks):
+        self.file_format = file_format
+        self.header = header
+        self.checks = checks
+
+    def __call__(self, chunk):
+        """
+        Returns the output text of chunk and its number of invalid records.
+        """
+        if self.file_format == "csv":
+            return process_csv_chunk(self.header, self.checks, chunk), 0
+        return process_jsonl_chunk(self.checks, chunk)
+
+
+# pylint: disable-next=too-many-arguments
+def bulk_validate(source, target, file_format, checks, chunk_size=10000, workers=1):
+    """
+    Validates the records read from source and writes them, with the check
+    results, to target. source and target are text files. Returns the number
+    of invalid JSONL lines.
+    """
+    if file_format == "csv":
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        missing = {c for _, _, columns in checks for c in columns} - set(header)
+        if missing:
+            raise ValueError(f"Unknown columns: {sorted(missing)}")
+        csv.writer(target, lineterminator="\n").writerow(
+            header + [name for name, _, _ in checks]
+        )
+        records = reader
+    else:
+        header = None
+        records = (line for line in source if line.strip())
+
+    task = _Task(file_format, header, checks)
+    invalid = 0
+    for text, chunk_invalid in ordered_map(task, chunked(records, chunk_size), workers):
+        target.write(text)
+        invalid += chunk_invalid
+    return invalid
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="CSV or JSONL file, - for stdin")
+    parser.add_argument("--output", default="-", help="output file, - for stdout")
+    parser.add_argument("--format", choices=["csv", "jsonl"])
+    parser.add_argument(
+        "--check",
+        action="append",
+        required=True,
+        help="[NAME=]VALIDATOR:COLUMN[,COLUMN...] with VALIDATOR one of "
+        + ", ".join(VALIDATORS),
+    )
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    try:
+        checks = [parse_check(spec) for spec in args.check]
+    except ValueError as error:
+        parser.error(str(error))
+    file_format = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+
+    with contextlib.ExitStack() as stack:
+        source = sys.stdin
+        if args.input != "-":
+            source = stack.enter_context(open(args.input, encoding="utf-8", newline=""))
+        target = sys.stdout
+        if args.output != "-":
+            target = stack.enter_context(
+                open(args.output, "w", encoding="utf-8", newline="")
+            )
+        try:
+            invalid = bulk_validate(
+                source, target, file_format, checks, args.chunk_size, args.workers
+            )
+        except ValueError as error:
+            parser.error(str(error))
+    if invalid:
+        print(f"{invalid} invalid JSONL lines, see {INVALID_FIELD}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in memoization for pure white-box functions.
+
+memoize() keeps the results of the most recent distinct calls, optionally
+for a limited time, and counts hits, misses, evictions and expirations so
+the benefit of caching a given function can be measured.
+"""
+import collections
+import functools
+import threading
+import time
+
+from .white_box import (
+    calculate_shipping_cost,
+    categorize_product,
+    check_loan_eligibility,
+    get_weather_advisory,
+)
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "expirations", "maxsize", "currsize"]
+)
+
+_MISSING = object()
+# Separates positional from keyword arguments in cache keys, as kwd_mark does
+# in functools, so keyword arguments never match a positional tuple.
+_KWARGS_MARK = object()
+
+
+def memoize(maxsize=1024, ttl=None, clock=time.monotonic):
+    """
+    Decorator caching up to maxsize results, least recently used first out.
+    With ttl, results older than ttl seconds (measured with clock) are
+    recomputed. Arguments must be hashable.
+
+    The wrapper has cache_info() and cache_clear() methods, like
+    functools.lru_cache.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+
+    def decorator(func):
+        entries = collections.OrderedDict()
+        hits = misses = evictions = expirations = 0
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal hits, misses, evictions, expirations
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK, *sorted(kwargs.items()))
+            with lock:
+                entry = entries.get(key, _MISSING)
+                if entry is not _MISSING:
+                    value, expires = entry
+                    if expires is None or clock() < expires:
+                        entries.move_to_end(key)
+                        hits += 1
+                        return value
+                    del entries[key]
+                    expirations += 1
+                misses += 1
+
+            value = func(*args, **kwargs)
+            with lock:
+                entries[key] = (value, None if ttl is None else clock() + ttl)
+                entries.move_to_end(key)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+                    evictions += 1
+            return value
+
+        def cache_info():
+            """
+            Returns the cache counters and size.
+            """
+            with lock:
+                return CacheInfo(
+                    hits, misses, evictions, expirations, maxsize, len(entries)
+                )
+
+        def cache_clear():
+            """
+            Empties the cache and resets its counters.
+            """
+            nonlocal hits, misses, evictions, expirations
+            with lock:
+                entries.clear()
+                hits = misses = evictions = expirations = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+cached_check_loan_eligibility = memoize(maxsize=4096)(check_loan_eligibility)
+cached_get_weather_advisory = memoize(maxsize=4096)(get_weather_advisory)
+cached_categorize_product = memoize(maxsize=4096)(categorize_product)
+cached_calculate_shipping_cost = memoize(maxsize=4096)(calculate_shipping_cost)
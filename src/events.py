@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+"""
+Structured event reporting for the white-box classes.
+
+Classes report what happens to them as events sent to a sink instead of
+printing directly. Event messages are only formatted when a sink asks for
+them, so a sink that drops or stores events costs little on the hot path.
+The default sink prints every message to stdout, as the classes always did.
+"""
+import atexit
+import collections
+import sys
+import threading
+import time
+
+
+class Event:  # pylint: disable=too-few-public-methods
+    """
+    Something that happened, with the data needed to describe it.
+    """
+
+    __slots__ = ("name", "template", "fields", "time")
+
+    def __init__(self, name, template, fields):
+        """
+        Set the event details. template is formatted with fields into the
+        human-readable message.
+        """
+        self.name = name
+        self.template = template
+        self.fields = fields
+        self.time = time.time()
+
+    @property
+    def message(self):
+        """
+        Human-readable description of the event.
+        """
+        return self.template.format(**self.fields)
+
+    def as_dict(self):
+        """
+        Event as a JSON-serializable dict.
+        """
+        return {"event": self.name, "time": self.time, **self.fields}
+
+
+class EventSink:
+    """
+    Base event sink, which ignores every event.
+    """
+
+    def emit(self, event):
+        """
+        Receives an event.
+        """
+
+    def close(self):
+        """
+        Releases the sink resources.
+        """
+
+
+class NullSink(EventSink):
+    """
+    Sink that drops every event.
+    """
+
+
+class StdoutSink(EventSink):
+    """
+    Sink that prints each event message to stdout as it happens.
+    """
+
+    def emit(self, event):
+        print(event.message)
+
+
+class RingBufferSink(EventSink):
+    """
+    Sink that keeps the most recent events in memory.
+    """
+
+    def __init__(self, capacity=1024):
+        """
+        Keeps up to capacity events, dropping the oldest first.
+        """
+        self.events = collections.deque(maxlen=capacity)
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def messages(self):
+        """
+        Messages of the kept events, oldest first.
+        """
+        return [event.message for event in list(self.events)]
+
+
+class BatchingSink(EventSink):  # pylint: disable=too-many-instance-attributes
+    """
+    Sink that formats and writes events from a background thread, in
+    batches, so the emitting thread never waits on I/O.
+
+    Events are appended to a deque, which needs no lock, and the thread
+    drains it every interval seconds. The sink is closed at interpreter exit
+    if not before, so pending events are written; events emitted once it is
+    closed are dropped and counted in dropped. Events whose batch could not
+    be formatted or written are counted in failed, and the thread carries
+    on with the next batch. Should the thread stop anyway, the sink closes.
+    """
+
+    _STOP = object()
+    # Seconds between the checks that the thread is still running to set a
+    # flush marker.
+    _LIVENESS_CHECK = 0.1
+
+    def __init__(self, stream=None, formatter=None, batch_size=256, interval=0.1):
+        """
+        Writes pending events to stream (stdout by default) every interval
+        seconds, up to batch_size events per write. formatter turns an event
+        into its line of text and defaults to the event message.
+        """
+        self.stream = stream
+        self.formatter = formatter or (lambda event: event.message)
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self.failed = 0
+        self._closed = False
+        self._pending = collections.deque()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(self, event):
+        if self._closed:
+            self.dropped += 1
+            return
+        self._pending.append(event)
+
+    def flush(self):
+        """
+        Waits until every event emitted so far has been written.
+        """
+        if not self._closed and self._thread.is_alive():
+            written = threading.Event()
+            self._pending.append(written)
+            self._wakeup.set()
+            # The thread sets the marker even when it stops, unless it stopped
+            # before the marker was appended.
+            while not written.wait(self._LIVENESS_CHECK):
+                if not self._thread.is_alive():
+                    break
+
+    def close(self):
+        """
+        Writes the pending events and stops the background thread.
+        """
+        self._closed = True
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._pending.append(self._STOP)
+            self._wakeup.set()
+            self._thread.join()
+
+    def _run(self):
+        """
+        Background loop writing the pending events.
+        """
+        pending = self._pending
+        try:
+            while True:
+                self._wakeup.wait(self.interval)
+                self._wakeup.clear()
+                batch = []
+                while pending:
+                    item = pending.popleft()
+                    if item is self._STOP:
+                        self._write(batch)
+                        return
+                    if isinstance(item, threading.Event):
+                        try:
+                            self._write(batch)
+                        finally:
+                            item.set()
+                        batch = []
+                        continue
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        self._write(batch)
+                        batch = []
+                self._write(batch)
+        finally:
+            # Nothing writes the events left behind, and nobody waits forever
+            # for a flush.
+            self._closed = True
+            while pending:
+                item = pending.popleft()
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is not self._STOP:
+                    self.dropped += 1
+
+    def _write(self, batch):
+        """
+        Writes a batch of events to the stream, counting them in failed if
+        the formatter or the stream raises.
+        """
+        if batch:
+            try:
+                stream = self.stream or sys.stdout
+                stream.write("".join(f"{self.formatter(event)}\n" for event in batch))
+                stream.flush()
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.failed += len(batch)
+
+
+_default_sink = StdoutSink()
+
+
+def get_default_sink():
+    """
+    Returns the sink used by objects created without one.
+    """
+    return _default_sink
+
+
+def set_default_sink(sink):
+    """
+    Sets the sink used by objects created without one and returns the
+    previous one.
+    """
+    global _default_sink  # pylint: disable=global-statement
+    previous, _default_sink = _default_sink, sink
+    return previous
+
+
+def emit(sink, event_name, template, /, **fields):
+    """
+    Sends an event to sink, or to the default sink when sink is None.
+    """
+    (sink or _default_sink).emit(Event(event_name, template, fields))
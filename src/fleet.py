@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+Fleets of table-driven state machines stepped with NumPy.
+
+A fleet keeps the state codes of many machines of the same StateMachine
+class in one int8 array, and applies a command to every machine at once by
+indexing the class transition tables.
+"""
+import numpy as np
+
+# Command code of machines that receive no command in a step.
+NO_COMMAND = -1
+
+
+class MachineFleet:  # pylint: disable=too-many-instance-attributes
+    """
+    Many machines of one StateMachine class, stored as an int8 array.
+    """
+
+    def __init__(self, machine_class, size, state=None):
+        """
+        Creates size machines of machine_class, all in state (its initial
+        state by default).
+        """
+        self.machine_class = machine_class
+        self.events = tuple(machine_class.transitions)
+        self.event_codes = {event: code for code, event in enumerate(self.events)}
+
+        # One row per event plus a last, no-op row that NO_COMMAND (-1) selects.
+        n_states = len(machine_class.states)
+        if n_states > np.iinfo(np.int8).max or (
+            (len(self.events) + 1) * n_states > np.iinfo(np.int16).max
+        ):
+            raise ValueError("Machine class too large for a fleet")
+        self.results = []
+        result_codes = {}
+        next_codes = np.empty((len(self.events) + 1, n_states), np.int8)
+        results = np.empty_like(next_codes)
+        next_codes[-1] = np.arange(n_states)
+        results[-1] = self._result_code(None, result_codes)
+        for code, event in enumerate(self.events):
+            # pylint: disable-next=protected-access
+            event_next, event_results = machine_class._table[event]
+            next_codes[code] = event_next
+            results[code] = [self._result_code(r, result_codes) for r in event_results]
+        self._n_states = n_states
+        self._next_codes = next_codes
+        self._result_table = results
+        self._messages = np.array(self.results, dtype=object)
+
+        initial = machine_class._codes[  # pylint: disable=protected-access
+            machine_class.initial_state if state is None else state
+        ]
+        self.states = np.full(size, initial, np.int8)
+
+    def __len__(self):
+        return len(self.states)
+
+    def _result_code(self, result, result_codes):
+        """
+        Code of a transition result, registering new results.
+        """
+        if result not in result_codes:
+            result_codes[result] = len(self.results)
+            self.results.append(result)
+        return result_codes[result]
+
+    def encode(self, events):
+        """
+        Converts event names into the command codes step() takes. None
+        becomes NO_COMMAND.
+        """
+        return np.array(
+            [
+                NO_COMMAND if event is None else self.event_codes[event]
+                for event in events
+            ],
+            dtype=np.int8,
+        )
+
+    def fire(self, event):
+        """
+        Applies the named event to every machine and returns the result codes.
+        """
+        code = self.event_codes[event]
+        results = self._result_table[code].take(self.states)
+        self._next_codes[code].take(self.states, out=self.states)
+        return results
+
+    def step(self, commands):
+        """
+        Applies one command code per machine, NO_COMMAND leaving the machine
+        untouched, and returns the result codes. Codes that are neither an
+        event code nor NO_COMMAND raise ValueError.
+        """
+        commands = np.asarray(commands)
+        if commands.shape != self.states.shape:
+            raise ValueError("Expected one command per machine")
+        if commands.dtype.kind not in "iu" or not np.all(
+            (commands >= NO_COMMAND) & (commands < len(self.events))
+        ):
+            raise ValueError("Invalid command code")
+        index = commands.astype(np.int16)
+        index %= len(self._next_codes)  # NO_COMMAND selects the no-op row.
+        index *= self._n_states
+        index += self.states
+        results = self._result_table.ravel().take(index)
+        self._next_codes.ravel().take(index, out=self.states)
+        return results
+
+    def messages(self, result_codes):
+        """
+        Converts result codes into the strings the machine methods return.
+        """
+        return self._messages.take(result_codes)
+
+    def state_names(self):
+        """
+        Name of the state of every machine.
+        """
+        return np.array(self.machine_class.states, dtype=object).take(self.states)
+
+    def state_counts(self):
+        """
+        Number of machines in each state, by state name.
+        """
+        counts = np.bincount(self.states, minlength=self._n_states)
+        return dict(zip(self.machine_class.states, counts.tolist()))
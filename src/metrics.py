@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in call instrumentation for the white-box functions.
+
+enable() replaces the public functions of src.white_box and the public
+methods of its state machines with wrappers recording, per function, the
+number of calls, their cumulative time and a latency histogram. disable()
+puts the original functions back, so instrumentation costs nothing while it
+is off. Only calls made through the module or the classes are seen: a
+function imported with ``from src.white_box import ...`` before enable()
+keeps its original binding.
+
+Each thread records into its own buffer, without locks; snapshot() merges
+the buffers when the statistics are read, and to_json() and to_prometheus()
+export them.
+
+The histograms are log-linear, as in HdrHistogram: durations in nanoseconds
+are counted exactly up to 2 ** (SUB_BUCKET_BITS + 1), then in buckets
+2 ** -SUB_BUCKET_BITS as wide as their lower bound, about 3% with 5 bits.
+"""
+import contextlib
+import functools
+import json
+import math
+import threading
+import time
+
+from . import white_box
+from .state_machine import StateMachine
+
+SUB_BUCKET_BITS = 5
+# Longer durations are counted in the last bucket, about 18 minutes.
+MAX_TRACKED_NS = 2**40 - 1
+
+# Cumulative bucket bounds of the Prometheus export, in seconds.
+PROMETHEUS_BUCKETS = (
+    1e-7,
+    2.5e-7,
+    5e-7,
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+    1.0,
+)
+
+
+def bucket_index(nanoseconds):
+    """
+    Index of the histogram bucket counting a duration in nanoseconds.
+    """
+    exponent = max(nanoseconds.bit_length() - SUB_BUCKET_BITS - 1, 0)
+    return (exponent << SUB_BUCKET_BITS) + (nanoseconds >> exponent)
+
+
+def bucket_bounds(index):
+    """
+    Smallest and largest durations, in nanoseconds, counted in a bucket.
+    """
+    exponent = max((index >> SUB_BUCKET_BITS) - 1, 0)
+    mantissa = index - (exponent << SUB_BUCKET_BITS)
+    return mantissa << exponent, ((mantissa + 1) << exponent) - 1
+
+
+BUCKET_COUNT = bucket_index(MAX_TRACKED_NS) + 1
+
+_local = threading.local()
+_buffers = []
+_lock = threading.Lock()
+_originals = {}  # (owner, attribute name): original function.
+
+
+class CallStats:
+    """
+    Calls, cumulative time and latency histogram of one function.
+    """
+
+    def __init__(self, name, calls=0, total_ns=0, counts=None):
+        """
+        counts holds the number of calls of every histogram bucket.
+        """
+        self.name = name
+        self.calls = calls
+        self.total_ns = total_ns
+        self.counts = counts if counts is not None else [0] * BUCKET_COUNT
+
+    @property
+    def total_seconds(self):
+        """
+        Cumulative time of the calls.
+        """
+        return self.total_ns / 1e9
+
+    def percentile(self, percent):
+        """
+        Duration in seconds that percent % of the calls did not exceed, to
+        the precision of the histogram.
+        """
+        if not self.calls:
+            return 0.0
+        rank = max(1, math.ceil(self.calls * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return bucket_bounds(index)[1] / 1e9
+        return bucket_bounds(BUCKET_COUNT - 1)[1] / 1e9
+
+    def buckets(self):
+        """
+        (lowest, highest duration in seconds, calls) of the non-empty
+        buckets.
+        """
+        return [
+            (*(bound / 1e9 for bound in bucket_bounds(index)), count)
+            for index, count in enumerate(self.counts)
+            if count
+        ]
+
+    def as_dict(self):
+        """
+        Statistics as a JSON-serializable dict.
+        """
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "p50_seconds": self.percentile(50),
+            "p90_seconds": self.percentile(90),
+            "p99_seconds": self.percentile(99),
+            "max_seconds": self.percentile(100),
+            "buckets": [list(bucket) for bucket in self.buckets()],
+        }
+
+
+def _thread_buffer():
+    """
+    Creates and registers the buffer of the current thread.
+    """
+    buffer = _local.buffer = {}
+    with _lock:
+        _buffers.append(buffer)
+    return buffer
+
+
+def _record(name, elapsed):
+    """
+    Adds a call of elapsed nanoseconds to the buffer of the current thread.
+    """
+    try:
+        buffer = _local.buffer
+    except AttributeError:
+        buffer = _thread_buffer()
+    entry = buffer.get(name)
+    if entry is None:
+        entry = buffer[name] = [0, 0, [0] * BUCKET_COUNT]
+    entry[0] += 1
+    entry[1] += elapsed
+    # bucket_index(), inlined without the max() call.
+    exponent = elapsed.bit_length() - SUB_BUCKET_BITS - 1
+    if exponent > 0:
+        index = (exponent << SUB_BUCKET_BITS) + (elapsed >> exponent)
+        entry[2][index if index < BUCKET_COUNT else BUCKET_COUNT - 1] += 1
+    else:
+        entry[2][elapsed] += 1
+
+
+def _instrument(func, name):
+    """
+    Wraps func to record its calls under name.
+    """
+    clock = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, clock() - start)
+
+    return wrapper
+
+
+def targets():
+    """
+    (owner, attribute name, metric name) of every instrumented function:
+    the public functions of src.white_box and the public methods of its
+    state machines.
+    """
+    found = []
+    for name, value in sorted(vars(white_box).items()):
+        if name.startswith("_") or not callable(value):
+            continue
+        if getattr(value, "__module__", None) != white_box.__name__:
+            continue  # Imported or lazily loaded from another module.
+        if not isinstance(value, type):
+            found.append((white_box, name, name))
+        elif issubclass(value, StateMachine):
+            found.extend(
+                (value, attribute, f"{name}.{attribute}")
+                for attribute, method in sorted(vars(value).items())
+                if not attribute.startswith("_") and callable(method)
+            )
+    return found
+
+
+def enable():
+    """
+    Installs the instrumentation wrappers, if not done yet.
+    """
+    with _lock:
+        if _originals:
+            return
+        for owner, attribute, name in targets():
+            original = getattr(owner, attribute)
+            _originals[owner, attribute] = original
+            setattr(owner, attribute, _instrument(original, name))
+
+
+def disable():
+    """
+    Puts the original functions back. Recorded statistics are kept.
+    """
+    with _lock:
+        for (owner, attribute), original in _originals.items():
+            setattr(owner, attribute, original)
+        _originals.clear()
+
+
+def is_enabled():
+    """
+    Tells whether the instrumentation wrappers are installed.
+    """
+    return bool(_originals)
+
+
+@contextlib.contextmanager
+def instrumented():
+    """
+    Context manager enabling the instrumentation for the duration of a
+    block.
+    """
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset():
+    """
+    Clears the statistics of every thread. Calls recorded at the same time
+    may be lost.
+    """
+    with _lock:
+        for buffer in _buffers:
+            buffer.clear()
+
+
+def snapshot():
+    """
+    Returns the statistics of all threads merged, as a dict from function
+    names to CallStats.
+    """
+    with _lock:
+        buffers = list(_buffers)
+    merged = {}
+    for buffer in buffers:
+        for name, (calls, total_ns, counts) in list(buffer.items()):
+            stats = merged.get(name)
+            if stats is None:
+                stats = merged[name] = CallStats(name)
+            stats.calls += calls
+            stats.total_ns += total_ns
+            stats.counts = [a + b for a, b in zip(stats.counts, counts)]
+    return dict(sorted(merged.items()))
+
+
+def to_json(indent=None):
+    """
+    Returns the merged statistics as a JSON object keyed by function name.
+    """
+    return json.dumps(
+        {name: stats.as_dict() for name, stats in snapshot().items()},
+        indent=indent,
+    )
+
+
+def to_prometheus(prefix="white_box"):
+    """
+    Returns the merged statistics in the Prometheus text exposition format,
+    as a histogram labelled by function. Histogram buckets are counted in
+    the first PROMETHEUS_BUCKETS bound not below their highest duration.
+    """
+    metric = f"{prefix}_call_duration_seconds"
+    lines = [
+        f"# HELP {metric} Duration of the instrumented function calls.",
+        f"# TYPE {metric} histogram",
+    ]
+    for name, stats in snapshot().items():
+        label = name.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        cumulative = [0] * len(PROMETHEUS_BUCKETS)
+        for _, highest, count in stats.buckets():
+            for position, bound in enumerate(PROMETHEUS_BUCKETS):
+                if highest <= bound:
+                    cumulative[position] += count
+                    break
+        seen = 0
+        for bound, count in zip(PROMETHEUS_BUCKETS, cumulative):
+            seen += count
+            lines.append(f'{metric}_bucket{{function="{label}",le="{bound}"}} {seen}')
+        lines.append(f'{metric}_bucket{{function="{label}",le="+Inf"}} {stats.calls}')
+        lines.append(f'{metric}_sum{{function="{label}"}} {stats.total_seconds!r}')
+        lines.append(f'{metric}_count{{function="{label}"}} {stats.calls}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+Process-pool helpers for running white-box functions over many inputs.
+
+Functions sent to a process pool must be picklable, so module-level
+functions such as those of src.white_box work but lambdas do not.
+"""
+import collections
+import functools
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Adaptive chunks aim to keep a worker busy for this many seconds, long
+# enough to amortise the pickling and inter-process round trip.
+TARGET_CHUNK_SECONDS = 0.05
+FIRST_CHUNK_SIZE = 64
+MAX_CHUNK_SIZE = 65536
+
+
+def chunked(iterable, size):
+    """
+    Yields lists of up to size items from iterable.
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def ordered_map(func, chunks, workers):
+    """
+    Maps func over chunks, in a process pool when workers > 1, yielding the
+    results in input order. At most 2 * workers chunks are in flight.
+    """
+    if workers <= 1:
+        yield from map(func, chunks)
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _run_chunk(func, chunk):
+    """
+    Calls func on every argument tuple of chunk. Returns the (ok, result or
+    exception) outcome of each call and the time the chunk took.
+    """
+    start = time.perf_counter()
+    outcomes = []
+    for args in chunk:
+        try:
+            outcomes.append((True, func(*args)))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            outcomes.append((False, error))
+    return outcomes, time.perf_counter() - start
+
+
+def batch_map(
+    func, args_iterable, workers=None, chunksize=None, return_exceptions=False
+):
+    """
+    Yields func(*args) for every argument tuple of args_iterable, in order,
+    computed by a pool of workers processes (all CPUs by default).
+
+    Arguments are sent in chunks of chunksize items. When chunksize is None
+    the size adapts to the measured cost of func, so each chunk takes about
+    TARGET_CHUNK_SECONDS. When a call raises, the exception is raised when
+    its result is reached, or yielded in its place if return_exceptions is
+    true.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    iterator = iter(args_iterable)
+    size = chunksize or FIRST_CHUNK_SIZE
+
+    def chunks():
+        # Drawn lazily, so chunks submitted later use the adapted size.
+        while chunk := list(itertools.islice(iterator, size)):
+            yield chunk
+
+    for outcomes, elapsed in ordered_map(
+        functools.partial(_run_chunk, func), chunks(), workers
+    ):
+        if chunksize is None:
+            per_call = max(elapsed / len(outcomes), 1e-9)
+            size = max(1, min(MAX_CHUNK_SIZE, int(TARGET_CHUNK_SECONDS / per_call)))
+        for ok, value in outcomes:
+            if not ok and not return_exceptions:
+                raise value
+            yield value
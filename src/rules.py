@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rule tables: ordered decision rules over several numbers, compiled into a
+grid of intervals.
+
+Each rule bounds some of the inputs with the keys of tier tables and gives
+the value of the first rule that matches:
+
+    RuleTable(
+        ["correct_answers", "incorrect_answers"],
+        [
+            {"when": {"correct_answers": {"min": 7},
+                      "incorrect_answers": {"max": 2}}, "value": "Pass"},
+            {"when": {"correct_answers": {"min": 5},
+                      "incorrect_answers": {"max": 3}},
+             "value": "Conditional Pass"},
+        ],
+        default="Fail",
+    )
+
+An input a rule does not mention is unbounded. The bounds of all rules cut
+every input into intervals, and the value of each combination of intervals
+is computed once, so a lookup is a binary search per input and one grid
+access, for one row or, with numpy.searchsorted, for whole arrays. As in an
+if ladder, NaN fails every bound: it only matches rules that leave its
+input unbounded.
+"""
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from .tiers import _BEFORE, _tier_bounds
+
+# Inputs with up to this many edges are located by comparing whole arrays
+# with every edge, which beats a binary search per number for few edges.
+MAX_COMPARED_EDGES = 8
+
+
+def _rule_bounds(inputs, rules):
+    """
+    Converts rule dicts into ([(lower edge, upper edge) per input], value)
+    pairs, and returns them with the sorted edges of every input.
+    """
+    compiled = []
+    edges = [set() for _ in inputs]
+    for rule in rules:
+        unknown = set(rule) - {"when", "value"}
+        unknown |= set(rule.get("when", {})) - set(inputs)
+        if unknown:
+            raise ValueError(f"Unknown rule keys: {sorted(unknown)}")
+        bounds = []
+        for axis, name in enumerate(inputs):
+            lower, upper, _ = _tier_bounds(rule.get("when", {}).get(name, {}))
+            edges[axis].update(e for e in (lower, upper) if e is not None)
+            bounds.append((lower, upper))
+        compiled.append((bounds, rule.get("value")))
+    return compiled, [sorted(axis_edges) for axis_edges in edges]
+
+
+class RuleTable:  # pylint: disable=too-many-instance-attributes
+    """
+    Ordered rules over named numeric inputs, compiled into an interval grid.
+    """
+
+    def __init__(self, inputs, rules, default=None):
+        """
+        Builds the table from rule dicts with a "when" mapping from input
+        names to tier bounds and a "value". Numbers no rule matches get
+        default.
+        """
+        self.inputs = tuple(inputs)
+        self.default = default
+
+        compiled, self._edges = _rule_bounds(self.inputs, rules)
+
+        # Segment i of an input lies between its edges i - 1 and i. One more
+        # segment, after the one past the last edge, holds NaN.
+        # Per input: points of the "before" edges, which a number equal to
+        # them is past, points of the "after" edges, and the NaN segment.
+        self._axes = [
+            (
+                [point for point, kind in axis_edges if kind == _BEFORE],
+                [point for point, kind in axis_edges if kind != _BEFORE],
+                len(axis_edges) + 1,
+            )
+            for axis_edges in self._edges
+        ]
+        self._axis_points = [
+            (np.array(before), np.array(after)) for before, after, _ in self._axes
+        ]
+        shape = tuple(len(axis_edges) + 2 for axis_edges in self._edges)
+
+        self.values = [default]
+        codes = {default: 0}
+        grid = np.zeros(shape, np.intp)
+        # Earlier rules are written last, so they win where rules overlap.
+        for bounds, value in reversed(compiled):
+            if value not in codes:
+                codes[value] = len(self.values)
+                self.values.append(value)
+            cells = tuple(
+                self._segments(axis, lower, upper)
+                for axis, (lower, upper) in enumerate(bounds)
+            )
+            grid[cells] = codes[value]
+        self._grid = grid
+        self._flat_grid = grid.ravel()
+        self._cells = np.array(self.values, dtype=object)[grid].tolist()
+        strings = all(isinstance(value, str) for value in self.values)
+        self.labels = np.array(self.values, dtype=None if strings else object)
+
+    def _segments(self, axis, lower, upper):
+        """
+        Slice of the segments of an input between the lower and upper edges.
+        """
+        if lower is None and upper is None:
+            return slice(None)  # NaN included.
+        edges = self._edges[axis]
+        start = 0 if lower is None else edges.index(lower) + 1
+        stop = len(edges) + 1 if upper is None else edges.index(upper) + 1
+        return slice(start, stop)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds a table from a mapping such as one loaded from JSON, with
+        "inputs" and "rules" lists and an optional "default" value.
+        """
+        return cls(config["inputs"], config["rules"], config.get("default"))
+
+    def lookup(self, *values):
+        """
+        Returns the value of the first rule the numbers, one per input,
+        match.
+        """
+        if len(values) != len(self.inputs):
+            raise TypeError(f"Expected {len(self.inputs)} values")
+        cell = self._cells
+        for axis, value in enumerate(values):
+            before, after, nan = self._axes[axis]
+            if value != value:  # pylint: disable=comparison-with-itself
+                cell = cell[nan]
+            else:
+                cell = cell[bisect_right(before, value) + bisect_left(after, value)]
+        return cell
+
+    def codes(self, *columns):
+        """
+        Looks up arrays of numbers, one per input, broadcast together.
+        Returns the index in values of the result of every row, so
+        labels[codes] gives the results.
+        """
+        if len(columns) != len(self.inputs):
+            raise TypeError(f"Expected {len(self.inputs)} columns")
+        columns = np.broadcast_arrays(*columns)
+        index = np.zeros(columns[0].shape, np.intp)
+        for column, (before, after, nan), points, size in zip(
+            columns, self._axes, self._axis_points, self._grid.shape
+        ):
+            index *= size
+            if len(before) + len(after) <= MAX_COMPARED_EDGES:
+                segments = np.zeros(column.shape, np.intp)
+                for point in before:
+                    segments += column >= point
+                for point in after:
+                    segments += column > point
+            else:
+                segments = np.searchsorted(points[0], column, side="right")
+                segments += np.searchsorted(points[1], column, side="left")
+            if column.dtype.kind == "f":
+                segments[np.isnan(column)] = nan
+            index += segments
+        return self._flat_grid.take(index)
+
+    def lookup_array(self, *columns):
+        """
+        Returns the array of the results of lookup for every row of the
+        columns.
+        """
+        return self.labels.take(self.codes(*columns))
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+Table-driven finite-state machines.
+
+A machine class lists its state names and, for every event, the transitions
+it allows as {state: (next state, result)}. When the class is created the
+names are replaced by integer codes and each event is compiled into two
+tuples indexed by the current state code: the next state and the result to
+return. Firing an event is then two tuple lookups, and instances only store
+the state code in a __slots__ field.
+
+Methods decorated with @transition are replaced by the compiled version of
+the event of the same name, so calling them costs a single function call.
+"""
+import functools
+
+
+def transition(method):
+    """
+    Marks a StateMachine method as the trigger of the event of the same name.
+    Its body is never run.
+    """
+    method.is_transition = True
+    return method
+
+
+def _compile(method, next_codes, results):
+    """
+    Builds the method firing an event from its lookup tables.
+    """
+
+    @functools.wraps(method)
+    def fire(self):
+        # pylint: disable=protected-access
+        code = self._code
+        self._code = next_codes[code]
+        return results[code]
+
+    return fire
+
+
+class StateMachine:  # pylint: disable=too-few-public-methods
+    """
+    Base class of the table-driven state machines.
+    """
+
+    __slots__ = ("_code",)
+
+    states = ()
+    initial_state = None
+    transitions = {}
+    invalid_result = None
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Compiles the transitions of the subclass into lookup tables.
+        """
+        super().__init_subclass__(**kwargs)
+        codes = {name: code for code, name in enumerate(cls.states)}
+        cls._codes = codes
+        cls._initial_code = codes[cls.initial_state] if cls.states else 0
+        cls._table = {}
+        for event, moves in cls.transitions.items():
+            next_codes = list(range(len(cls.states)))
+            results = [cls.invalid_result] * len(cls.states)
+            for state, (next_state, result) in moves.items():
+                next_codes[codes[state]] = codes[next_state]
+                results[codes[state]] = result
+            cls._table[event] = (tuple(next_codes), tuple(results))
+            method = cls.__dict__.get(event)
+            if getattr(method, "is_transition", False):
+                setattr(cls, event, _compile(method, *cls._table[event]))
+
+    def __init__(self):
+        """
+        Defines the initial state.
+        """
+        self._code = self._initial_code
+
+    @property
+    def state(self):
+        """
+        Name of the current state.
+        """
+        return self.states[self._code]
+
+    @state.setter
+    def state(self, name):
+        """
+        Moves the machine to the named state.
+        """
+        try:
+            self._code = self._codes[name]
+        except KeyError:
+            raise ValueError(f"Unknown state: {name!r}") from None
+
+    def _fire(self, event):
+        """
+        Applies event to the current state and returns its result.
+        """
+        next_codes, results = self._table[event]
+        code = self._code
+        self._code = next_codes[code]
+        return results[code]
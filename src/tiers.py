@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tier tables: threshold lookups resolved by binary search.
+
+A tier table maps a number to the value of the tier it falls in. Tiers are
+described with the same keys whether they are written in code or loaded from
+a configuration file:
+
+    {"min": 10, "max": 50, "value": "Category A"}   # 10 <= x <= 50
+    {"above": 700, "value": "Standard Loan"}        # x > 700
+    {"below": 100, "value": 0}                      # x < 100
+
+A tier may set at most one lower bound ("min" or "above") and one upper bound
+("max" or "below"); a missing bound is unbounded. Numbers outside every tier
+get the table default, so gaps between tiers are preserved exactly.
+"""
+from bisect import bisect_left
+
+# Edge kinds. A "before" edge at x starts a segment that includes x, an
+# "after" edge at x ends a segment that includes x.
+_BEFORE = 0
+_AFTER = 1
+
+_UNSET = object()
+
+
+class TierTable:
+    """
+    Sorted tier breakpoints with a binary-search lookup.
+    """
+
+    def __init__(self, tiers, default=None, nan=_UNSET):
+        """
+        Builds the table from tier dicts. default is the value of numbers
+        outside every tier and nan the value of NaN, which defaults to default.
+        A tier value may itself be a TierTable, looked up with the next number
+        passed to lookup().
+        """
+        self.default = default
+        self.nan = default if nan is _UNSET else nan
+
+        bounded = sorted(
+            (_tier_bounds(tier) for tier in tiers),
+            key=lambda bounds: (bounds[0] is not None, bounds[0] or ()),
+        )
+        edges = []
+        values = []
+        position = None  # Key of the last edge, None while unbounded below.
+        closed = False  # A tier without upper bound has been added.
+        for lower, upper, value in bounded:
+            starts_early = lower is not None and position is not None
+            if (
+                closed
+                or (lower is None and values)
+                or (starts_early and lower < position)
+            ):
+                raise ValueError(f"Overlapping tier for value {value!r}")
+            if lower is not None and lower != position:
+                values.append(default)
+                edges.append(lower)
+            values.append(value)
+            if upper is None:
+                closed = True
+            else:
+                edges.append(upper)
+                position = upper
+        if not closed:
+            values.append(default)
+
+        self._points = [point for point, _ in edges]
+        self._kinds = [kind for _, kind in edges]
+        self._values = values
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Builds a table from a mapping such as one loaded from JSON, with a
+        "tiers" list and optional "default" and "nan" values. Tier values that
+        are mappings with their own "tiers" become nested tables.
+        """
+        tiers = [
+            {**tier, "value": _config_value(tier.get("value"))}
+            for tier in config["tiers"]
+        ]
+        kwargs = {}
+        if "nan" in config:
+            kwargs["nan"] = _config_value(config["nan"])
+        return cls(tiers, default=_config_value(config.get("default")), **kwargs)
+
+    def lookup(self, value, *values):
+        """
+        Returns the value of the tier value falls in. Extra numbers are
+        looked up in nested tables.
+        """
+        if value != value:  # pylint: disable=comparison-with-itself
+            result = self.nan
+        else:
+            points = self._points
+            index = bisect_left(points, value)
+            # Edges at the value itself: "before" edges put it in the next
+            # segment, "after" edges leave it in the current one.
+            while (
+                index < len(points)
+                and self._kinds[index] == _BEFORE
+                and points[index] == value
+            ):
+                index += 1
+            result = self._values[index]
+
+        if values and isinstance(result, TierTable):
+            return result.lookup(*values)
+        return result
+
+
+def _tier_bounds(tier):
+    """
+    Converts a tier dict into (lower edge, upper edge, value). Edges are
+    (number, kind) pairs that sort in the order they occur on the number line.
+    """
+    unknown = set(tier) - {"min", "above", "max", "below", "value"}
+    if unknown:
+        raise ValueError(f"Unknown tier keys: {sorted(unknown)}")
+    if ("min" in tier and "above" in tier) or ("max" in tier and "below" in tier):
+        raise ValueError("A tier can only have one lower and one upper bound")
+
+    lower = upper = None
+    if "min" in tier:
+        lower = (tier["min"], _BEFORE)
+    elif "above" in tier:
+        lower = (tier["above"], _AFTER)
+    if "max" in tier:
+        upper = (tier["max"], _AFTER)
+    elif "below" in tier:
+        upper = (tier["below"], _BEFORE)
+
+    if lower is not None and upper is not None and not lower < upper:
+        raise ValueError(f"Empty tier for value {tier.get('value')!r}")
+    return lower, upper, tier.get("value")
+
+
+def _config_value(value):
+    """
+    Turns nested table mappings of a configuration into TierTable objects.
+    """
+    if isinstance(value, dict) and "tiers" in value:
+        return TierTable.from_config(value)
+    return value
@@ -0,0 +1,698 @@
+# -*- coding: utf-8 -*-
+
+"""
+NumPy batch versions of the white-box code examples.
+
+Each function here takes columns of inputs and computes the same results as
+its scalar counterpart in ``src.white_box`` for every row at once.
+"""
+import calendar
+
+import numpy as np
+
+from .rules import RuleTable
+
+
+def _quantity_multipliers(quantities):
+    """
+    Price multipliers of the quantity discount tiers used by
+    calculate_order_total: 1-5 items pay full price, 6-10 items get 5% off
+    and anything else gets 10% off.
+    """
+    multipliers = np.full(quantities.shape, 0.9)
+    multipliers[(quantities >= 1) & (quantities <= 5)] = 1.0
+    multipliers[(quantities >= 6) & (quantities <= 10)] = 0.95
+    return multipliers
+
+
+def _segment_sums(values, offsets):
+    """
+    Sums values[offsets[i]:offsets[i + 1]] for every segment i, giving 0 for
+    empty segments.
+    """
+    offsets = np.asarray(offsets, dtype=np.intp)
+    counts = np.diff(offsets)
+    if offsets[0] != 0 or offsets[-1] != len(values) or (counts < 0).any():
+        raise ValueError("offsets must increase from 0 to the number of values")
+
+    sums = np.zeros(len(counts))
+    non_empty = counts > 0
+    if non_empty.any():
+        # Empty segments start where the next one does, so dropping them keeps
+        # every remaining segment intact for the reduction.
+        sums[non_empty] = np.add.reduceat(values, offsets[:-1][non_empty])
+    return sums
+
+
+def _as_strings(values):
+    """
+    Converts strings, a NumPy string or bytes array, or a pyarrow string
+    array to a NumPy array the numpy.strings functions accept. Missing
+    pyarrow values become empty strings.
+    """
+    if hasattr(values, "fill_null"):  # pyarrow Array or ChunkedArray
+        values = values.fill_null("").to_numpy(zero_copy_only=False)
+    values = np.asarray(values)
+    # Object arrays, and empty lists, which become float64 arrays, are
+    # converted to StringDType, whose character code is "T".
+    if values.dtype.kind not in "UST":
+        values = values.astype(np.dtype("T"))
+    return values
+
+
+def to_labels(codes, labels):
+    """
+    Maps result codes, or boolean results, to their strings in labels.
+    """
+    codes = np.asarray(codes)
+    if codes.dtype == np.bool_:
+        codes = codes.view(np.uint8)
+    return labels[codes]
+
+
+def are_even(numbers):
+    """
+    Checks which numbers are even, like is_even does for one number.
+    """
+    numbers = np.asarray(numbers)
+    if numbers.dtype.kind in "iub":
+        # Two's complement keeps the parity in the lowest bit, negatives too.
+        return (numbers & 1) == 0
+    # inf and NaN have no remainder; they are not even, as in is_even.
+    with np.errstate(invalid="ignore"):
+        return np.remainder(numbers, 2) == 0
+
+
+def divide_arrays(  # pylint: disable=too-many-arguments
+    a, b, out=None, *, zero_division=0.0, nan=None, posinf=None, neginf=None
+):
+    """
+    Divides a by b element-wise, giving zero_division where b is 0 like
+    divide does, without warnings.
+
+    Results are written to out when given, a float array of the broadcast
+    shape that can be reused between calls. nan, posinf and neginf, when
+    set, replace NaN and infinite quotients.
+    """
+    a, b = np.asarray(a), np.asarray(b)
+    shape = np.broadcast_shapes(a.shape, b.shape)
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out must have shape {shape}")
+
+    nonzero = b != 0
+    out[...] = zero_division
+    with np.errstate(over="ignore", invalid="ignore", under="ignore"):
+        np.divide(a, b, out=out, where=nonzero)
+
+    policy = ((nan, np.isnan), (posinf, np.isposinf), (neginf, np.isneginf))
+    for value, select in policy:
+        if value is not None:
+            np.copyto(out, value, where=select(out))
+    return out
+
+
+TRIANGLE_RESULTS = np.array(["No, it's not a triangle.", "Yes, it's a triangle!"])
+
+
+def are_triangles(sides, out=None, chunk_size=1 << 14):
+    """
+    Checks which rows of an (N, 3) array of side lengths can form a
+    triangle, with the strict inequalities of is_triangle: degenerate rows
+    such as (1, 2, 3) cannot. Returns a boolean array;
+    to_labels(result, TRIANGLE_RESULTS) gives the strings.
+
+    The result is written to out when given, a boolean array of N values.
+    Rows are processed chunk_size at a time through two scratch buffers, so
+    no other memory is allocated whatever N is. Float sides are added in
+    their own precision, other sides as float64.
+    """
+    sides = np.asarray(sides)
+    if sides.ndim != 2 or sides.shape[1] != 3:
+        raise ValueError("sides must have shape (N, 3)")
+    if out is None:
+        out = np.empty(len(sides), np.bool_)
+    elif out.shape != (len(sides),):
+        raise ValueError(f"out must have shape ({len(sides)},)")
+
+    dtype = sides.dtype if sides.dtype.kind == "f" else np.dtype(np.float64)
+    sums = np.empty(min(chunk_size, len(sides)), dtype)
+    holds = np.empty(len(sums), np.bool_)
+    for start in range(0, len(sides), chunk_size):
+        columns = sides[start : start + chunk_size].T
+        result = out[start : start + chunk_size]
+        n = len(result)
+        result[...] = True
+        for x, y, z in ((0, 1, 2), (0, 2, 1), (1, 2, 0)):
+            # Adding in dtype keeps narrow integers from wrapping around; like
+            # Python floats, float sums may overflow to inf or give NaN.
+            with np.errstate(over="ignore", invalid="ignore"):
+                np.add(columns[x], columns[y], out=sums[:n], dtype=dtype)
+            np.greater(sums[:n], columns[z], out=holds[:n])
+            result &= holds[:n]
+    return out
+
+
+# 1
+NUMBER_STATUSES = np.array(["Positive", "Negative", "Zero"])
+
+
+def check_number_statuses(numbers):
+    """
+    Classifies numbers as positive, negative or zero, like
+    check_number_status. Returns uint8 codes indexing NUMBER_STATUSES.
+    """
+    numbers = np.asarray(numbers)
+    codes = np.full(numbers.shape, 2, np.uint8)
+    codes[numbers > 0] = 0
+    codes[numbers < 0] = 1
+    return codes
+
+
+# 4
+def calculate_order_totals(quantities, prices=None, offsets=None):
+    """
+    Calculates the total of many orders at once.
+
+    quantities and prices are the columns of all order lines. A structured
+    array with "quantity" and "price" fields can be passed as quantities
+    instead, leaving prices unset. offsets holds the index of the first line
+    of each order followed by the total number of lines, so order i spans
+    lines offsets[i]:offsets[i + 1]. Without offsets all lines belong to a
+    single order. Returns a float array with one total per order.
+    """
+    if prices is None:
+        quantities, prices = quantities["quantity"], quantities["price"]
+    quantities = np.asarray(quantities)
+    prices = np.asarray(prices)
+    if quantities.shape != prices.shape or quantities.ndim != 1:
+        raise ValueError("quantities and prices must be 1-D arrays of equal length")
+
+    if offsets is None:
+        offsets = [0, len(quantities)]
+
+    # Same operation order as the scalar version: multiplier * quantity * price.
+    line_totals = _quantity_multipliers(quantities)
+    line_totals *= quantities
+    line_totals *= prices
+    return _segment_sums(line_totals, offsets)
+
+
+# 5
+_WEIGHT_BREAKPOINTS = np.array([5, 10])
+_SHIPPING_METHODS = ("standard", "express")
+_SHIPPING_RATES = np.array(
+    [
+        [10, 15, 20],  # standard
+        [20, 30, 40],  # express
+    ]
+)
+
+
+def calculate_items_shipping_costs(weights, shipping_methods, offsets=None):
+    """
+    Calculates the shipping cost of many orders at once.
+
+    weights holds the total weight of each order, or the weight of every item
+    when offsets splits them into orders the way calculate_order_totals does.
+    shipping_methods holds one method per order, or a single method for all.
+
+    Returns the costs and a boolean mask of orders with an invalid shipping
+    method, whose cost is 0. When a single weight and method are given the
+    cost is returned directly and an invalid method raises ValueError, like
+    calculate_items_shipping_cost.
+    """
+    scalar = np.ndim(weights) == 0 and np.ndim(shipping_methods) == 0
+    weights = np.asarray(weights)
+    if offsets is not None:
+        weights = _segment_sums(weights, offsets)
+    shipping_methods = np.asarray(shipping_methods)
+
+    method_codes = np.full(np.broadcast(weights, shipping_methods).shape, -1)
+    for code, method in enumerate(_SHIPPING_METHODS):
+        method_codes[shipping_methods == method] = code
+    invalid = method_codes < 0
+
+    # side="left" keeps each breakpoint in the lower tier (weight <= 5, <= 10).
+    tiers = np.searchsorted(_WEIGHT_BREAKPOINTS, weights, side="left")
+    costs = np.where(invalid, 0, _SHIPPING_RATES[method_codes, tiers])
+
+    if scalar:
+        if invalid:
+            raise ValueError("Invalid shipping method")
+        return int(costs)
+    return costs, invalid
+
+
+# 7
+AGE_RESULTS = np.array(["Not Eligible", "Eligible"])
+
+
+def verify_ages(ages):
+    """
+    Checks which ages are eligible, like verify_age. Returns a boolean
+    array; to_labels(result, AGE_RESULTS) gives the strings.
+    """
+    ages = np.asarray(ages)
+    return (ages >= 18) & (ages <= 65)
+
+
+# 9
+EMAIL_RESULTS = np.array(["Invalid Email", "Valid Email"])
+
+
+def validate_emails(emails):
+    """
+    Checks which email addresses are valid, like validate_email. Returns a
+    boolean array; to_labels(result, EMAIL_RESULTS) gives the strings.
+    """
+    emails = _as_strings(emails)
+    at, dot = (b"@", b".") if emails.dtype.kind == "S" else ("@", ".")
+    lengths = np.strings.str_len(emails)
+    return (
+        (lengths >= 5)
+        & (lengths <= 50)
+        & (np.strings.find(emails, at) >= 0)
+        & (np.strings.find(emails, dot) >= 0)
+    )
+
+
+# 10
+def celsius_to_fahrenheits(celsius, out=None, masked=False):
+    """
+    Converts temperatures from Celsius to Fahrenheit, like
+    celsius_to_fahrenheit.
+
+    Returns a float64 array of temperatures, NaN where the input is out of
+    range, and the boolean mask of valid readings. With masked=True a
+    numpy.ma.MaskedArray hiding the invalid readings is returned instead.
+    Temperatures are written to out when given.
+    """
+    celsius = np.asarray(celsius)
+    valid = (celsius >= -100) & (celsius <= 100)
+    if out is None:
+        out = np.empty(celsius.shape)
+    # Same operation order as the scalar version: (celsius * 9 / 5) + 32.
+    np.multiply(celsius, 9, out=out, dtype=np.float64, casting="unsafe")
+    out /= 5
+    out += 32
+    out[~valid] = np.nan
+    if masked:
+        return np.ma.MaskedArray(out, mask=~valid)
+    return out, valid
+
+
+def convert_celsius_file(source, target, mask_target=None, chunk_size=1 << 20):
+    """
+    Converts a .npy file of Celsius readings into a .npy file of Fahrenheit
+    temperatures, chunk by chunk through memory maps, so memory use does not
+    depend on the file size. Invalid readings become NaN and, when
+    mask_target is given, the validity mask is saved there as a .npy file.
+    Returns the number of valid readings.
+    """
+    readings = np.load(source, mmap_mode="r")
+    # Outputs share the input memory layout so all three can be walked in
+    # memory order through flat views.
+    layout = {
+        "shape": readings.shape,
+        "fortran_order": not readings.flags.c_contiguous,
+    }
+    temperatures = np.lib.format.open_memmap(
+        target, mode="w+", dtype=np.float64, **layout
+    )
+    masks = None
+    if mask_target is not None:
+        masks = np.lib.format.open_memmap(
+            mask_target, mode="w+", dtype=np.bool_, **layout
+        )
+
+    flat_readings = readings.ravel(order="K")
+    flat_temperatures = temperatures.ravel(order="K")
+    flat_masks = None if masks is None else masks.ravel(order="K")
+    count = 0
+    for start in range(0, flat_readings.size, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        _, valid = celsius_to_fahrenheits(
+            flat_readings[chunk], out=flat_temperatures[chunk]
+        )
+        count += int(np.count_nonzero(valid))
+        if flat_masks is not None:
+            flat_masks[chunk] = valid
+
+    temperatures.flush()
+    if masks is not None:
+        masks.flush()
+    return count
+
+
+# 11
+CARD_RESULTS = np.array(["Invalid Card", "Valid Card"])
+
+
+def _luhn_chunk(numbers, max_length):
+    """
+    Luhn checks of a one-dimensional chunk of numbers, through a uint8
+    matrix of their characters with one row per position.
+    """
+    width = max_length + 1
+    if numbers.dtype.kind == "S":
+        codes = numbers.astype(f"S{width}").view(np.uint8)
+    else:
+        codes = numbers.astype(f"U{width}").view(np.uint32)
+        # Non-ASCII characters become 255 rather than wrapping onto digits.
+        codes = np.minimum(codes, 255).astype(np.uint8)
+    # Position-major, so the reductions below add whole contiguous rows.
+    codes = codes.reshape(len(numbers), width).T.copy()
+
+    # Numbers longer than max_length fill all width positions.
+    lengths = np.count_nonzero(codes, axis=0)
+    digits = codes - np.uint8(ord("0"))
+    in_number = np.arange(width)[:, None] < lengths
+    well_formed = ((digits < 10) == in_number).all(axis=0)
+    digits *= in_number
+    # Every second digit counting from the last one is doubled, its digits
+    # summed: 2 * d, less 9 when that has two digits.
+    doubles = digits << 1
+    doubles -= (digits > 4) * np.uint8(9)
+    total = np.where(
+        lengths % 2 == 0,
+        digits[1::2].sum(axis=0, dtype=np.uint16)
+        + doubles[0::2].sum(axis=0, dtype=np.uint16),
+        digits[0::2].sum(axis=0, dtype=np.uint16)
+        + doubles[1::2].sum(axis=0, dtype=np.uint16),
+    )
+    return (lengths > 0) & (lengths <= max_length) & well_formed & (total % 10 == 0)
+
+
+def luhn_checks(numbers, max_length=19, chunk_size=1 << 16):
+    """
+    Checks which numbers pass the Luhn checksum that card numbers carry.
+    Numbers must be made of ASCII digits and have at most max_length of
+    them. They are checked chunk_size at a time to bound memory use.
+    """
+    numbers = _as_strings(numbers)
+    flat = numbers.ravel()
+    valid = np.empty(flat.shape, dtype=np.bool_)
+    for start in range(0, len(flat), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        valid[chunk] = _luhn_chunk(flat[chunk], max_length)
+    return valid.reshape(numbers.shape)
+
+
+def validate_credit_cards(card_numbers, luhn=False):
+    """
+    Checks which card numbers are valid, like validate_credit_card. With
+    luhn=True the numbers must also pass the Luhn checksum. Returns a boolean
+    array; to_labels(result, CARD_RESULTS) gives the strings.
+    """
+    card_numbers = _as_strings(card_numbers)
+    lengths = np.strings.str_len(card_numbers)
+    valid = (lengths >= 13) & (lengths <= 16)
+    if luhn:
+        # Numbers passing the Luhn check are ASCII digits, so isdigit holds.
+        return valid & luhn_checks(card_numbers, max_length=16)
+    return valid & np.strings.isdigit(card_numbers)
+
+
+# 12
+DATE_RESULTS = np.array(["Invalid Date", "Valid Date"])
+FIRST_YEAR, LAST_YEAR = 1900, 2100
+DATE_CHUNK_SIZE = 1 << 15
+
+
+def _month_lengths():
+    """
+    Days in month m of year FIRST_YEAR + y at index 16 * y + m - 1, for the
+    years validate_date accepts.
+    """
+    lengths = np.zeros((LAST_YEAR - FIRST_YEAR + 1, 16), np.uint8)
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        for month in range(1, 13):
+            _, lengths[year - FIRST_YEAR, month - 1] = calendar.monthrange(year, month)
+    return lengths.ravel()
+
+
+_MONTH_LENGTHS = _month_lengths()
+
+
+def _validate_dates_chunk(years, months, days, strict):
+    """
+    validate_dates on one chunk of integer columns.
+    """
+    # Shifted to start at 0, each range check is one unsigned comparison:
+    # values below the range wrap around to huge ones.
+    unsigned = np.dtype(f"u{years.dtype.itemsize}")
+    years = years - FIRST_YEAR
+    months = months - 1
+    days = days - 1
+    valid = years.view(unsigned) <= LAST_YEAR - FIRST_YEAR
+    valid &= months.view(unsigned) < 12
+    if not strict:
+        valid &= days.view(unsigned) < 31
+        return valid
+    # Invalid rows may index anywhere; clipping keeps them in the table and
+    # their result is False already.
+    index = years
+    index *= 16
+    index += months
+    valid &= days.view(unsigned) < _MONTH_LENGTHS.take(index, mode="clip")
+    return valid
+
+
+def validate_dates(years, months, days, strict=False, chunk_size=DATE_CHUNK_SIZE):
+    """
+    Checks which dates are valid, like validate_date with the same strict
+    flag. Returns a boolean array; to_labels(result, DATE_RESULTS) gives
+    the strings.
+
+    Integer columns are processed chunk_size rows at a time, so the
+    intermediate arrays stay in cache; strict mode looks the month lengths
+    up in a table of every month from FIRST_YEAR to LAST_YEAR.
+    """
+    years, months, days = np.broadcast_arrays(years, months, days)
+    if not years.size:  # Empty lists are float64 arrays.
+        return np.zeros(years.shape, np.bool_)
+    dtype = np.dtype(np.result_type(years, months, days))
+    kinds = {column.dtype.kind for column in (years, months, days)}
+    if dtype.kind == "f" and kinds <= {"i", "u"}:
+        # uint64 with signed columns: numbers past the int64 range are out
+        # of every valid range anyway, so clipping them keeps the results.
+        dtype = np.dtype(np.int64)
+        limit = np.iinfo(np.int64).max
+        years, months, days = (
+            np.minimum(c, limit) if c.dtype == np.uint64 else c
+            for c in (years, months, days)
+        )
+    if dtype.kind not in "iu":
+        if strict:
+            raise TypeError("strict date validation needs integer arrays")
+        return (
+            (years >= FIRST_YEAR)
+            & (years <= LAST_YEAR)
+            & (months >= 1)
+            & (months <= 12)
+            & (days >= 1)
+            & (days <= 31)
+        )
+    if dtype.itemsize < 4:
+        dtype = np.dtype(np.int32)  # Room for the year offsets.
+
+    columns = [
+        np.ravel(column).astype(dtype, copy=False) for column in (years, months, days)
+    ]
+    valid = np.empty(columns[0].shape, np.bool_)
+    for start in range(0, len(valid), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        valid[chunk] = _validate_dates_chunk(
+            *(column[chunk] for column in columns), strict
+        )
+    return valid.reshape(years.shape)
+
+
+# 14
+URL_RESULTS = np.array(["Invalid URL", "Valid URL"])
+# Codes of classify_url_schemes.
+URL_SCHEMES = np.array(["other", "http", "https"])
+MAX_URL_LENGTH = 255
+
+
+def _url_heads(urls):
+    """
+    The first 8 characters of every URL, all the scheme checks look at, as a
+    small fixed-width array.
+    """
+    if isinstance(urls, (list, tuple)):
+        # Much cheaper than converting the whole strings first.
+        return np.array(urls, dtype="U8")
+    urls = _as_strings(urls)
+    return urls.astype("S8" if urls.dtype.kind == "S" else "U8")
+
+
+def _long_urls(urls):
+    """
+    Which URLs are longer than MAX_URL_LENGTH characters.
+    """
+    if isinstance(urls, (list, tuple)):
+        return np.fromiter(map(len, urls), np.intp, len(urls)) > MAX_URL_LENGTH
+    urls = _as_strings(urls)
+    if urls.dtype.kind == "T":
+        return np.strings.str_len(urls) > MAX_URL_LENGTH
+    # Fixed-width strings are padded with zeros, so a URL is long when any
+    # character past the limit is not zero. str_len would scan every
+    # string from the end of the padding instead.
+    char = np.dtype(np.uint8 if urls.dtype.kind == "S" else np.uint32)
+    chars = np.ascontiguousarray(urls).view(char)
+    # An explicit width, as -1 is ambiguous for empty arrays.
+    width = urls.itemsize // char.itemsize
+    return chars.reshape(urls.shape + (width,))[..., MAX_URL_LENGTH:].any(axis=-1)
+
+
+def classify_url_schemes(urls):
+    """
+    Classifies the scheme prefix of every URL: 0 for other URLs, 1 for
+    http:// and 2 for https://. Returns uint8 codes; URL_SCHEMES[codes]
+    gives the names.
+    """
+    heads = _url_heads(urls)
+    if heads.dtype.kind == "S":
+        http, https = b"http://", b"https://"
+    else:
+        http, https = "http://", "https://"
+    codes = np.strings.startswith(heads, http).view(np.uint8)
+    codes += (heads == https).view(np.uint8) * np.uint8(2)
+    return codes
+
+
+def validate_urls(urls, strict=False):
+    """
+    Checks which URLs are valid, like validate_url with the same strict
+    flag. Returns a boolean array; to_labels(result, URL_RESULTS) gives the
+    strings.
+    """
+    if not isinstance(urls, (list, tuple)):
+        urls = _as_strings(urls)
+    schemes = classify_url_schemes(urls)
+    short = ~_long_urls(urls)
+    if strict:
+        return (schemes != 0) & short
+    return (schemes == 2) | ((schemes == 1) & short)
+
+
+# 16
+MAX_FILE_SIZE = 1048576  # 1 MB in bytes
+FILE_SIZE_RESULTS = np.array(["Invalid File Size", "Valid File Size"])
+
+
+def check_file_sizes(sizes_in_bytes):
+    """
+    Checks which sizes are valid for a file, like check_file_size. Returns
+    a boolean array; to_labels(result, FILE_SIZE_RESULTS) gives the strings.
+    """
+    sizes_in_bytes = np.asarray(sizes_in_bytes)
+    return (sizes_in_bytes >= 0) & (sizes_in_bytes <= MAX_FILE_SIZE)
+
+
+# 17
+LOAN_ELIGIBILITY_RULES = RuleTable(
+    ["income", "credit_score"],
+    [
+        {"when": {"income": {"below": 30000}}, "value": "Not Eligible"},
+        {
+            "when": {
+                "income": {"min": 30000, "max": 60000},
+                "credit_score": {"above": 700},
+            },
+            "value": "Standard Loan",
+        },
+        {"when": {"income": {"min": 30000, "max": 60000}}, "value": "Secured Loan"},
+        {"when": {"credit_score": {"above": 750}}, "value": "Premium Loan"},
+    ],
+    default="Standard Loan",
+)
+LOAN_RESULTS = LOAN_ELIGIBILITY_RULES.labels
+
+
+def check_loans_eligibility(incomes, credit_scores):
+    """
+    Checks which loan can be granted for every income and credit score,
+    like check_loan_eligibility. Returns result codes;
+    to_labels(result, LOAN_RESULTS) gives the strings.
+    """
+    return LOAN_ELIGIBILITY_RULES.codes(incomes, credit_scores)
+
+
+# 18
+def calculate_shipping_costs(weights, lengths, widths, heights):
+    """
+    Calculates the shipping cost of many packages from their weight and
+    dimension columns, like calculate_shipping_cost does for one package.
+    """
+    weights, lengths, widths, heights = np.broadcast_arrays(
+        weights, lengths, widths, heights
+    )
+    small = (weights <= 1) & (lengths <= 10) & (widths <= 10) & (heights <= 10)
+    medium = (
+        (1 < weights)
+        & (weights <= 5)
+        & (11 <= lengths)
+        & (lengths <= 30)
+        & (11 <= widths)
+        & (widths <= 30)
+        & (11 <= heights)
+        & (heights <= 30)
+    )
+    costs = np.select([small, medium], [5, 10], 20)
+    if costs.ndim == 0:
+        return int(costs)
+    return costs
+
+
+# 19
+QUIZ_GRADE_RULES = RuleTable(
+    ["correct_answers", "incorrect_answers"],
+    [
+        {
+            "when": {"correct_answers": {"min": 7}, "incorrect_answers": {"max": 2}},
+            "value": "Pass",
+        },
+        {
+            "when": {"correct_answers": {"min": 5}, "incorrect_answers": {"max": 3}},
+            "value": "Conditional Pass",
+        },
+    ],
+    default="Fail",
+)
+QUIZ_RESULTS = QUIZ_GRADE_RULES.labels
+
+
+def grade_quizzes(correct_answers, incorrect_answers):
+    """
+    Grades quizzes like grade_quiz. Returns result codes;
+    to_labels(result, QUIZ_RESULTS) gives the strings.
+    """
+    return QUIZ_GRADE_RULES.codes(correct_answers, incorrect_answers)
+
+
+# 21
+WEATHER_ADVISORY_RULES = RuleTable(
+    ["temperature", "humidity"],
+    [
+        {
+            "when": {"temperature": {"above": 30}, "humidity": {"above": 70}},
+            "value": "High Temperature and Humidity. Stay Hydrated.",
+        },
+        {"when": {"temperature": {"below": 0}}, "value": "Low Temperature. Bundle Up!"},
+    ],
+    default="No Specific Advisory",
+)
+WEATHER_RESULTS = WEATHER_ADVISORY_RULES.labels
+
+
+def get_weather_advisories(temperatures, humidities):
+    """
+    Gives the weather advisory of every temperature and humidity, like
+    get_weather_advisory. Returns result codes;
+    to_labels(result, WEATHER_RESULTS) gives the strings.
+    """
+    return WEATHER_ADVISORY_RULES.codes(temperatures, humidities)
@@ -1,9 +1,98 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=too-many-lines
 
 """
 White-box code examples.
+
+The batch and acceleration features built on these examples are available
+as attributes of this module too, but are only imported on first access:
+they pull in NumPy, process pools or asyncio, which short-lived programs
+calling a single function should not pay for.
 """
-import re
+import collections.abc
+import importlib
+import threading
+
+from . import events
+from .state_machine import StateMachine, transition
+from .tiers import TierTable
+
+# Module of every attribute loaded on first access.
+_LAZY_ATTRIBUTES = {
+    "vectorized": (
+        "AGE_RESULTS",
+        "CARD_RESULTS",
+        "DATE_RESULTS",
+        "EMAIL_RESULTS",
+        "FILE_SIZE_RESULTS",
+        "LOAN_RESULTS",
+        "NUMBER_STATUSES",
+        "QUIZ_RESULTS",
+        "TRIANGLE_RESULTS",
+        "URL_RESULTS",
+        "URL_SCHEMES",
+        "WEATHER_RESULTS",
+        "are_even",
+        "are_triangles",
+        "calculate_items_shipping_costs",
+        "calculate_order_totals",
+        "calculate_shipping_costs",
+        "celsius_to_fahrenheits",
+        "check_file_sizes",
+        "check_loans_eligibility",
+        "check_number_statuses",
+        "classify_url_schemes",
+        "convert_celsius_file",
+        "divide_arrays",
+        "get_weather_advisories",
+        "grade_quizzes",
+        "luhn_checks",
+        "to_labels",
+        "validate_credit_cards",
+        "validate_dates",
+        "validate_emails",
+        "validate_urls",
+        "verify_ages",
+    ),
+    "parallel": ("batch_map", "ordered_map"),
+    "cache": (
+        "memoize",
+        "cached_calculate_shipping_cost",
+        "cached_categorize_product",
+        "cached_check_loan_eligibility",
+        "cached_get_weather_advisory",
+    ),
+    "dense": (
+        "dense",
+        "dense_calculate_quantity_discount",
+        "dense_check_flight_eligibility",
+        "dense_get_grade",
+        "dense_grade_quiz",
+        "dense_verify_age",
+    ),
+    "rules": ("RuleTable",),
+    "fleet": ("MachineFleet",),
+    "async_banking": ("AsyncBankingSystem",),
+}
+_LAZY_MODULES = {
+    name: module for module, names in _LAZY_ATTRIBUTES.items() for name in names
+}
+
+
+def __getattr__(name):
+    """
+    Imports the lazily loaded attributes on first access.
+    """
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __package__), name)
+    globals()[name] = value  # Later accesses find it directly.
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
 
 
 def is_even(num):
@@ -23,19 +112,21 @@ def divide(a, b):
     return result
 
 
+GRADE_TIERS = TierTable(
+    [
+        {"min": 90, "value": "A"},
+        {"min": 80, "below": 90, "value": "B"},
+        {"min": 70, "below": 80, "value": "C"},
+    ],
+    default="F",
+)
+
+
 def get_grade(score):
     """
     Grade function.
     """
-    if score >= 90:
-        grade = "A"
-    elif score >= 80:
-        grade = "B"
-    elif score >= 70:
-        grade = "C"
-    else:
-        grade = "F"
-    return grade
+    return GRADE_TIERS.lookup(score)
 
 
 def is_triangle(a, b, c):
@@ -63,6 +154,12 @@ def check_number_status(number):
 
 
 # 2
+_UPPERCASE = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_LOWERCASE = frozenset("abcdefghijklmnopqrstuvwxyz")
+_DIGITS = frozenset("0123456789")
+_SPECIAL = frozenset("!@#$%&")
+
+
 def validate_password(password):
     """
     Validates user passwords.
@@ -72,30 +169,51 @@ def validate_password(password):
         return False
 
     # Check for at least one uppercase letter, one lowercase letter,
-    # one digit, and one special character.
+    # one digit, and one special character. The password is scanned once
+    # into a set of distinct characters and each class is tested on it.
+    chars = set(password)
     if (
-        not re.search(r"[A-Z]", password)
-        or not re.search(r"[a-z]", password)
-        or not re.search(r"\d", password)
-        or not re.search(r"[!@#$%&]", password)
+        chars.isdisjoint(_UPPERCASE)
+        or chars.isdisjoint(_LOWERCASE)
+        or chars.isdisjoint(_SPECIAL)
     ):
         return False
 
+    # Non-ASCII decimal digits count as digits too, like ``\d`` does.
+    if chars.isdisjoint(_DIGITS) and not any(char.isdecimal() for char in chars):
+        return False
+
     return True
 
 
+def validate_passwords(passwords):
+    """
+    Validates an iterable of passwords, yielding one result per password.
+    """
+    for password in passwords:
+        yield validate_password(password)
+
+
 # 3
+TOTAL_DISCOUNT_TIERS = TierTable(
+    [
+        {"below": 100, "value": 0},
+        {"min": 100, "max": 500, "value": 0.1},
+        {"above": 500, "value": 0.2},
+    ],
+    nan=0.2,
+)
+
+
 def calculate_total_discount(total_amount):
     """
     Calculates the discount for a customer's purchase based on the total amount.
     """
-    if total_amount < 100:
+    rate = TOTAL_DISCOUNT_TIERS.lookup(total_amount)
+    if not rate:
         return 0
 
-    if 100 <= total_amount <= 500:
-        return 0.1 * total_amount
-
-    return 0.2 * total_amount
+    return rate * total_amount
 
 
 # 4
@@ -175,20 +293,21 @@ def verify_age(age):
 
 
 # 8
+PRODUCT_CATEGORY_TIERS = TierTable(
+    [
+        {"min": 10, "max": 50, "value": "Category A"},
+        {"min": 51, "max": 100, "value": "Category B"},
+        {"min": 101, "max": 200, "value": "Category C"},
+    ],
+    default="Category D",
+)
+
+
 def categorize_product(price):
     """
     Determines the price category of a product based on its price.
     """
-    if 10 <= price <= 50:
-        return "Category A"
-
-    if 51 <= price <= 100:
-        return "Category B"
-
-    if 101 <= price <= 200:
-        return "Category C"
-
-    return "Category D"
+    return PRODUCT_CATEGORY_TIERS.lookup(price)
 
 
 # 9
@@ -225,16 +344,36 @@ def validate_credit_card(card_number):
 
 
 # 12
-def validate_date(year, month, day):
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def validate_date(year, month, day, strict=False):
     """
     Validates dates.
+
+    By default any day up to 31 is valid, as it always was; strict=True
+    checks the day against the length of the month, leap years included,
+    and rejects numbers that are not whole.
     """
     if 1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
-        return "Valid Date"
+        if not strict:
+            return "Valid Date"
+        if year % 1 == month % 1 == day % 1 == 0 and (
+            day <= DAYS_IN_MONTH[int(month) - 1]
+            or (month == 2 and day == 29 and _is_leap_year(year))
+        ):
+            return "Valid Date"
 
     return "Invalid Date"
 
 
+def _is_leap_year(year):
+    """
+    Checks if a year of the Gregorian calendar has a February 29.
+    """
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
 # 13
 def check_flight_eligibility(age, frequent_flyer):
     """
@@ -247,28 +386,38 @@ def check_flight_eligibility(age, frequent_flyer):
 
 
 # 14
-def validate_url(url):
+def validate_url(url, strict=False):
     """
     Validates URLs.
+
+    By default https URLs of any length are valid, as they always were;
+    strict=True applies the 255 character limit to them too.
     """
-    if len(url) <= 255 and url.startswith("http://") or url.startswith("https://"):
+    if url.startswith(("http://", "https://")) and (
+        # url[4] is "s" for https URLs and ":" for http ones.
+        len(url) <= 255
+        or (not strict and url[4] == "s")
+    ):
         return "Valid URL"
 
     return "Invalid URL"
 
 
 # 15
+QUANTITY_DISCOUNT_TIERS = TierTable(
+    [
+        {"min": 1, "max": 5, "value": "No Discount"},
+        {"min": 6, "max": 10, "value": "5% Discount"},
+    ],
+    default="10% Discount",
+)
+
+
 def calculate_quantity_discount(quantity):
     """
     Calculates discounts based on the quantity of a product.
     """
-    if 1 <= quantity <= 5:
-        return "No Discount"
-
-    if 6 <= quantity <= 10:
-        return "5% Discount"
-
-    return "10% Discount"
+    return QUANTITY_DISCOUNT_TIERS.lookup(quantity)
 
 
 # 16
@@ -283,23 +432,30 @@ def check_file_size(size_in_bytes):
 
 
 # 17
+_PREMIUM_LOAN_TIERS = TierTable(
+    [{"above": 750, "value": "Premium Loan"}], default="Standard Loan"
+)
+LOAN_ELIGIBILITY_TIERS = TierTable(
+    [
+        {"below": 30000, "value": "Not Eligible"},
+        {
+            "min": 30000,
+            "max": 60000,
+            "value": TierTable(
+                [{"above": 700, "value": "Standard Loan"}], default="Secured Loan"
+            ),
+        },
+        {"above": 60000, "value": _PREMIUM_LOAN_TIERS},
+    ],
+    nan=_PREMIUM_LOAN_TIERS,
+)
+
+
 def check_loan_eligibility(income, credit_score):
     """
     Checks if and which loan can be granted based on the income and credit score.
     """
-    if income < 30000:
-        return "Not Eligible"
-
-    if 30000 <= income <= 60000:
-        if credit_score > 700:
-            return "Standard Loan"
-
-        return "Secured Loan"
-
-    if credit_score > 750:
-        return "Premium Loan"
-
-    return "Standard Loan"
+    return LOAN_ELIGIBILITY_TIERS.lookup(income, credit_score)
 
 
 # 18
@@ -364,61 +520,62 @@ def get_weather_advisory(temperature, humidity):
 
 
 # 22
-class VendingMachine:
+class VendingMachine(StateMachine):
     """
     A simple vending machine that dispenses drinks.
     It has two states: "Ready" and "Dispensing."
     """
 
-    def __init__(self):
-        """
-        Defines the vending machine initial state.
-        """
-        self.state = "Ready"
+    __slots__ = ()
 
+    states = ("Ready", "Dispensing")
+    initial_state = "Ready"
+    transitions = {
+        "insert_coin": {
+            "Ready": ("Dispensing", "Coin Inserted. Select your drink."),
+        },
+        "select_drink": {
+            "Dispensing": ("Ready", "Drink Dispensed. Thank you!"),
+        },
+    }
+    invalid_result = "Invalid operation in current state."
+
+    @transition
     def insert_coin(self):
         """
         Function called when a coin is inserted.
         """
-        if self.state == "Ready":
-            self.state = "Dispensing"
-            return "Coin Inserted. Select your drink."
-
-        return "Invalid operation in current state."
 
+    @transition
     def select_drink(self):
         """
         Function called after selecting a drink.
         """
-        if self.state == "Dispensing":
-            self.state = "Ready"
-            return "Drink Dispensed. Thank you!"
-
-        return "Invalid operation in current state."
 
 
 # 23
-class TrafficLight:
+class TrafficLight(StateMachine):
     """
     A traffic light system with three states: "Green," "Yellow," and "Red."
     """
 
-    def __init__(self):
-        """
-        Defines the traffic light initial state.
-        """
-        self.state = "Red"
+    __slots__ = ()
+
+    states = ("Red", "Green", "Yellow")
+    initial_state = "Red"
+    transitions = {
+        "change_state": {
+            "Red": ("Green", None),
+            "Green": ("Yellow", None),
+            "Yellow": ("Red", None),
+        },
+    }
 
+    @transition
     def change_state(self):
         """
         Function that changes the traffic light state.
         """
-        if self.state == "Red":
-            self.state = "Green"
-        elif self.state == "Green":
-            self.state = "Yellow"
-        elif self.state == "Yellow":
-            self.state = "Red"
 
     def get_current_state(self):
         """
@@ -428,112 +585,100 @@ class TrafficLight:
 
 
 # 24
-class UserAuthentication:
+class UserAuthentication(StateMachine):
     """
     A user authentication system with states "Logged Out" and "Logged In."
     """
 
-    def __init__(self):
-        """
-        Defines the user initial state.
-        """
-        self.state = "Logged Out"
+    __slots__ = ()
 
+    states = ("Logged Out", "Logged In")
+    initial_state = "Logged Out"
+    transitions = {
+        "login": {"Logged Out": ("Logged In", "Login successful")},
+        "logout": {"Logged In": ("Logged Out", "Logout successful")},
+    }
+    invalid_result = "Invalid operation in current state"
+
+    @transition
     def login(self):
         """
         Function to login a user.
         """
-        if self.state == "Logged Out":
-            self.state = "Logged In"
-            return "Login successful"
-
-        return "Invalid operation in current state"
 
+    @transition
     def logout(self):
         """
         Function to logout a user.
         """
-        if self.state == "Logged In":
-            self.state = "Logged Out"
-            return "Logout successful"
-
-        return "Invalid operation in current state"
 
 
 # 25
-class DocumentEditingSystem:
+class DocumentEditingSystem(StateMachine):
     """
     A document editing system with states "Editing" and "Saved."
     """
 
-    def __init__(self):
-        """
-        Defines the initial state.
-        """
-        self.state = "Editing"
+    __slots__ = ()
+
+    states = ("Editing", "Saved")
+    initial_state = "Editing"
+    transitions = {
+        "save_document": {"Editing": ("Saved", "Document saved successfully")},
+        "edit_document": {"Saved": ("Editing", "Editing resumed")},
+    }
+    invalid_result = "Invalid operation in current state"
 
+    @transition
     def save_document(self):
         """
         Function to save a document.
         """
-        if self.state == "Editing":
-            self.state = "Saved"
-            return "Document saved successfully"
-
-        return "Invalid operation in current state"
 
+    @transition
     def edit_document(self):
         """
         Function to edit a document.
         """
-        if self.state == "Saved":
-            self.state = "Editing"
-            return "Editing resumed"
-
-        return "Invalid operation in current state"
 
 
 # 26
-class ElevatorSystem:
+class ElevatorSystem(StateMachine):
     """
     An elevator system with states "Idle," "Moving Up," and "Moving Down."
     """
 
-    def __init__(self):
-        """
-        Defines the elevator initial state.
-        """
-        self.state = "Idle"
+    __slots__ = ()
 
+    states = ("Idle", "Moving Up", "Moving Down")
+    initial_state = "Idle"
+    transitions = {
+        "move_up": {"Idle": ("Moving Up", "Elevator moving up")},
+        "move_down": {"Idle": ("Moving Down", "Elevator moving down")},
+        "stop": {
+            "Moving Up": ("Idle", "Elevator stopped"),
+            "Moving Down": ("Idle", "Elevator stopped"),
+        },
+    }
+    invalid_result = "Invalid operation in current state"
+
+    @transition
     def move_up(self):
         """
         Function to move up the elevator.
         """
-        if self.state == "Idle":
-            self.state = "Moving Up"
-            return "Elevator moving up"
-
-        return "Invalid operation in current state"
 
+    @transition
     def move_down(self):
         """
         Function to move down the elevator.
         """
-        if self.state == "Idle":
-            self.state = "Moving Down"
-            return "Elevator moving down"
-
-        return "Invalid operation in current state"
 
+    @transition
     def stop(self):
         """
         Function to stop the elevator.
         """
-        if self.state in ["Moving Up", "Moving Down"]:
-            self.state = "Idle"
-            return "Elevator stopped"
-
-        return "Invalid operation in current state"
 
 
 # 27
@@ -542,45 +687,104 @@ class BankAccount:  # pylint: disable=too-few-public-methods
     Bank account class.
     """
 
-    def __init__(self, account_number, balance):
+    def __init__(self, account_number, balance, sink=None):
         """
-        Set the bank account details.
+        Set the bank account details. Events go to sink, or to the default
+        event sink when it is None.
         """
         self.account_number = account_number
         self.balance = balance
+        self.sink = sink
 
     def view_account(self):
         """
         Function to display the account details.
         """
-        print(f"The account {self.account_number} has a balance of {self.balance}")
+        events.emit(
+            self.sink,
+            "account.viewed",
+            "The account {account_number} has a balance of {balance}",
+            account_number=self.account_number,
+            balance=self.balance,
+        )
 
 
 class BankingSystem:
     """
     Banking system class.
+
+    Safe to share between threads. Per-user state is guarded by a fixed set
+    of striped locks, so operations on unrelated users do not contend.
     """
 
-    def __init__(self):
+    initial_balance = 1000
+    lock_stripes = 64
+
+    def __init__(self, sink=None):
         """
-        Mock users.
+        Mock users. Events go to sink, or to the default event sink when it
+        is None.
         """
         self.users = {"user123": "pass123"}  # Simplified user database
         self.logged_in_users = set()
+        self.accounts = {}
+        self.sink = sink
+        self._locks = [threading.Lock() for _ in range(self.lock_stripes)]
+        self._fees = [0] * self.lock_stripes
+
+    @property
+    def fees_collected(self):
+        """
+        Total fees charged on processed transfers.
+        """
+        return sum(self._fees)
+
+    def _stripe(self, username):
+        """
+        Index of the lock guarding the user state.
+        """
+        return hash(username) % self.lock_stripes
+
+    def _account(self, username):
+        """
+        Returns the user account, opening it with the initial balance on first
+        use. The caller must hold the user lock.
+        """
+        account = self.accounts.get(username)
+        if account is None:
+            account = BankAccount(username, self.initial_balance, self.sink)
+            self.accounts[username] = account
+        return account
 
     def authenticate(self, username, password):
         """
         User authentication function.
         """
         if username in self.users and self.users[username] == password:
-            if username not in self.logged_in_users:
-                self.logged_in_users.add(username)
-                print(f"User {username} authenticated successfully.")
+            with self._locks[self._stripe(username)]:
+                logged_in = username not in self.logged_in_users
+                if logged_in:
+                    self.logged_in_users.add(username)
+
+            if logged_in:
+                events.emit(
+                    self.sink,
+                    "auth.succeeded",
+                    "User {username} authenticated successfully.",
+                    username=username,
+                )
                 return True
 
-            print("User already logged in.")
+            events.emit(
+                self.sink,
+                "auth.already_logged_in",
+                "User already logged in.",
+                username=username,
+            )
         else:
-            print("Authentication failed.")
+            events.emit(
+                self.sink, "auth.failed", "Authentication failed.", username=username
+            )
 
         return False
 
@@ -589,7 +793,22 @@ class BankingSystem:
         Function to perform a money transfer.
         """
         if sender not in self.logged_in_users:
-            print("Sender not authenticated.")
+            events.emit(
+                self.sink,
+                "transfer.unauthenticated",
+                "Sender not authenticated.",
+                sender=sender,
+            )
+            return False
+
+        if not amount > 0:  # Also rejects NaN.
+            events.emit(
+                self.sink,
+                "transfer.invalid_amount",
+                "Invalid transfer amount.",
+                sender=sender,
+                amount=amount,
+            )
             return False
 
         # Simulate transaction processing logic
@@ -600,17 +819,52 @@ class BankingSystem:
         elif transaction_type == "scheduled":
             fee = 0.01 * amount
         else:
-            print("Invalid transaction type.")
+            events.emit(
+                self.sink,
+                "transfer.invalid_type",
+                "Invalid transaction type.",
+                transaction_type=transaction_type,
+            )
             return False
 
-        # Simulate checking for sufficient funds
-        if BankAccount(sender, 1000).balance < (amount + fee):
-            print("Insufficient funds.")
+        # Lock both users in stripe order so concurrent transfers in opposite
+        # directions cannot deadlock.
+        sender_stripe = self._stripe(sender)
+        stripes = sorted({sender_stripe, self._stripe(receiver)})
+        for stripe in stripes:
+            self._locks[stripe].acquire()
+        try:
+            sender_account = self._account(sender)
+            funded = sender_account.balance >= amount + fee
+            if funded:
+                sender_account.balance -= amount + fee
+                self._account(receiver).balance += amount
+                self._fees[sender_stripe] += fee
+        finally:
+            for stripe in reversed(stripes):
+                self._locks[stripe].release()
+
+        if not funded:
+            events.emit(
+                self.sink,
+                "transfer.insufficient_funds",
+                "Insufficient funds.",
+                sender=sender,
+                amount=amount,
+                fee=fee,
+            )
             return False
 
-        print(
-            f"Money transfer of ${amount} ({transaction_type} transfer)"
-            f" from {sender} to {receiver} processed successfully."
+        events.emit(
+            self.sink,
+            "transfer.processed",
+            "Money transfer of ${amount} ({transaction_type} transfer)"
+            " from {sender} to {receiver} processed successfully.",
+            sender=sender,
+            receiver=receiver,
+            amount=amount,
+            fee=fee,
+            transaction_type=transaction_type,
         )
         return True
 
@@ -621,64 +875,193 @@ class Product:  # pylint: disable=too-few-public-methods
     Product class.
     """
 
-    def __init__(self, name, price):
+    def __init__(self, name, price, sink=None):
         """
-        Set the product details.
+        Set the product details. Events go to sink, or to the default event
+        sink when it is None.
         """
         self.name = name
         self.price = price
+        self.sink = sink
 
     def view_product(self):
         """
         Function to display the product details.
         """
         msg = f"The product {self.name} has a price of {self.price}"
-        print(msg)
+        events.emit(
+            self.sink,
+            "product.viewed",
+            "The product {name} has a price of {price}",
+            name=self.name,
+            price=self.price,
+        )
         return msg
 
 
+class _CartItems(collections.abc.MutableSequence):
+    """
+    Items of a shopping cart, usable as a list.
+
+    The items are kept in an insertion-ordered dict under increasing keys,
+    with the keys of the items of each product, so appending an item and
+    removing the first item of a product take constant time and keep the
+    order of the others. Changes by position rebuild the dict.
+    """
+
+    def __init__(self, items=()):
+        """
+        Lists items.
+        """
+        self._items = {}
+        self._keys = {}  # Product: dict of the keys of its items, in order.
+        self._next_key = 0
+        self.extend(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __getitem__(self, position):
+        return list(self._items.values())[position]
+
+    def __setitem__(self, position, value):
+        items = list(self._items.values())
+        items[position] = value
+        self._replace(items)
+
+    def __delitem__(self, position):
+        items = list(self._items.values())
+        del items[position]
+        self._replace(items)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _CartItems)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reversed__(self):
+        return reversed(list(self._items.values()))
+
+    def index(self, value, start=0, stop=None):
+        items = list(self._items.values())
+        return items.index(value, start, len(items) if stop is None else stop)
+
+    def insert(self, index, value):
+        items = list(self._items.values())
+        items.insert(index, value)
+        self._replace(items)
+
+    def append(self, value):
+        key = self._next_key
+        self._next_key += 1
+        self._items[key] = value
+        self._keys.setdefault(value["product"], {})[key] = None
+
+    def clear(self):
+        self._items.clear()
+        self._keys.clear()
+
+    def _replace(self, items):
+        """
+        Replaces every item with items.
+        """
+        self.clear()
+        for item in items:
+            self.append(item)
+
+    def find(self, product):
+        """
+        Returns the first item of product, or None.
+        """
+        keys = self._keys.get(product)
+        return self._items[next(iter(keys))] if keys else None
+
+    def remove_first(self, product):
+        """
+        Removes the first item of product, which must be listed.
+        """
+        keys = self._keys[product]
+        key = next(iter(keys))
+        del keys[key]
+        if not keys:
+            del self._keys[product]
+        del self._items[key]
+
+
 class ShoppingCart:
     """
     Shopping cart class.
+
+    items lists the cart content. It keeps the items by product, so adding
+    and removing products do not have to scan the whole cart. A plain list
+    assigned to items works too, without the index.
     """
 
-    def __init__(self):
+    def __init__(self, sink=None):
+        """
+        Initialize the shopping cart. Events go to sink, or to the default
+        event sink when it is None.
+        """
+        self.items = _CartItems()
+        self.sink = sink
+
+    def _find(self, product):
         """
-        Initialize the shopping cart.
+        Returns the first item of product, or None.
         """
-        self.items = []
+        items = self.items
+        if isinstance(items, _CartItems):
+            return items.find(product)
+        for item in items:
+            if item["product"] == product:
+                return item
+        return None
 
     def add_product(self, product, quantity=1):
         """
         Function to add a product to the shopping cart.
         """
-        for item in self.items:
-            if item["product"] == product:
-                item["quantity"] += quantity
-                break
-        else:
-            self.items.append({"product": product, "quantity": quantity})
+        item = self._find(product)
+        if item is not None:
+            item["quantity"] += quantity
+            return
+
+        self.items.append({"product": product, "quantity": quantity})
 
     def remove_product(self, product, quantity=1):
         """
         Function to remove a product from the shopping cart.
         """
-        for item in self.items:
-            if item["product"] == product:
-                if item["quantity"] <= quantity:
-                    self.items.remove(item)
-                else:
-                    item["quantity"] -= quantity
-                break
+        item = self._find(product)
+        if item is None:
+            return
+
+        if item["quantity"] <= quantity:
+            if isinstance(self.items, _CartItems):
+                self.items.remove_first(product)
+            else:
+                self.items.remove(item)
+        else:
+            item["quantity"] -= quantity
 
     def view_cart(self):
         """
         Function to display the shopping cart content.
         """
         for item in self.items:
-            print(
-                f"{item['quantity']} x {item['product'].name}"
-                f" - ${item['product'].price * item['quantity']}"
+            events.emit(
+                self.sink,
+                "cart.item",
+                "{quantity} x {name} - ${subtotal}",
+                quantity=item["quantity"],
+                name=item["product"].name,
+                subtotal=item["product"].price * item["quantity"],
             )
 
     def checkout(self):
@@ -686,5 +1069,10 @@ class ShoppingCart:
         Function to checkout the items from the shopping cart.
         """
         total = sum(item["product"].price * item["quantity"] for item in self.items)
-        print(f"Total: ${total}")
-        print("Checkout completed. Thank you for shopping!")
+        events.emit(self.sink, "cart.total", "Total: ${total}", total=total)
+        events.emit(
+            self.sink,
+            "cart.checkout_completed",
+            "Checkout completed. Thank you for shopping!",
+            total=total,
+        )
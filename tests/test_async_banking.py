@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the asyncio banking front-end.
+"""
+import asyncio
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from src.async_banking import AsyncBankingSystem
+
+
+class TestAsyncBankingSystem(unittest.IsolatedAsyncioTestCase):
+    """
+    Async banking system unittest class.
+    """
+
+    async def asyncSetUp(self):
+        self.output = io.StringIO()
+        self.enterContext(redirect_stdout(self.output))
+        self.bank = AsyncBankingSystem(max_batch=4)
+
+    async def asyncTearDown(self):
+        await self.bank.close()
+
+    async def test_authenticate(self):
+        """
+        Checks authentication runs the synchronous checks.
+        """
+        self.assertTrue(await self.bank.authenticate("user123", "pass123"))
+        self.assertFalse(await self.bank.authenticate("user123", "pass123"))
+        self.assertFalse(await self.bank.authenticate("user123", "wrongpass"))
+
+    async def test_transfer_money(self):
+        """
+        Checks a single transfer result and its effect on the balances.
+        """
+        await self.bank.authenticate("user123", "pass123")
+        self.assertTrue(
+            await self.bank.transfer_money("user123", "receiver", 100, "regular")
+        )
+        self.assertFalse(
+            await self.bank.transfer_money("user123", "receiver", 100, "unknown")
+        )
+        self.assertEqual(self.bank.banking.accounts["receiver"].balance, 1100)
+
+    async def test_transfers_in_batches_keep_order(self):
+        """
+        Checks concurrent transfers are applied in submission order.
+        """
+        await self.bank.authenticate("user123", "pass123")
+        futures = [
+            self.bank.submit_transfer("user123", "receiver", 100, "regular")
+            for _ in range(10)
+        ]
+        results = await asyncio.gather(*futures)
+        self.assertEqual(results, [True] * 9 + [False])
+        self.assertIn("Insufficient funds.", self.output.getvalue())
+
+    async def test_transfer_error(self):
+        """
+        Checks an exception is raised from the future of the failing transfer.
+        """
+        await self.bank.authenticate("user123", "pass123")
+        bad = self.bank.submit_transfer("user123", "receiver", "100", "regular")
+        good = self.bank.submit_transfer("user123", "receiver", 100, "regular")
+        with self.assertRaises(TypeError):
+            await bad
+        self.assertTrue(await good)
+
+    async def test_submit_after_close(self):
+        """
+        Checks transfers are refused once the system is closed.
+        """
+        await self.bank.close()
+        with self.assertRaises(RuntimeError):
+            self.bank.submit_transfer("user123", "receiver", 100, "regular")
+
+    async def test_worker_failure_fails_queued_transfers(self):
+        """
+        Checks a failure outside the transfers fails the batch and the queue.
+        """
+        await self.bank.authenticate("user123", "pass123")
+        self.bank.max_batch = 1
+        self.bank._executor.shutdown()  # pylint: disable=protected-access
+        futures = [
+            self.bank.submit_transfer("user123", "receiver", 100, "regular")
+            for _ in range(3)
+        ]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                await asyncio.wait_for(future, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
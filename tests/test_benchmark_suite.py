@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the benchmark suite.
+"""
+import inspect
+import unittest
+
+from benchmarks.suite import CASES, compare, measure
+from src import white_box
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """
+    Benchmark suite unittest class.
+    """
+
+    def test_every_public_callable_has_a_case(self):
+        """
+        Checks each public function and class of white_box is benchmarked.
+        """
+        public = {
+            name
+            for name, obj in vars(white_box).items()
+            if not name.startswith("_")
+            and (inspect.isfunction(obj) or inspect.isclass(obj))
+            and obj.__module__ == white_box.__name__
+        }
+        benchmarked = {case.name.split(".")[0] for case in CASES}
+        self.assertEqual(public - benchmarked, set())
+
+    def test_measure(self):
+        """
+        Checks a case runs and reports positive timings.
+        """
+        result = measure(CASES[0], 10, repeat=1, min_time=0)
+        self.assertGreater(result["best_ns"], 0)
+        self.assertGreaterEqual(result["mean_ns"], result["best_ns"])
+
+    def test_compare(self):
+        """
+        Checks only slowdowns beyond the threshold are reported.
+        """
+        baseline = {"results": {"a": {"best_ns": 100}, "b": {"best_ns": 100}}}
+        current = {
+            "results": {
+                "a": {"best_ns": 115},
+                "b": {"best_ns": 130},
+                "c": {"best_ns": 500},
+            }
+        }
+        self.assertEqual(compare(baseline, current, 0.2), [("b", 100, 130)])
+        self.assertEqual(compare(baseline, current, 0.5), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
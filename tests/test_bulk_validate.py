@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the bulk validator command line.
+"""
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from src.bulk_validate import (
+    ERROR_FIELD,
+    INVALID_FIELD,
+    bulk_validate,
+    main,
+    parse_check,
+)
+
+CSV_INPUT = (
+    "email,card,year,month,day\n"
+    "ana@example.com,4111111111111111,2024,2,28\n"
+    '"no at, here",12ab,1800,13,1\n'
+    "bob@example.org,,2000,,\n"
+)
+
+
+class TestBulkValidate(unittest.TestCase):
+    """
+    Bulk validator unittest class.
+    """
+
+    def test_parse_check(self):
+        """
+        Checks check specs are parsed, with and without an explicit name.
+        """
+        self.assertEqual(parse_check("email:mail"), ("email_mail", "email", ("mail",)))
+        self.assertEqual(parse_check("d=date:y,m,d"), ("d", "date", ("y", "m", "d")))
+        for spec in ("email", "phone:number", "date:"):
+            with self.assertRaises(ValueError):
+                parse_check(spec)
+
+    def test_csv(self):
+        """
+        Checks CSV records get one result column per check, in order.
+        """
+        checks = [parse_check("email:email"), parse_check("date:year,month,day")]
+        for workers in (1, 2):
+            output = io.StringIO()
+            bulk_validate(
+                io.StringIO(CSV_INPUT),
+                output,
+                "csv",
+                checks,
+                chunk_size=1,
+                workers=workers,
+            )
+            self.assertEqual(
+                output.getvalue().splitlines(),
+                [
+                    "email,card,year,month,day,email_email,date_year_month_day",
+                    "ana@example.com,4111111111111111,2024,2,28,Valid Email,Valid Date",
+                    '"no at, here",12ab,1800,13,1,Invalid Email,Invalid Date',
+                    "bob@example.org,,2000,,,Valid Email,Invalid Date",
+                ],
+            )
+
+    def test_csv_unknown_column(self):
+        """
+        Checks checks on columns the file does not have are rejected.
+        """
+        with self.assertRaises(ValueError):
+            bulk_validate(
+                io.StringIO(CSV_INPUT), io.StringIO(), "csv", [parse_check("url:url")]
+            )
+
+    def test_jsonl_command_line(self):
+        """
+        Checks the command line validates a JSONL file into an output file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "input.jsonl")
+            target = os.path.join(directory, "output.jsonl")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write('{"card": "4111111111111111", "user": "alice"}\n\n')
+                file.write('{"card": 4111111111111111, "pass": "password1"}\n')
+            with redirect_stdout(io.StringIO()):
+                main(
+                    [
+                        source,
+                        "--output",
+                        target,
+                        "--check",
+                        "card_ok=credit_card:card",
+                        "--check",
+                        "login:user,pass",
+                    ]
+                )
+            with open(target, encoding="utf-8") as file:
+                records = [json.loads(line) for line in file]
+        self.assertEqual(
+            [(r["card_ok"], r["login_user_pass"]) for r in records],
+            [("Valid Card", "Login Failed"), ("Valid Card", "Login Failed")],
+        )
+
+    def test_jsonl_invalid_lines(self):
+        """
+        Checks lines that are not JSON objects are reported in place and
+        counted instead of stopping the run.
+        """
+        source = io.StringIO(
+            '{"email": "ana@example.com"}\n[1, 2]\n{"email": \n"x"\n'
+            '{"email": "bob"}\n'
+        )
+        checks = [parse_check("email:email")]
+        for workers in (1, 2):
+            source.seek(0)
+            target = io.StringIO()
+            self.assertEqual(
+                bulk_validate(source, target, "jsonl", checks, 2, workers), 3
+            )
+            records = [json.loads(line) for line in target.getvalue().splitlines()]
+            self.assertEqual(records[0]["email_email"], "Valid Email")
+            self.assertEqual(
+                [r.get(INVALID_FIELD) for r in records[1:4]],
+                ["[1, 2]", '{"email": ', '"x"'],
+            )
+            self.assertTrue(all(ERROR_FIELD in r for r in records[1:4]))
+            self.assertEqual(records[4]["email_email"], "Invalid Email")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.jsonl")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(source.getvalue())
+            stderr = io.StringIO()
+            with redirect_stdout(io.StringIO()), redirect_stderr(stderr):
+                self.assertEqual(main([path, "--check", "email:email"]), 0)
+        self.assertIn("3 invalid JSONL lines", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the memoization layer.
+"""
+import unittest
+
+from src.cache import cached_check_loan_eligibility, memoize
+from src.white_box import check_loan_eligibility
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """
+    Manually advanced clock.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemoize(unittest.TestCase):
+    """
+    Memoization unittest class.
+    """
+
+    def test_hits_and_misses(self):
+        """
+        Checks repeated arguments are served from the cache.
+        """
+        calls = []
+
+        @memoize(maxsize=4)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual([square(2), square(3), square(2), square(x=2)], [4, 9, 4, 4])
+        self.assertEqual(calls, [2, 3, 2])
+        info = square.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 3, 3))
+
+    def test_keyword_arguments_key(self):
+        """
+        Checks keyword arguments are not mistaken for positional tuples.
+        """
+
+        @memoize()
+        def arguments(*args, **kwargs):
+            return args, kwargs
+
+        self.assertEqual(arguments((), x=1), (((),), {"x": 1}))
+        self.assertEqual(arguments((), (("x", 1),)), (((), (("x", 1),)), {}))
+        self.assertEqual(arguments(x=1, y=2), arguments(y=2, x=1))
+        self.assertEqual(arguments.cache_info().hits, 1)
+
+    def test_lru_eviction(self):
+        """
+        Checks the least recently used result is evicted first.
+        """
+        calls = []
+
+        @memoize(maxsize=2)
+        def identity(x):
+            calls.append(x)
+            return x
+
+        for x in (1, 2, 1, 3, 1, 2):
+            identity(x)
+        self.assertEqual(calls, [1, 2, 3, 2])
+        self.assertEqual(identity.cache_info().evictions, 2)
+
+    def test_ttl_expiration(self):
+        """
+        Checks results are recomputed once their time to live has passed.
+        """
+        clock = FakeClock()
+        calls = []
+
+        @memoize(ttl=10, clock=clock)
+        def identity(x):
+            calls.append(x)
+            return x
+
+        identity(1)
+        clock.now = 9.9
+        identity(1)
+        clock.now = 10.0
+        identity(1)
+        self.assertEqual(calls, [1, 1])
+        info = identity.cache_info()
+        self.assertEqual((info.hits, info.misses, info.expirations), (1, 2, 1))
+
+        identity.cache_clear()
+        self.assertEqual(identity.cache_info().currsize, 0)
+        self.assertEqual(identity.cache_info().hits, 0)
+
+    def test_cached_variant(self):
+        """
+        Checks a cached white-box variant returns the original results.
+        """
+        for income, score in [(25000, 800), (45000, 720), (80000, 700)] * 2:
+            self.assertEqual(
+                cached_check_loan_eligibility(income, score),
+                check_loan_eligibility(income, score),
+            )
+        self.assertGreaterEqual(cached_check_loan_eligibility.cache_info().hits, 3)
+        self.assertEqual(
+            cached_check_loan_eligibility.__name__, "check_loan_eligibility"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
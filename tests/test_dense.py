@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the dense lookup tables.
+"""
+import itertools
+import unittest
+
+import numpy as np
+
+from src import dense as tables
+from src.dense import dense
+from src.white_box import (
+    calculate_quantity_discount,
+    check_flight_eligibility,
+    get_grade,
+    grade_quiz,
+    verify_age,
+)
+
+
+class TestDense(unittest.TestCase):
+    """
+    Dense lookup table unittest class.
+    """
+
+    def test_white_box_tables_match(self):
+        """
+        Checks every table matches its function inside and around its domain,
+        for single calls and arrays.
+        """
+        for table, func, domains in (
+            (tables.dense_get_grade, get_grade, [range(-5, 110)]),
+            (tables.dense_grade_quiz, grade_quiz, [range(-2, 24), range(-2, 24)]),
+            (tables.dense_verify_age, verify_age, [range(-3, 140)]),
+            (
+                tables.dense_calculate_quantity_discount,
+                calculate_quantity_discount,
+                [range(-3, 1010)],
+            ),
+            (
+                tables.dense_check_flight_eligibility,
+                check_flight_eligibility,
+                [range(-3, 140), [False, True]],
+            ),
+        ):
+            rows = list(itertools.product(*domains))
+            expected = [func(*row) for row in rows]
+            self.assertEqual([table(*row) for row in rows], expected)
+            columns = [np.array(column) for column in zip(*rows)]
+            self.assertEqual(table.lookup_array(*columns).tolist(), expected)
+            self.assertEqual(table.__name__, func.__name__)
+
+    def test_fallback(self):
+        """
+        Checks out-of-domain and non-integer arguments are computed by the
+        function, one at a time or in arrays.
+        """
+        calls = []
+
+        @dense(range(0, 3), range(0, 3), range(0, 3))
+        def total(a, b, c):
+            calls.append((a, b, c))
+            return a + b + c
+
+        self.assertEqual(total(1, 2, 2), 5)
+        self.assertEqual(len(calls), 27)  # The table was built on first use.
+        self.assertEqual([total(1, 2, 3), total(1, 2, 0.5)], [6, 3.5])
+        self.assertEqual(calls[27:], [(1, 2, 3), (1, 2, 0.5)])
+
+        codes = total.codes(np.array([0, 5]), 1, np.array([2.0, 1.0]))
+        self.assertEqual(total.labels()[codes].tolist(), [3.0, 7.0])
+        self.assertEqual(
+            total.lookup_array(np.array([[0], [2]]), np.array([1, 2]), 2).tolist(),
+            [[3, 4], [5, 6]],
+        )
+        self.assertEqual(calls[-1], (5, 1, 1.0))
+
+    def test_invalid_domains(self):
+        """
+        Checks domains must be ranges of step 1 and arrays one per domain.
+        """
+        with self.assertRaises(ValueError):
+            dense(range(0, 10, 2))
+        with self.assertRaises(TypeError):
+            tables.dense_grade_quiz.codes(np.arange(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
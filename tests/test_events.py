@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the structured event sinks.
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from src import events
+from src.white_box import BankAccount, BankingSystem, Product, ShoppingCart
+
+
+class TestEvents(unittest.TestCase):
+    """
+    Event sinks unittest class.
+    """
+
+    def test_default_sink_prints_messages(self):
+        """
+        Checks the default sink prints the same lines the classes used to.
+        """
+        cart = ShoppingCart()
+        cart.add_product(Product("Laptop", 1000), 2)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            BankAccount("ACC-1", 250).view_account()
+            cart.view_cart()
+            cart.checkout()
+        self.assertEqual(
+            output.getvalue().splitlines(),
+            [
+                "The account ACC-1 has a balance of 250",
+                "2 x Laptop - $2000",
+                "Total: $2000",
+                "Checkout completed. Thank you for shopping!",
+            ],
+        )
+
+    def test_ring_buffer_sink(self):
+        """
+        Checks the ring buffer keeps only the latest structured events.
+        """
+        sink = events.RingBufferSink(capacity=2)
+        bs = BankingSystem(sink=sink)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            bs.authenticate("user123", "wrongpass")
+            bs.authenticate("user123", "pass123")
+            bs.transfer_money("user123", "receiver", 100, "regular")
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(
+            [event.name for event in sink.events],
+            ["auth.succeeded", "transfer.processed"],
+        )
+        self.assertEqual(sink.events[1].fields["fee"], 2.0)
+        self.assertEqual(
+            sink.messages()[1],
+            "Money transfer of $100 (regular transfer)"
+            " from user123 to receiver processed successfully.",
+        )
+
+    def test_set_default_sink(self):
+        """
+        Checks objects without a sink follow the default sink.
+        """
+        product = Product("Laptop", 1000)
+        previous = events.set_default_sink(events.NullSink())
+        try:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                msg = product.view_product()
+            self.assertEqual(msg, "The product Laptop has a price of 1000")
+            self.assertEqual(output.getvalue(), "")
+        finally:
+            events.set_default_sink(previous)
+
+    def test_batching_sink(self):
+        """
+        Checks the batching sink writes every event, in order, from its thread.
+        """
+        stream = io.StringIO()
+        sink = events.BatchingSink(
+            stream, formatter=lambda event: json.dumps(event.as_dict()), batch_size=3
+        )
+        for i in range(10):
+            BankAccount(f"ACC-{i}", i, sink=sink).view_account()
+        sink.flush()
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([line["account_number"] for line in lines][-1], "ACC-9")
+        self.assertEqual(len(lines), 10)
+        BankAccount("ACC-10", 10, sink=sink).view_account()
+        sink.close()
+        self.assertEqual(len(stream.getvalue().splitlines()), 11)
+        BankAccount("ACC-11", 11, sink=sink).view_account()
+        self.assertEqual(sink.dropped, 1)
+        self.assertEqual(len(stream.getvalue().splitlines()), 11)
+
+    def test_batching_sink_write_errors(self):
+        """
+        Checks batches the formatter or the stream fails on are counted and
+        later batches still written.
+        """
+
+        def formatter(event):
+            if event.fields["n"] == 1:
+                raise KeyError("n")
+            return event.message
+
+        stream = io.StringIO()
+        sink = events.BatchingSink(stream, formatter=formatter)
+        for n in range(3):
+            events.emit(sink, "note", "note {n}", n=n)
+            sink.flush()
+        self.assertEqual(stream.getvalue(), "note 0\nnote 2\n")
+        self.assertEqual(sink.failed, 1)
+        stream.close()
+        events.emit(sink, "note", "note {n}", n=3)
+        sink.close()
+        self.assertEqual(sink.failed, 2)
+
+    def test_batching_sink_thread_stopped(self):
+        """
+        Checks the sink closes, and flush returns, when its thread stops.
+        """
+
+        def formatter(event):
+            raise SystemExit(event.fields["n"])
+
+        with mock.patch("threading.excepthook"):
+            sink = events.BatchingSink(io.StringIO(), formatter=formatter, interval=60)
+            events.emit(sink, "note", "note {n}", n=0)
+            events.emit(sink, "note", "note {n}", n=1)
+            sink.flush()
+            sink.flush()
+        events.emit(sink, "note", "note {n}", n=2)
+        self.assertEqual(sink.dropped, 1)
+        sink.close()
+
+    def test_batching_sink_flushed_at_exit(self):
+        """
+        Checks events still pending when the interpreter exits are written.
+        """
+        code = (
+            "from src import events\n"
+            "sink = events.BatchingSink(interval=60)\n"
+            "events.emit(sink, 'note', 'pending {n}', n=1)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            text=True,
+        )
+        self.assertEqual(result.stdout, "pending 1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
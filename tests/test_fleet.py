@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the state-machine fleets.
+"""
+import unittest
+
+import numpy as np
+
+from src.fleet import NO_COMMAND, MachineFleet
+from src.white_box import ElevatorSystem, TrafficLight
+
+
+class TestMachineFleet(unittest.TestCase):
+    """
+    Machine fleet unittest class.
+    """
+
+    def test_traffic_light_fleet_cycle(self):
+        """
+        Checks firing an event moves every traffic light to its next state.
+        """
+        fleet = MachineFleet(TrafficLight, 5)
+        self.assertEqual(fleet.states.dtype, np.int8)
+        fleet.fire("change_state")
+        self.assertEqual(fleet.state_counts(), {"Red": 0, "Green": 5, "Yellow": 0})
+        fleet.fire("change_state")
+        fleet.fire("change_state")
+        self.assertEqual(list(fleet.state_names()), ["Red"] * 5)
+
+    def test_elevator_fleet_matches_machines(self):
+        """
+        Checks random command vectors give the same results and states as
+        individual elevators.
+        """
+        rng = np.random.default_rng(0)
+        fleet = MachineFleet(ElevatorSystem, 50)
+        elevators = [ElevatorSystem() for _ in range(50)]
+        for _ in range(20):
+            commands = rng.integers(-1, len(fleet.events), 50).astype(np.int8)
+            messages = fleet.messages(fleet.step(commands))
+            for elevator, command, message in zip(elevators, commands, messages):
+                expected = (
+                    None
+                    if command == NO_COMMAND
+                    else getattr(elevator, fleet.events[command])()
+                )
+                self.assertEqual(message, expected)
+            self.assertEqual(
+                list(fleet.state_names()), [elevator.state for elevator in elevators]
+            )
+
+    def test_encode_and_errors(self):
+        """
+        Checks event names are encoded and mismatched commands are rejected.
+        """
+        fleet = MachineFleet(ElevatorSystem, 3, state="Moving Up")
+        commands = fleet.encode(["stop", None, "move_down"])
+        self.assertEqual(
+            list(fleet.messages(fleet.step(commands))),
+            ["Elevator stopped", None, "Invalid operation in current state"],
+        )
+        self.assertEqual(fleet.state_counts()["Idle"], 1)
+        with self.assertRaises(ValueError):
+            fleet.step(commands[:2])
+
+    def test_invalid_command_codes(self):
+        """
+        Checks codes other than event codes and NO_COMMAND are rejected.
+        """
+        fleet = MachineFleet(ElevatorSystem, 2)
+        for code in (3, 4, -2, -5, 300):
+            with self.assertRaises(ValueError):
+                fleet.step(np.array([code, NO_COMMAND]))
+        with self.assertRaises(ValueError):
+            fleet.step(np.array([0.0, 1.0]))
+        self.assertEqual(fleet.state_counts()["Idle"], 2)
+        fleet.step(np.array([0, 2], dtype=np.uint8))
+        self.assertEqual(fleet.state_names().tolist(), ["Moving Up", "Idle"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the call instrumentation.
+"""
+import inspect
+import json
+import threading
+import unittest
+
+from src import metrics
+from src import white_box as wb
+
+
+class TestMetrics(unittest.TestCase):
+    """
+    Unit tests for the call instrumentation.
+    """
+
+    def setUp(self):
+        metrics.reset()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_bucket_bounds(self):
+        """
+        Buckets are contiguous and contain their bounds.
+        """
+        self.assertEqual(metrics.bucket_bounds(5), (5, 5))
+        for index in range(metrics.BUCKET_COUNT - 1):
+            lowest, highest = metrics.bucket_bounds(index)
+            self.assertEqual(metrics.bucket_index(lowest), index)
+            self.assertEqual(metrics.bucket_index(highest), index)
+            self.assertEqual(metrics.bucket_bounds(index + 1)[0], highest + 1)
+            if lowest >= 2 ** (metrics.SUB_BUCKET_BITS + 1):
+                self.assertLess((highest - lowest) / lowest, 0.04)
+
+    def test_enable_disable(self):
+        """
+        disable() restores the original functions and methods.
+        """
+        get_grade = wb.get_grade
+        change_state = wb.TrafficLight.change_state
+        with metrics.instrumented():
+            self.assertTrue(metrics.is_enabled())
+            self.assertIsNot(wb.get_grade, get_grade)
+            self.assertIs(inspect.unwrap(wb.get_grade), get_grade)
+            self.assertEqual(wb.get_grade(95), "A")
+        self.assertFalse(metrics.is_enabled())
+        self.assertIs(wb.get_grade, get_grade)
+        self.assertIs(wb.TrafficLight.change_state, change_state)
+
+    def test_counts_calls(self):
+        """
+        Calls of functions and state machine methods are counted, including
+        those raising.
+        """
+        with metrics.instrumented():
+            for score in range(100):
+                wb.get_grade(score)
+            light = wb.TrafficLight()
+            light.change_state()
+            self.assertEqual(light.get_current_state(), "Green")
+            with self.assertRaises(TypeError):
+                wb.divide("a", 2)
+        wb.get_grade(50)  # Not recorded once disabled.
+
+        stats = metrics.snapshot()
+        self.assertEqual(stats["get_grade"].calls, 100)
+        self.assertEqual(stats["TrafficLight.change_state"].calls, 1)
+        self.assertEqual(stats["TrafficLight.get_current_state"].calls, 1)
+        self.assertEqual(stats["divide"].calls, 1)
+        self.assertEqual(sum(stats["get_grade"].counts), 100)
+        self.assertGreater(stats["get_grade"].total_ns, 0)
+        self.assertNotIn("validate_url", stats)
+
+    def test_merges_threads(self):
+        """
+        Calls made in other threads are merged into the snapshot.
+        """
+
+        def work():
+            for _ in range(50):
+                wb.is_even(2)
+
+        with metrics.instrumented():
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            wb.is_even(3)
+        self.assertEqual(metrics.snapshot()["is_even"].calls, 201)
+
+    def test_percentile(self):
+        """
+        Percentiles are the highest duration of the bucket reached.
+        """
+        stats = metrics.CallStats("f")
+        for nanoseconds in [10] * 90 + [1000] * 10:
+            stats.calls += 1
+            stats.counts[metrics.bucket_index(nanoseconds)] += 1
+        self.assertEqual(stats.percentile(50), 10e-9)
+        self.assertEqual(stats.percentile(90), 10e-9)
+        highest = metrics.bucket_bounds(metrics.bucket_index(1000))[1]
+        self.assertEqual(stats.percentile(99), highest / 1e9)
+        self.assertEqual(metrics.CallStats("g").percentile(50), 0.0)
+
+    def test_exports(self):
+        """
+        Statistics are exported as JSON and in the Prometheus format.
+        """
+        with metrics.instrumented():
+            wb.verify_age(30)
+            wb.verify_age(10)
+        data = json.loads(metrics.to_json())
+        self.assertEqual(data["verify_age"]["calls"], 2)
+        self.assertEqual(sum(b[2] for b in data["verify_age"]["buckets"]), 2)
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE white_box_call_duration_seconds histogram", text)
+        self.assertIn(
+            'white_box_call_duration_seconds_bucket{function="verify_age",le="+Inf"} 2',
+            text,
+        )
+        self.assertIn(
+            'white_box_call_duration_seconds_count{function="verify_age"} 2', text
+        )
+        buckets = [
+            int(line.rsplit(" ", 1)[1])
+            for line in text.splitlines()
+            if line.startswith('white_box_call_duration_seconds_bucket{function="v')
+        ]
+        self.assertEqual(buckets, sorted(buckets))
+
+    def test_reset(self):
+        """
+        reset() clears the statistics.
+        """
+        with metrics.instrumented():
+            wb.is_even(1)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
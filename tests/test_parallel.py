@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the process-pool helpers.
+"""
+import unittest
+
+from src.parallel import batch_map, chunked
+from src.white_box import calculate_items_shipping_cost, grade_quiz, is_triangle
+
+
+class TestParallel(unittest.TestCase):
+    """
+    Process-pool helpers unittest class.
+    """
+
+    def test_chunked(self):
+        """
+        Checks items are grouped in order with a shorter last chunk.
+        """
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 3)), [])
+
+    def test_batch_map_preserves_order(self):
+        """
+        Checks results come back in input order, serially and in a pool.
+        """
+        args = [(c, i) for c in range(11) for i in range(5)]
+        expected = [grade_quiz(*a) for a in args]
+        for workers, chunksize in ((1, None), (2, 7), (2, None)):
+            self.assertEqual(
+                list(batch_map(grade_quiz, iter(args), workers, chunksize)), expected
+            )
+
+    def test_batch_map_exceptions(self):
+        """
+        Checks exceptions are raised in order or returned in place.
+        """
+        args = [
+            ([{"weight": 1}], "standard"),
+            ([{"weight": 1}], "drone"),
+            ([{"weight": 20}], "express"),
+        ]
+        results = list(
+            batch_map(calculate_items_shipping_cost, args, 2, 1, return_exceptions=True)
+        )
+        self.assertEqual(results[0], 10)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 40)
+
+        results = batch_map(calculate_items_shipping_cost, args, workers=1)
+        self.assertEqual(next(results), 10)
+        with self.assertRaises(ValueError):
+            next(results)
+
+    def test_batch_map_adaptive_chunks(self):
+        """
+        Checks adaptive chunk sizing handles many cheap calls.
+        """
+        args = [(3, 4, 5), (1, 2, 3)] * 5000
+        results = list(batch_map(is_triangle, args, workers=2))
+        self.assertEqual(len(results), 10000)
+        self.assertEqual(results[:2], [is_triangle(3, 4, 5), is_triangle(1, 2, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the rule tables.
+"""
+import itertools
+import json
+import math
+import unittest
+
+import numpy as np
+
+from src.rules import MAX_COMPARED_EDGES, RuleTable
+from src.tiers import TierTable
+from src.white_box import grade_quiz
+
+QUIZ_CONFIG = {
+    "inputs": ["correct_answers", "incorrect_answers"],
+    "rules": [
+        {
+            "when": {"correct_answers": {"min": 7}, "incorrect_answers": {"max": 2}},
+            "value": "Pass",
+        },
+        {
+            "when": {"correct_answers": {"min": 5}, "incorrect_answers": {"max": 3}},
+            "value": "Conditional Pass",
+        },
+    ],
+    "default": "Fail",
+}
+
+
+class TestRuleTable(unittest.TestCase):
+    """
+    Rule table unittest class.
+    """
+
+    def test_first_matching_rule_wins(self):
+        """
+        Checks overlapping rules resolve in order, on both sides of every
+        bound, for lookup and lookup_array.
+        """
+        table = RuleTable.from_config(json.loads(json.dumps(QUIZ_CONFIG)))
+        rows = list(
+            itertools.product(
+                [-1, 4, 4.5, 5, 6.9, 7, 7.1, math.inf, math.nan],
+                [-math.inf, 0, 2, 2.5, 3, 3.5, math.nan],
+            )
+        )
+        expected = [grade_quiz(*row) for row in rows]
+        self.assertEqual([table.lookup(*row) for row in rows], expected)
+        self.assertEqual(
+            table.lookup_array(*map(np.array, zip(*rows))).tolist(), expected
+        )
+
+    def test_bounds_and_nan(self):
+        """
+        Checks exclusive bounds, unbounded inputs and that NaN only matches
+        rules leaving its input unbounded.
+        """
+        table = RuleTable(
+            ["x", "y"],
+            [
+                {"when": {"x": {"above": 0, "below": 10}}, "value": "x inside"},
+                {"when": {"y": {"min": 0}}, "value": "y non-negative"},
+                {"value": "anything"},
+            ],
+        )
+        for row, value in (
+            ((0, -1), "anything"),
+            ((0.5, math.nan), "x inside"),
+            ((10, 0), "y non-negative"),
+            ((math.nan, 5), "y non-negative"),
+            ((math.nan, math.nan), "anything"),
+        ):
+            self.assertEqual(table.lookup(*row), value)
+            self.assertEqual(table.lookup_array(*row), value)
+
+    def test_codes_and_labels(self):
+        """
+        Checks codes index labels, the default value first, and that columns
+        broadcast.
+        """
+        table = RuleTable(
+            ["x", "y"], [{"when": {"x": {"min": 1}}, "value": 10}], default=0
+        )
+        self.assertEqual(table.values, [0, 10])
+        codes = table.codes(np.array([0, 1, 2]), np.array([[0], [5]]))
+        self.assertEqual(codes.tolist(), [[0, 1, 1], [0, 1, 1]])
+        self.assertEqual(table.labels[codes].tolist(), [[0, 10, 10], [0, 10, 10]])
+
+    def test_many_edges(self):
+        """
+        Checks inputs with more edges than MAX_COMPARED_EDGES, located with
+        numpy.searchsorted, give the same results as a tier table.
+        """
+        tiers = [
+            {"min": 10 * i, "below": 10 * i + 5, "value": f"tier {i}"}
+            for i in range(MAX_COMPARED_EDGES)
+        ]
+        table = RuleTable(
+            ["x", "y"],
+            [{"when": {"x": tier}, "value": tier["value"]} for tier in tiers],
+            default="none",
+        )
+        tier_table = TierTable(tiers, default="none")
+        xs = np.arange(-5, 10 * MAX_COMPARED_EDGES + 5, 2.5)
+        xs = np.append(xs, [np.nan, np.inf])
+        expected = [tier_table.lookup(x) for x in xs.tolist()]
+        self.assertEqual([table.lookup(x, 0) for x in xs.tolist()], expected)
+        self.assertEqual(table.lookup_array(xs, 0).tolist(), expected)
+
+    def test_invalid_rules(self):
+        """
+        Checks unknown keys or inputs, empty bounds and wrong arities raise.
+        """
+        for rules in (
+            [{"when": {"z": {"min": 1}}, "value": 1}],
+            [{"if": {"x": {"min": 1}}, "value": 1}],
+            [{"when": {"x": {"min": 1, "upper": 2}}, "value": 1}],
+            [{"when": {"x": {"min": 2, "max": 1}}, "value": 1}],
+        ):
+            with self.assertRaises(ValueError):
+                RuleTable(["x"], rules)
+        table = RuleTable(["x", "y"], [])
+        with self.assertRaises(TypeError):
+            table.lookup(1)
+        with self.assertRaises(TypeError):
+            table.codes([1], [2], [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the lazy imports of src.white_box.
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+import src.white_box
+from src import cache, dense, vectorized
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["asyncio", "calendar", "concurrent.futures", "numpy", "re"]
+
+
+class TestStartup(unittest.TestCase):
+    """
+    Unit tests for what importing src.white_box loads.
+    """
+
+    def test_import_loads_no_heavy_module(self):
+        """
+        Importing src.white_box does not load numpy and other slow modules.
+        """
+        code = (
+            "import sys\n"
+            "before = set(sys.modules)\n"
+            "import src.white_box\n"
+            "print('\\n'.join(set(sys.modules) - before))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=ROOT,
+            text=True,
+        )
+        loaded = set(result.stdout.split())
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, loaded)
+        self.assertNotIn("src.vectorized", loaded)
+
+    def test_lazy_attributes(self):
+        """
+        Batch functions are the objects of the modules defining them.
+        """
+        self.assertIs(src.white_box.validate_dates, vectorized.validate_dates)
+        self.assertIs(src.white_box.memoize, cache.memoize)
+        self.assertIs(src.white_box.dense_get_grade, dense.dense_get_grade)
+        self.assertIn("validate_dates", dir(src.white_box))
+
+    def test_lazy_labels(self):
+        """
+        Every label array of the batch functions is exported with them.
+        """
+        labels = [name for name in dir(vectorized) if name.endswith("_RESULTS")]
+        self.assertIn("DATE_RESULTS", labels)
+        for name in labels + ["NUMBER_STATUSES", "URL_SCHEMES"]:
+            self.assertIs(getattr(src.white_box, name), getattr(vectorized, name))
+        valid = src.white_box.validate_dates([2024], [2], [30], strict=True)
+        labels = src.white_box.to_labels(valid, src.white_box.DATE_RESULTS)
+        self.assertEqual(labels.tolist(), ["Invalid Date"])
+
+    def test_unknown_attribute(self):
+        """
+        Unknown attributes raise AttributeError.
+        """
+        with self.assertRaises(AttributeError):
+            src.white_box.no_such_function  # pylint: disable=pointless-statement
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the table-driven state machines.
+"""
+import unittest
+
+from src.state_machine import StateMachine, transition
+from src.white_box import ElevatorSystem, TrafficLight, VendingMachine
+
+
+class Turnstile(StateMachine):
+    """
+    Test machine with a self-transition.
+    """
+
+    __slots__ = ()
+
+    states = ("Locked", "Unlocked")
+    initial_state = "Locked"
+    transitions = {
+        "coin": {"Locked": ("Unlocked", "unlocked"), "Unlocked": ("Unlocked", "kept")},
+        "push": {"Unlocked": ("Locked", "locked")},
+    }
+    invalid_result = "blocked"
+
+    @transition
+    def push(self):
+        """
+        Pushes the turnstile arm.
+        """
+
+
+class TestStateMachine(unittest.TestCase):
+    """
+    State machine unittest class.
+    """
+
+    def test_transitions(self):
+        """
+        Checks results and states follow the transition table.
+        """
+        turnstile = Turnstile()
+        # pylint: disable=protected-access
+        self.assertEqual(turnstile.state, "Locked")
+        self.assertEqual(turnstile.push(), "blocked")
+        self.assertEqual(turnstile._fire("coin"), "unlocked")
+        self.assertEqual(turnstile._fire("coin"), "kept")
+        self.assertEqual(turnstile.push(), "locked")
+        self.assertEqual(Turnstile.push.__doc__.strip(), "Pushes the turnstile arm.")
+        self.assertEqual(turnstile.state, "Locked")
+
+    def test_state_setter(self):
+        """
+        Checks states can be set by name and unknown names are rejected.
+        """
+        elevator = ElevatorSystem()
+        elevator.state = "Moving Down"
+        self.assertEqual(elevator.stop(), "Elevator stopped")
+        with self.assertRaises(ValueError):
+            elevator.state = "Broken"
+        self.assertEqual(elevator.state, "Idle")
+
+    def test_slots(self):
+        """
+        Checks instances have no per-instance dict.
+        """
+        for machine in (VendingMachine(), TrafficLight(), Turnstile()):
+            self.assertFalse(hasattr(machine, "__dict__"))
+            with self.assertRaises(AttributeError):
+                machine.color = "blue"
+
+    def test_traffic_light_cycle(self):
+        """
+        Checks the traffic light cycles and returns None on each change.
+        """
+        light = TrafficLight()
+        seen = []
+        for _ in range(4):
+            self.assertIsNone(light.change_state())
+            seen.append(light.get_current_state())
+        self.assertEqual(seen, ["Green", "Yellow", "Red", "Green"])
+
+
+if __name__ == "__main__":
+    unittest.main()
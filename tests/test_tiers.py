@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the tier tables.
+"""
+import json
+import math
+import unittest
+
+from src.tiers import TierTable
+
+
+class TestTierTable(unittest.TestCase):
+    """
+    Tier table unittest class.
+    """
+
+    def test_lookup_bounds(self):
+        """
+        Checks inclusive and exclusive bounds on both sides of a tier.
+        """
+        table = TierTable(
+            [
+                {"below": 0, "value": "negative"},
+                {"min": 0, "max": 10, "value": "low"},
+                {"above": 10, "below": 20, "value": "mid"},
+                {"min": 20, "value": "high"},
+            ]
+        )
+        self.assertEqual(table.lookup(-0.5), "negative")
+        self.assertEqual(table.lookup(0), "low")
+        self.assertEqual(table.lookup(10), "low")
+        self.assertEqual(table.lookup(10.5), "mid")
+        self.assertEqual(table.lookup(20), "high")
+        self.assertEqual(table.lookup(math.inf), "high")
+
+    def test_lookup_gaps(self):
+        """
+        Checks numbers between tiers get the default value.
+        """
+        table = TierTable(
+            [
+                {"min": 51, "max": 100, "value": "B"},
+                {"min": 10, "max": 50, "value": "A"},
+                {"min": 7, "max": 7, "value": "seven"},
+            ],
+            default="D",
+        )
+        self.assertEqual(table.lookup(6.9), "D")
+        self.assertEqual(table.lookup(7), "seven")
+        self.assertEqual(table.lookup(50), "A")
+        self.assertEqual(table.lookup(50.5), "D")
+        self.assertEqual(table.lookup(51), "B")
+        self.assertEqual(table.lookup(100.5), "D")
+
+    def test_lookup_nan(self):
+        """
+        Checks NaN gets the nan value, falling back to the default.
+        """
+        tiers = [{"min": 0, "value": "positive"}]
+        self.assertEqual(TierTable(tiers, default="none").lookup(math.nan), "none")
+        self.assertEqual(TierTable(tiers, nan="unknown").lookup(math.nan), "unknown")
+
+    def test_from_config_nested(self):
+        """
+        Checks nested tables are built from configuration and looked up in turn.
+        """
+        config = json.loads(
+            """
+            {
+                "default": "No",
+                "tiers": [
+                    {
+                        "min": 1000,
+                        "value": {
+                            "tiers": [{"above": 600, "value": "Yes"}],
+                            "default": "Maybe"
+                        }
+                    }
+                ]
+            }
+            """
+        )
+        table = TierTable.from_config(config)
+        self.assertEqual(table.lookup(500, 700), "No")
+        self.assertEqual(table.lookup(1000, 600), "Maybe")
+        self.assertEqual(table.lookup(1000, 601), "Yes")
+
+    def test_invalid_tiers(self):
+        """
+        Checks overlapping, empty and malformed tiers are rejected.
+        """
+        invalid = [
+            [{"min": 0, "max": 10}, {"min": 10, "max": 20}],
+            [{"below": 5}, {"max": 1}],
+            [{"min": 0}, {"min": 100}],
+            [{"above": 5, "below": 5}],
+            [{"min": 0, "above": 0}],
+            [{"from": 0}],
+        ]
+        for tiers in invalid:
+            with self.assertRaises(ValueError):
+                TierTable(tiers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,497 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the NumPy batch versions of the white-box examples.
+"""
+import itertools
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.vectorized import (
+    AGE_RESULTS,
+    CARD_RESULTS,
+    DATE_RESULTS,
+    EMAIL_RESULTS,
+    FILE_SIZE_RESULTS,
+    LOAN_RESULTS,
+    NUMBER_STATUSES,
+    QUIZ_RESULTS,
+    TRIANGLE_RESULTS,
+    URL_RESULTS,
+    URL_SCHEMES,
+    WEATHER_RESULTS,
+    are_even,
+    are_triangles,
+    calculate_items_shipping_costs,
+    calculate_order_totals,
+    calculate_shipping_costs,
+    celsius_to_fahrenheits,
+    check_file_sizes,
+    check_loans_eligibility,
+    check_number_statuses,
+    classify_url_schemes,
+    convert_celsius_file,
+    divide_arrays,
+    get_weather_advisories,
+    grade_quizzes,
+    luhn_checks,
+    to_labels,
+    validate_credit_cards,
+    validate_dates,
+    validate_emails,
+    validate_urls,
+    verify_ages,
+)
+from src.white_box import (
+    calculate_items_shipping_cost,
+    calculate_order_total,
+    calculate_shipping_cost,
+    celsius_to_fahrenheit,
+    check_file_size,
+    check_loan_eligibility,
+    check_number_status,
+    divide,
+    get_weather_advisory,
+    grade_quiz,
+    is_even,
+    is_triangle,
+    validate_credit_card,
+    validate_date,
+    validate_email,
+    validate_url,
+    verify_age,
+)
+
+EDGE_INTS = [-(2**40), -7, -1, 0, 1, 2, 17, 18, 19, 64, 65, 66]
+EDGE_INTS += [1048575, 1048576, 1048577]
+EDGE_FLOATS = [-0.5, -0.0, 0.0, 0.5, 2.5, 4.0, 17.99, 18.0, 65.0, 65.01, 1048576.5]
+EDGE_FLOATS += [np.inf, -np.inf, np.nan]
+
+
+class TestVectorized(unittest.TestCase):  # pylint: disable=too-many-public-methods
+    """
+    Vectorized unittest class.
+    """
+
+    def test_calculate_order_totals_single_order(self):
+        """
+        Checks all lines belong to one order when no offsets are given.
+        """
+        quantities = [0, 1, 5, 6, 10, 11, 7.5]
+        prices = [3.0, 10.0, 2.5, 4.0, 1.5, 2.0, 9.0]
+        items = [{"quantity": q, "price": p} for q, p in zip(quantities, prices)]
+        totals = calculate_order_totals(quantities, prices)
+        self.assertEqual(totals.shape, (1,))
+        self.assertAlmostEqual(totals[0], calculate_order_total(items))
+
+    def test_calculate_order_totals_with_offsets(self):
+        """
+        Checks per-order totals, including empty orders, match the scalar version.
+        """
+        rng = np.random.default_rng(0)
+        quantities = rng.integers(0, 15, 200)
+        prices = rng.uniform(0.5, 100, 200).round(2)
+        offsets = np.array([0, 0, 17, 17, 90, 150, 200, 200])
+        totals = calculate_order_totals(quantities, prices, offsets)
+        for i, total in enumerate(totals):
+            start, end = offsets[i], offsets[i + 1]
+            items = [
+                {"quantity": q, "price": p}
+                for q, p in zip(quantities[start:end], prices[start:end])
+            ]
+            self.assertAlmostEqual(total, calculate_order_total(items))
+
+    def test_calculate_order_totals_structured(self):
+        """
+        Checks a structured array of order lines is accepted.
+        """
+        lines = np.array(
+            [(2, 10.0), (8, 10.0), (20, 10.0)],
+            dtype=[("quantity", np.int64), ("price", np.float64)],
+        )
+        totals = calculate_order_totals(lines, offsets=[0, 1, 3])
+        np.testing.assert_allclose(totals, [20.0, 76.0 + 180.0])
+
+    def test_calculate_order_totals_invalid_offsets(self):
+        """
+        Checks offsets that do not cover the lines are rejected.
+        """
+        with self.assertRaises(ValueError):
+            calculate_order_totals([1, 2], [1.0, 2.0], [0, 1])
+        with self.assertRaises(ValueError):
+            calculate_order_totals([1, 2], [1.0, 2.0], [0, 2, 1, 2])
+
+    def test_calculate_items_shipping_costs_matches_scalar(self):
+        """
+        Checks every weight tier and method matches the scalar version.
+        """
+        weights = [0, 5, 5.5, 10, 10.5, 50] * 2
+        methods = ["standard"] * 6 + ["express"] * 6
+        costs, invalid = calculate_items_shipping_costs(weights, methods)
+        expected = [
+            calculate_items_shipping_cost([{"weight": w}], m)
+            for w, m in zip(weights, methods)
+        ]
+        self.assertEqual(costs.tolist(), expected)
+        self.assertFalse(invalid.any())
+
+    def test_calculate_items_shipping_costs_invalid_method(self):
+        """
+        Checks invalid methods are masked in batches and raise for one order.
+        """
+        costs, invalid = calculate_items_shipping_costs(
+            [1, 2, 3, 4], ["standard", "overnight", "express", "standard"]
+        )
+        self.assertEqual(costs.tolist(), [10, 0, 20, 10])
+        self.assertEqual(invalid.tolist(), [False, True, False, False])
+        self.assertEqual(calculate_items_shipping_costs(12, "express"), 40)
+        with self.assertRaises(ValueError):
+            calculate_items_shipping_costs(3, "overnight")
+
+    def test_calculate_items_shipping_costs_with_offsets(self):
+        """
+        Checks item weights are summed per order when offsets are given.
+        """
+        costs, _ = calculate_items_shipping_costs(
+            [2, 3, 4, 4, 4, 1], "standard", offsets=[0, 2, 5, 5, 6]
+        )
+        self.assertEqual(costs.tolist(), [10, 20, 10, 10])
+
+    def test_calculate_shipping_costs_matches_scalar(self):
+        """
+        Checks small, medium and large packages match the scalar version.
+        """
+        packages = np.array(
+            [
+                (1, 10, 10, 10),
+                (1.5, 10, 10, 10),
+                (2, 11, 30, 20),
+                (5, 30, 30, 31),
+                (6, 20, 20, 20),
+                (0.5, 10.5, 5, 5),
+            ]
+        )
+        costs = calculate_shipping_costs(*packages.T)
+        self.assertEqual(
+            costs.tolist(), [calculate_shipping_cost(*row) for row in packages]
+        )
+        self.assertEqual(calculate_shipping_costs(3, 15, 15, 15), 10)
+
+    def test_numeric_predicates_match_scalar(self):
+        """
+        Checks the predicate kernels match the scalar functions on int and
+        float arrays, including edge values.
+        """
+        kernels = [
+            (are_even, None, is_even),
+            (check_number_statuses, NUMBER_STATUSES, check_number_status),
+            (verify_ages, AGE_RESULTS, verify_age),
+            (check_file_sizes, FILE_SIZE_RESULTS, check_file_size),
+        ]
+        arrays = [
+            np.array(EDGE_INTS, dtype=np.int64),
+            np.array(EDGE_INTS, dtype=np.float64),
+            np.array(EDGE_FLOATS),
+            np.array([0, 18, 65, 200], dtype=np.uint8),
+        ]
+        for kernel, labels, scalar in kernels:
+            for values in arrays:
+                results = kernel(values)
+                if labels is not None:
+                    results = to_labels(results, labels)
+                self.assertEqual(results.tolist(), [scalar(v) for v in values.tolist()])
+
+    def test_compact_results(self):
+        """
+        Checks the kernels return booleans or one-byte codes.
+        """
+        values = np.arange(-5, 5)
+        self.assertEqual(are_even(values).dtype, np.bool_)
+        self.assertEqual(verify_ages(values).dtype, np.bool_)
+        self.assertEqual(check_number_statuses(values).dtype, np.uint8)
+
+    def test_divide_arrays_matches_scalar(self):
+        """
+        Checks quotients and zero divisors match divide, without warnings.
+        """
+        a = np.array([10, 9, -5, 0, 1e308, np.inf, np.nan, 7, np.nan])
+        b = np.array([2, 0, 4, 0, 1e-10, np.inf, 3, -0.0, 0])
+        with np.errstate(all="raise"):
+            results = divide_arrays(a, b)
+        expected = [divide(x, y) for x, y in zip(a.tolist(), b.tolist())]
+        np.testing.assert_array_equal(results, expected)
+
+    def test_divide_arrays_out_and_policy(self):
+        """
+        Checks results go to the given buffer and NaN/inf are replaced.
+        """
+        out = np.full(4, -1.0)
+        result = divide_arrays(
+            [1, 0, -1, 6], [0, 0.0, 0.0, 3], out=out, zero_division=np.nan
+        )
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, [np.nan, np.nan, np.nan, 2])
+        divide_arrays([np.inf, -np.inf, 0, 1], [1, 1, 0, 2], out, nan=-1, posinf=9)
+        np.testing.assert_array_equal(out, [9, -np.inf, 0, 0.5])
+        divide_arrays([[1], [2]], [1, 2], np.empty((2, 2)))
+        with self.assertRaises(ValueError):
+            divide_arrays([1, 2], [1, 2], np.empty(3))
+
+    def test_celsius_to_fahrenheits_matches_scalar(self):
+        """
+        Checks temperatures and validity match the scalar conversion.
+        """
+        for celsius in (
+            np.array([-101, -100, -40, 0, 37, 100, 101]),
+            np.array([-100.5, -0.0, 36.6, 99.99, 100.0, np.nan], dtype=np.float32),
+        ):
+            temperatures, valid = celsius_to_fahrenheits(celsius)
+            self.assertEqual(temperatures.dtype, np.float64)
+            results = [
+                t if ok else "Invalid Temperature"
+                for t, ok in zip(temperatures.tolist(), valid.tolist())
+            ]
+            self.assertEqual(
+                results, [celsius_to_fahrenheit(c) for c in celsius.tolist()]
+            )
+
+        masked = celsius_to_fahrenheits([100, 150], masked=True)
+        self.assertEqual(masked.tolist(), [212.0, None])
+
+    def test_convert_celsius_file(self):
+        """
+        Checks a .npy file is converted chunk by chunk into new .npy files.
+        """
+        celsius = np.random.default_rng(0).uniform(-150, 150, (50, 7))
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"{n}.npy") for n in "cfm"]
+            np.save(paths[0], celsius)
+            count = convert_celsius_file(*paths, chunk_size=64)
+            temperatures, valid = (np.load(path) for path in paths[1:])
+        expected, expected_valid = celsius_to_fahrenheits(celsius)
+        np.testing.assert_array_equal(temperatures, expected)
+        np.testing.assert_array_equal(valid, expected_valid)
+        self.assertEqual(count, expected_valid.sum())
+
+    def test_string_validators_match_scalar(self):
+        """
+        Checks email and card results match the scalar validators for str,
+        StringDType and bytes arrays, empty ones included.
+        """
+        emails = ["a@b.c", "ab@cd", "abcd.e", "x" * 46 + "@a.b", "me@ex.com", ""]
+        cards = ["4111111111111111", "411111111111", "12345678901234567"]
+        cards += ["1234567890123a", "\u0661" * 13, "", "4012888888881881"]
+        for values, func, validator in (
+            (emails, validate_emails, validate_email),
+            (cards, validate_credit_cards, validate_credit_card),
+        ):
+            labels = EMAIL_RESULTS if func is validate_emails else CARD_RESULTS
+            expected = [validator(value) for value in values]
+            for array in (
+                np.array(values),
+                np.array(values, dtype=np.dtype("T")),
+                np.array(values, dtype=object),
+            ):
+                self.assertEqual(to_labels(func(array), labels).tolist(), expected)
+            for empty in ([], np.array([], dtype=str), np.array([], dtype="S")):
+                self.assertEqual(func(empty).tolist(), [])
+            ascii_values = [value for value in values if value.isascii()]
+            self.assertEqual(
+                func(np.array([value.encode() for value in ascii_values])).tolist(),
+                func(ascii_values).tolist(),
+            )
+
+    def test_luhn_checks(self):
+        """
+        Checks the Luhn checksum of card numbers, chunked or not.
+        """
+        numbers = ["79927398713", "79927398710", "4111111111111111", "0"]
+        numbers += ["4111 1111 1111 1111", "\u0667" * 11, "", "1" * 20 + "0"]
+        expected = [True, False, True, True, False, False, False, False]
+        self.assertEqual(luhn_checks(numbers).tolist(), expected)
+        self.assertEqual(
+            luhn_checks(np.array(numbers).reshape(2, 4), chunk_size=3).tolist(),
+            [expected[:4], expected[4:]],
+        )
+        self.assertEqual(
+            validate_credit_cards(
+                ["4111111111111111", "4111111111111112"], luhn=True
+            ).tolist(),
+            [True, False],
+        )
+
+    def test_validate_urls_matches_scalar(self):
+        """
+        Checks URL results match validate_url in both modes, for lists and
+        str, StringDType and bytes arrays, empty ones included.
+        """
+        urls = ["http://a.b", "https://a.b", "ftp://a.b", "http:/a", "HTTP://a", ""]
+        for scheme in ("http://", "https://"):
+            urls += [scheme + "a" * (255 - len(scheme) + extra) for extra in (0, 1)]
+        urls.append("http://" + "a" * 248 + "\0b")
+        for strict in (False, True):
+            expected = [validate_url(url, strict) for url in urls]
+            for array in (
+                urls,
+                np.array(urls),
+                np.array(urls)[::-1][::-1],
+                np.array(urls, dtype=np.dtype("T")),
+                np.array([url.encode() for url in urls]),
+            ):
+                self.assertEqual(
+                    to_labels(validate_urls(array, strict), URL_RESULTS).tolist(),
+                    expected,
+                )
+            for empty in ([], np.array([], dtype=str), np.array([], dtype="S")):
+                self.assertEqual(validate_urls(empty, strict).tolist(), [])
+
+    def test_classify_url_schemes(self):
+        """
+        Checks URL scheme codes and their names.
+        """
+        urls = np.array([["http://a", "https://a"], ["https:/a", "ftp://a"]])
+        codes = classify_url_schemes(urls)
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertEqual(
+            URL_SCHEMES[codes].tolist(), [["http", "https"], ["other", "other"]]
+        )
+
+    def test_validate_dates_matches_scalar(self):
+        """
+        Checks date results match validate_date in both modes for every
+        integer dtype, chunked or not.
+        """
+        rows = list(
+            itertools.product(
+                [0, 1899, 1900, 2000, 2023, 2024, 2100, 2101, 70000],
+                [-1, 0, 1, 2, 4, 12, 13],
+                [-1, 0, 1, 28, 29, 30, 31, 32],
+            )
+        )
+        for strict in (False, True):
+            for dtype in (np.int16, np.int32, np.int64, np.uint32):
+                with np.errstate(over="ignore"):
+                    columns = [np.array(c).astype(dtype) for c in zip(*rows)]
+                rows_as_dtype = zip(*(column.tolist() for column in columns))
+                expected = [validate_date(*r, strict=strict) for r in rows_as_dtype]
+                for chunk_size in (5, 1 << 15):
+                    valid = validate_dates(*columns, strict, chunk_size)
+                    self.assertEqual(to_labels(valid, DATE_RESULTS).tolist(), expected)
+
+    def test_validate_dates_broadcast_and_floats(self):
+        """
+        Checks columns broadcast, and that only loose mode takes floats.
+        """
+        self.assertEqual(
+            validate_dates(2024, [[2], [4]], [29, 31], strict=True).tolist(),
+            [[True, False], [True, False]],
+        )
+        self.assertEqual(validate_dates([2023.0], [2], [29.5]).tolist(), [True])
+        with self.assertRaises(TypeError):
+            validate_dates([2023.0], [2], [29], strict=True)
+
+    def test_validate_dates_empty_and_mixed_integers(self):
+        """
+        Checks empty columns and uint64 columns mixed with signed ones.
+        """
+        for strict in (False, True):
+            self.assertEqual(validate_dates([], [], [], strict).tolist(), [])
+            years = np.array([2024, 2024, 2**64 - 1], dtype=np.uint64)
+            months = np.array([2, 2, 2], dtype=np.int64)
+            days = np.array([29, -1, 1], dtype=np.int64)
+            self.assertEqual(
+                validate_dates(years, months, days, strict).tolist(),
+                [True, False, False],
+            )
+
+    def test_are_triangles_matches_scalar(self):
+        """
+        Checks triangle results match is_triangle, degenerate, infinite and
+        NaN sides included, for float64 and float32 sides.
+        """
+        values = [0, 1, 2, 3, 0.1, 0.2, 0.3, -1, np.inf, -np.inf, np.nan, 1e308]
+        sides = np.array(list(itertools.product(values, repeat=3)))
+        with np.errstate(over="ignore"):
+            arrays = (sides, sides.astype(np.float32))
+        for array in arrays:
+            with np.errstate(over="ignore", invalid="ignore"):
+                expected = [is_triangle(*row) for row in array]
+            for chunk_size in (7, 1 << 14):
+                valid = are_triangles(array, chunk_size=chunk_size)
+                self.assertEqual(to_labels(valid, TRIANGLE_RESULTS).tolist(), expected)
+        self.assertEqual(are_triangles([[1, 2, 3], [3, 4, 5]]).tolist(), [False, True])
+
+    def test_are_triangles_narrow_integers(self):
+        """
+        Checks integer sides whose sums overflow their dtype are still added
+        exactly.
+        """
+        for rows, dtype in (
+            ([[100, 100, 120], [1, 2, 127]], np.int8),
+            ([[200, 200, 200], [1, 2, 255]], np.uint8),
+            ([[2 * 10**9] * 3, [1, 2, 2 * 10**9]], np.int32),
+            ([[2**63 - 1] * 3, [1, 2, 2**62]], np.int64),
+        ):
+            sides = np.array(rows, dtype)
+            expected = [is_triangle(*row) for row in rows]
+            valid = are_triangles(sides)
+            self.assertEqual(to_labels(valid, TRIANGLE_RESULTS).tolist(), expected)
+
+    def test_are_triangles_out(self):
+        """
+        Checks results are written to out, which must have one value per row.
+        """
+        sides = np.array([[3.0, 4.0, 5.0], [1.0, 1.0, 2.0]])
+        out = np.empty(2, np.bool_)
+        self.assertIs(are_triangles(sides, out), out)
+        self.assertEqual(out.tolist(), [True, False])
+        with self.assertRaises(ValueError):
+            are_triangles(sides, np.empty(3, np.bool_))
+        with self.assertRaises(ValueError):
+            are_triangles(sides.T)
+
+    def test_rule_based_classifiers_match_scalar(self):
+        """
+        Checks quiz grades, weather advisories and loan eligibility match the
+        scalar functions around every threshold, NaN included.
+        """
+        for func, labels, scalar, xs, ys in (
+            (
+                grade_quizzes,
+                QUIZ_RESULTS,
+                grade_quiz,
+                [0, 4.5, 5, 6, 7, 8, np.nan],
+                [0, 2, 2.5, 3, 3.5, np.nan],
+            ),
+            (
+                get_weather_advisories,
+                WEATHER_RESULTS,
+                get_weather_advisory,
+                [-np.inf, -0.5, 0, 30, 30.5, np.inf, np.nan],
+                [0, 70, 70.5, np.nan],
+            ),
+            (
+                check_loans_eligibility,
+                LOAN_RESULTS,
+                check_loan_eligibility,
+                [0, 29999.5, 30000, 60000, 60000.5, np.nan],
+                [700, 700.5, 750, 750.5, np.nan],
+            ),
+        ):
+            rows = list(itertools.product(xs, ys))
+            columns = [np.array(column) for column in zip(*rows)]
+            self.assertEqual(
+                to_labels(func(*columns), labels).tolist(),
+                [scalar(*row) for row in rows],
+            )
+        self.assertEqual(
+            to_labels(grade_quizzes([8, 6, 1], [1, 3, 0]), QUIZ_RESULTS).tolist(),
+            ["Pass", "Conditional Pass", "Fail"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 """
 White-box unit testing examples.
 """
+import io
+import threading
 import unittest
+from contextlib import redirect_stdout
 from src.white_box import (
     is_even,
     divide,
@@ -9,6 +12,7 @@ from src.white_box import (
     is_triangle,
     check_number_status,
     validate_password,
+    validate_passwords,
     calculate_total_discount,
     calculate_order_total,
     calculate_items_shipping_cost,
@@ -162,6 +166,21 @@ class TestWhiteBox(unittest.TestCase):
         self.assertFalse(validate_password("pass"))
         self.assertFalse(validate_password("password"))
 
+    def test_validate_password_unicode_digit(self):
+        """
+        Checks non-ASCII decimal digits satisfy the digit rule.
+        """
+        self.assertTrue(validate_password("Passw\u0663rd!"))
+        self.assertFalse(validate_password("Password!"))
+
+    def test_validate_passwords_batch(self):
+        """
+        Checks the batch validator streams one result per password.
+        """
+        results = validate_passwords(iter(["Passw0rd!", "short", "password1!"]))
+        self.assertEqual(next(results), True)
+        self.assertEqual(list(results), [False, False])
+
     def test_calculate_total_discount_no_discount(self):
         """
         Checks if no discount is applied.
@@ -326,6 +345,28 @@ class TestWhiteBox(unittest.TestCase):
         self.assertEqual(validate_date(2023, 13, 15), "Invalid Date")
         self.assertEqual(validate_date(2023, 10, 32), "Invalid Date")
 
+    def test_validate_date_strict(self):
+        """
+        Checks strict mode checks the length of the month, leap years included.
+        """
+        self.assertEqual(validate_date(2023, 2, 29), "Valid Date")
+        self.assertEqual(validate_date(2023, 2, 29, strict=True), "Invalid Date")
+        self.assertEqual(validate_date(2024, 2, 29, strict=True), "Valid Date")
+        self.assertEqual(validate_date(2000, 2, 29, strict=True), "Valid Date")
+        self.assertEqual(validate_date(1900, 2, 29, strict=True), "Invalid Date")
+        self.assertEqual(validate_date(2023, 4, 31, strict=True), "Invalid Date")
+        self.assertEqual(validate_date(2023, 12, 31, strict=True), "Valid Date")
+
+    def test_validate_date_strict_floats(self):
+        """
+        Checks strict mode takes whole floats and rejects fractional ones.
+        """
+        self.assertEqual(validate_date(2024, 2.0, 29, strict=True), "Valid Date")
+        self.assertEqual(validate_date(2024.0, 2, 29.0, strict=True), "Valid Date")
+        self.assertEqual(validate_date(2024, 2.5, 29, strict=True), "Invalid Date")
+        self.assertEqual(validate_date(2024, 3, 1.5, strict=True), "Invalid Date")
+        self.assertEqual(validate_date(2024, 3, 1.5), "Valid Date")
+
     def test_check_flight_eligibility_eligible(self):
         """
         Checks if a passenger is eligible to book a flight.
@@ -354,6 +395,20 @@ class TestWhiteBox(unittest.TestCase):
         self.assertEqual(validate_url("ftp://example.com"), "Invalid URL")
         self.assertEqual(validate_url("example.com"), "Invalid URL")
 
+    def test_validate_url_length(self):
+        """
+        Checks the length limit, which only strict mode applies to https URLs.
+        """
+        path = "a" * 240
+        for url, compat, strict in (
+            ("http://example.com/" + path[:236], "Valid URL", "Valid URL"),
+            ("http://example.com/" + path[:237], "Invalid URL", "Invalid URL"),
+            ("https://example.com/" + path[:235], "Valid URL", "Valid URL"),
+            ("https://example.com/" + path, "Valid URL", "Invalid URL"),
+        ):
+            self.assertEqual(validate_url(url), compat)
+            self.assertEqual(validate_url(url, strict=True), strict)
+
     def test_calculate_quantity_discount_no_discount(self):
         """
         Checks if no discount is applied.
@@ -675,6 +730,58 @@ class TestWhiteBox(unittest.TestCase):
         bs = BankingSystem()
         self.assertFalse(bs.transfer_money("user123", "receiver", 100, "regular"))
 
+    def test_banking_system_transfer_money_balances(self):
+        """
+        Checks transfers move money between accounts and collect the fee.
+        """
+        bs = BankingSystem()
+        bs.authenticate("user123", "pass123")
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(bs.transfer_money("user123", "receiver", 500, "regular"))
+            self.assertTrue(bs.transfer_money("user123", "receiver", 400, "express"))
+            self.assertFalse(bs.transfer_money("user123", "receiver", 100, "express"))
+        self.assertAlmostEqual(bs.accounts["user123"].balance, 70)
+        self.assertEqual(bs.accounts["receiver"].balance, 1900)
+        self.assertAlmostEqual(bs.fees_collected, 30)
+
+    def test_banking_system_transfer_money_invalid_amount(self):
+        """
+        Checks transfers of non-positive amounts are rejected and move nothing.
+        """
+        bs = BankingSystem()
+        bs.authenticate("user123", "pass123")
+        with redirect_stdout(io.StringIO()) as output:
+            for amount in (-5000, 0, float("nan")):
+                self.assertFalse(
+                    bs.transfer_money("user123", "receiver", amount, "regular")
+                )
+        self.assertIn("Invalid transfer amount.", output.getvalue())
+        self.assertEqual(bs.accounts, {})
+        self.assertEqual(bs.fees_collected, 0)
+
+    def test_banking_system_concurrent_transfers(self):
+        """
+        Checks concurrent transfers between users conserve the money.
+        """
+        bs = BankingSystem()
+        users = [f"user{i}" for i in range(8)]
+        bs.logged_in_users.update(users)
+
+        def transfer(offset):
+            for i in range(200):
+                sender = users[(offset + i) % len(users)]
+                receiver = users[(offset + 3 * i + 1) % len(users)]
+                bs.transfer_money(sender, receiver, 10, "scheduled")
+
+        threads = [threading.Thread(target=transfer, args=(i,)) for i in range(8)]
+        with redirect_stdout(io.StringIO()):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        balances = sum(account.balance for account in bs.accounts.values())
+        self.assertAlmostEqual(balances + bs.fees_collected, 8 * 1000)
+
     def test_product_view(self):
         """
         Checks if the product details are displayed correctly.
@@ -711,6 +818,105 @@ class TestWhiteBox(unittest.TestCase):
         cart.add_product(product, 2)
         self.assertEqual(cart.checkout(), None)  
 
+    def test_shopping_cart_remove_whole_product(self):
+        """
+        Checks removing at least the held quantity drops the product.
+        """
+        cart = ShoppingCart()
+        laptop = Product("Laptop", 1000)
+        mouse = Product("Mouse", 25)
+        cart.add_product(laptop, 2)
+        cart.add_product(mouse)
+        cart.remove_product(laptop, 5)
+        cart.remove_product(Product("Laptop", 1000))
+        self.assertEqual([item["product"] for item in cart.items], [mouse])
+
+    def test_shopping_cart_checkout_total(self):
+        """
+        Checks the checkout total follows additions and removals.
+        """
+        cart = ShoppingCart()
+        laptop = Product("Laptop", 1000)
+        mouse = Product("Mouse", 25)
+        cart.add_product(laptop, 2)
+        cart.add_product(mouse, 3)
+        cart.add_product(laptop)
+        cart.remove_product(mouse, 2)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cart.checkout()
+        self.assertEqual(output.getvalue().splitlines()[0], "Total: $3025")
+
+    def test_shopping_cart_checkout_float_total(self):
+        """
+        Checks float prices are summed as the listed items, in cart order.
+        """
+        cart = ShoppingCart()
+        first = Product("First", 0.1)
+        cart.add_product(first)
+        cart.add_product(Product("Second", 0.2))
+        cart.remove_product(first)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cart.checkout()
+        self.assertEqual(output.getvalue().splitlines()[0], "Total: $0.2")
+
+    def test_shopping_cart_items_list(self):
+        """
+        Checks items is the cart content, changes to it included.
+        """
+        cart = ShoppingCart()
+        laptop = Product("Laptop", 1000)
+        mouse = Product("Mouse", 25)
+        cart.add_product(laptop)
+        cart.items.append({"product": mouse, "quantity": 1})
+        cart.add_product(mouse)
+        self.assertEqual(cart.items[1]["quantity"], 2)
+        cart.items.clear()
+        cart.add_product(laptop)
+        self.assertEqual(cart.items, [{"product": laptop, "quantity": 1}])
+
+        laptop.price = 900
+        cart.items = [{"product": mouse, "quantity": 2}]
+        cart.add_product(laptop)
+        cart.remove_product(mouse)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cart.checkout()
+        self.assertEqual(output.getvalue().splitlines()[0], "Total: $925")
+
+    def test_shopping_cart_duplicate_items(self):
+        """
+        Checks products listed twice are removed one item after the other.
+        """
+        cart = ShoppingCart()
+        laptop = Product("Laptop", 1000)
+        cart.items.extend({"product": laptop, "quantity": 1} for _ in range(2))
+        cart.remove_product(laptop)
+        cart.add_product(laptop)
+        self.assertEqual(cart.items, [{"product": laptop, "quantity": 2}])
+
+    def test_shopping_cart_items_positions(self):
+        """
+        Checks items changed by position are still found by product.
+        """
+        cart = ShoppingCart()
+        laptop = Product("Laptop", 1000)
+        mouse = Product("Mouse", 25)
+        screen = Product("Screen", 200)
+        cart.add_product(laptop)
+        cart.items.insert(0, {"product": mouse, "quantity": 1})
+        cart.items[1] = {"product": screen, "quantity": 1}
+        cart.add_product(mouse)
+        cart.add_product(screen)
+        cart.add_product(laptop)
+        self.assertEqual([item["quantity"] for item in cart.items], [2, 2, 1])
+        self.assertEqual(cart.items.pop(0)["product"], mouse)
+        del cart.items[-1]
+        cart.remove_product(mouse)
+        cart.remove_product(screen)
+        self.assertEqual(cart.items, [{"product": screen, "quantity": 1}])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file